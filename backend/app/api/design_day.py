@@ -2,7 +2,9 @@
 API routes for ASHRAE design day conditions.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from functools import lru_cache
+
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from app.config import UnitSystem
 from app.engine.design_day import search_locations, resolve_design_conditions
@@ -15,14 +17,13 @@ from app.models.design_day import (
 router = APIRouter(prefix="/api/v1", tags=["design-day"])
 
 
-@router.get("/design-days/search", response_model=list[DesignDaySearchResult])
-def search_design_day_locations(
-    q: str = Query("", description="Search query (city name or state)"),
-    limit: int = Query(20, ge=1, le=100),
-):
-    """Search for locations in the design day database."""
-    results = search_locations(q, limit=limit)
-    return [
+# The dataset is static for the life of the process, so search results are too
+_SEARCH_CACHE_CONTROL = "public, max-age=3600"
+
+
+@lru_cache(maxsize=256)
+def _search_cached(q: str, limit: int) -> tuple[DesignDaySearchResult, ...]:
+    return tuple(
         DesignDaySearchResult(
             name=loc["name"],
             state=loc["state"],
@@ -30,8 +31,19 @@ def search_design_day_locations(
             climate_zone=loc["climate_zone"],
             elevation_ft=loc["elevation_ft"],
         )
-        for loc in results
-    ]
+        for loc in search_locations(q, limit=limit)
+    )
+
+
+@router.get("/design-days/search", response_model=list[DesignDaySearchResult])
+def search_design_day_locations(
+    response: Response,
+    q: str = Query("", description="Search query (city name or state)"),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Search for locations in the design day database."""
+    response.headers["Cache-Control"] = _SEARCH_CACHE_CONTROL
+    return list(_search_cached(q, limit))
 
 
 @router.post("/design-days/resolve", response_model=DesignDayResolveOutput)
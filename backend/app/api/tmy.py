@@ -2,25 +2,58 @@
 API routes for weather data processing (TMY3 CSV and EPW files).
 """
 
+from typing import Literal
+
 from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+from fastapi.concurrency import run_in_threadpool
 
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
 from app.engine.tmy_processor import parse_tmy3, parse_epw
-from app.models.tmy import TMYProcessOutput
+from app.models.tmy import TMYProcessOutput, TMYScatterArrays
 
 router = APIRouter(prefix="/api/v1", tags=["tmy"])
 
 ALLOWED_EXTENSIONS = (".csv", ".epw")
 
 
+def _parse_upload(
+    text: str,
+    is_epw: bool,
+    unit_system: UnitSystem,
+    pressure: float,
+    columnar: bool = False,
+) -> TMYProcessOutput:
+    """
+    Parse an uploaded file into the response model. With columnar=True the
+    hours go out as scatter_arrays columns instead of one object per hour.
+    """
+    parse = parse_epw if is_epw else parse_tmy3
+    result = parse(
+        file_content=text,
+        unit_system=unit_system,
+        pressure=pressure,
+    )
+    if columnar:
+        result["scatter_arrays"] = TMYScatterArrays(
+            **{key: arr.tolist() for key, arr in result["arrays"].items()}
+        )
+        result["scatter_points"] = []
+    return TMYProcessOutput(**result)
+
+
 @router.post("/tmy/upload", response_model=TMYProcessOutput)
 async def upload_tmy_file(
     file: UploadFile = File(...),
     unit_system: UnitSystem = Query("IP"),
     pressure: float = Query(DEFAULT_PRESSURE_IP),
+    scatter_format: Literal["aos", "soa"] = Query("aos", alias="format"),
 ):
     """
     Upload a TMY3 CSV or EPW weather file and get processed scatter + heatmap data.
+
+    format=soa returns the hourly points as scatter_arrays columns, which
+    serialize much faster than per-hour objects for a full 8760-hour year.
+    Parsing runs in the threadpool, like the weather analysis route.
     """
     filename = (file.filename or "").lower()
     if not any(filename.endswith(ext) for ext in ALLOWED_EXTENSIONS):
@@ -36,19 +69,10 @@ async def upload_tmy_file(
         raise HTTPException(status_code=400, detail=f"Could not read file: {e}")
 
     try:
-        if filename.endswith(".epw"):
-            result = parse_epw(
-                file_content=text,
-                unit_system=unit_system,
-                pressure=pressure,
-            )
-        else:
-            result = parse_tmy3(
-                file_content=text,
-                unit_system=unit_system,
-                pressure=pressure,
-            )
-        return result
+        return await run_in_threadpool(
+            _parse_upload, text, filename.endswith(".epw"), unit_system, pressure,
+            columnar=scatter_format == "soa",
+        )
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
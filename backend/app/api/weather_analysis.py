@@ -2,7 +2,13 @@
 API routes for weather data analysis (EPW clustering + design point extraction).
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Query
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Literal
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query, Response
+from fastapi.concurrency import run_in_threadpool
 
 from app.config import UnitSystem
 from app.engine.weather_analysis.design_extractor import extract_design_conditions
@@ -10,16 +16,75 @@ from app.models.weather_analysis import WeatherAnalysisOutput
 
 router = APIRouter(prefix="/api/v1", tags=["weather-analysis"])
 
+# Serialized responses for recent analyses, keyed by (content digest,
+# n_clusters, unit_system, columnar). Only the digest is kept, never the
+# uploaded file.
+_CACHE_SIZE = 16
+_analysis_cache: OrderedDict[tuple[bytes, int, UnitSystem, bool], bytes] = OrderedDict()
+# Analyses run in the threadpool; guards cache reads and updates only,
+# never the analysis itself
+_cache_lock = threading.Lock()
+
+
+def _upload_digest(upload: BinaryIO) -> bytes:
+    """Content digest of an upload, hashed in chunks from its spooled file."""
+    upload.seek(0)
+    return hashlib.file_digest(upload, lambda: hashlib.blake2b(digest_size=16)).digest()
+
+
+def _analyze_cached(
+    digest: bytes,
+    upload: BinaryIO,
+    n_clusters: int,
+    unit_system: UnitSystem,
+    columnar: bool = False,
+) -> bytes:
+    """
+    Run the analysis pipeline once per (file content, n_clusters, unit_system,
+    layout) and return the response as JSON bytes; repeat uploads skip reading
+    the file body, parsing, clustering and serialization.
+    """
+    key = (digest, n_clusters, unit_system, columnar)
+    with _cache_lock:
+        if key in _analysis_cache:
+            _analysis_cache.move_to_end(key)
+            return _analysis_cache[key]
+
+    # Decode straight from the spooled file so the raw bytes are dropped
+    # before parsing starts
+    upload.seek(0)
+    result = extract_design_conditions(
+        epw_content=upload.read().decode("utf-8", errors="replace"),
+        n_clusters=n_clusters,
+        unit_system=unit_system,
+        columnar=columnar,
+    )
+    body = result.model_dump_json().encode()
+    with _cache_lock:
+        _analysis_cache[key] = body
+        if len(_analysis_cache) > _CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return body
+
 
 @router.post("/weather/analyze", response_model=WeatherAnalysisOutput)
 async def analyze_weather_file(
     file: UploadFile = File(...),
     n_clusters: int = Query(5, ge=2, le=10),
     unit_system: UnitSystem = Query("IP"),
+    chart_format: Literal["aos", "soa"] = Query("aos", alias="format"),
 ):
     """
     Upload an EPW weather file, cluster the hourly data, and extract
     extreme + cluster worst-case design condition points.
+
+    format=soa returns the hourly chart points as chart_arrays columns, which
+    serialize much faster than per-hour objects for a full 8760-hour year.
+
+    Hashing and the analysis run in the threadpool, so a CPU-bound
+    clustering pass does not block the event loop for other requests. The
+    weather pipeline is SI throughout and never touches psychrolib's
+    process-wide unit system.
     """
     filename = (file.filename or "").lower()
     if not filename.endswith(".epw"):
@@ -29,18 +94,16 @@ async def analyze_weather_file(
         )
 
     try:
-        content = await file.read()
-        text = content.decode("utf-8", errors="replace")
+        digest = await run_in_threadpool(_upload_digest, file.file)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Could not read file: {e}")
 
     try:
-        result = extract_design_conditions(
-            epw_content=text,
-            n_clusters=n_clusters,
-            unit_system=unit_system,
+        body = await run_in_threadpool(
+            _analyze_cached, digest, file.file, n_clusters, unit_system,
+            columnar=chart_format == "soa",
         )
-        return result
+        return Response(content=body, media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
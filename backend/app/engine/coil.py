@@ -18,12 +18,13 @@ from app.engine.processes.utils import (
     generate_path_points,
 )
 from app.models.coil import CoilInput, CoilOutput, CoilMode
-from app.models.process import PathPoint
+from app.models.state_point import StatePointOutput
 
 
 def analyze_coil(coil_input: CoilInput) -> CoilOutput:
     """Main entry point: dispatch to forward or reverse coil analysis."""
     ci = coil_input
+    ci.validate_for_solve()
 
     # Resolve the entering state
     entering = resolve_state_point(
@@ -44,14 +45,11 @@ def analyze_coil(coil_input: CoilInput) -> CoilOutput:
         raise ValueError(f"Unknown coil mode: {ci.mode}")
 
 
-def _forward_coil(ci: CoilInput, entering, warnings: list[str]) -> CoilOutput:
+def _forward_coil(
+    ci: CoilInput, entering: StatePointOutput, warnings: list[str]
+) -> CoilOutput:
     """Forward mode: ADP + BF → leaving state, loads, optional GPM."""
-    if ci.adp_Tdb is None or ci.bypass_factor is None:
-        raise ValueError("adp_Tdb and bypass_factor are required for forward mode")
-
     BF = ci.bypass_factor
-    if not (0.0 < BF < 1.0):
-        raise ValueError("bypass_factor must be between 0 and 1 (exclusive)")
 
     # Resolve ADP as a saturated state (100% RH)
     set_unit_system(ci.unit_system)
@@ -116,11 +114,10 @@ def _forward_coil(ci: CoilInput, entering, warnings: list[str]) -> CoilOutput:
     )
 
 
-def _reverse_coil(ci: CoilInput, entering, warnings: list[str]) -> CoilOutput:
+def _reverse_coil(
+    ci: CoilInput, entering: StatePointOutput, warnings: list[str]
+) -> CoilOutput:
     """Reverse mode: entering + leaving → ADP, BF, loads, optional GPM."""
-    if ci.leaving_pair is None or ci.leaving_values is None:
-        raise ValueError("leaving_pair and leaving_values are required for reverse mode")
-
     # Resolve the leaving state
     leaving = resolve_state_point(
         input_pair=ci.leaving_pair,
@@ -202,7 +199,12 @@ def _reverse_coil(ci: CoilInput, entering, warnings: list[str]) -> CoilOutput:
     )
 
 
-def _compute_loads(entering, leaving, unit_system: UnitSystem, airflow: float | None) -> dict:
+def _compute_loads(
+    entering: StatePointOutput,
+    leaving: StatePointOutput,
+    unit_system: UnitSystem,
+    airflow: float | None,
+) -> dict:
     """
     Compute sensible, latent, and total loads.
 
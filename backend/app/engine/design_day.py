@@ -1,12 +1,12 @@
 """
 ASHRAE Design Day conditions engine.
 
-Loads a curated JSON dataset of design day conditions by location,
-supports searching, and resolves conditions to full psychrometric state points.
+Loads a curated dataset of design day conditions by location (generated from
+app/data/design_days.json), supports searching, and resolves conditions to
+full psychrometric state points.
 """
 
-import json
-import os
+import copy
 from functools import lru_cache
 from typing import Optional
 
@@ -14,9 +14,6 @@ import psychrolib
 
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
 
-# Path to the bundled design day data
-_DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "design_days.json")
-
 # Human-readable labels for condition keys
 _CONDITION_LABELS = {
     "cooling_db_004": "0.4% Cooling DB / MCWB",
@@ -42,41 +39,98 @@ _CONDITION_CATEGORIES = {
 }
 
 
+def load_locations() -> tuple[dict, ...]:
+    """
+    Return the design day locations dataset.
+
+    The dataset is a Python literal generated from design_days.json by
+    scripts/gen_locations.py, so it loads from cached bytecode rather than
+    being parsed from JSON. It is shared by every caller; callers must not
+    mutate the location dicts.
+    """
+    from app.engine._locations_data import LOCATIONS
+
+    return LOCATIONS
+
+
+class _TrieNode:
+    """Node in the location substring trie."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode"] = {}
+        self.ids: list[int] = []  # locations whose "name, state" contains this prefix
+
+
 @lru_cache(maxsize=1)
-def load_locations() -> list[dict]:
-    """Load and cache the design day locations dataset."""
-    with open(_DATA_PATH, "r") as f:
-        return json.load(f)
+def _search_keys() -> tuple[tuple[str, str], ...]:
+    """Lowercased (name, state) for each location, aligned with load_locations()."""
+    return tuple((loc["name"].lower(), loc["state"].lower()) for loc in load_locations())
 
 
-def search_locations(query: str, limit: int = 20) -> list[dict]:
-    """
-    Search locations by city name or state, case-insensitive partial match.
-    Returns abbreviated results sorted by relevance (exact prefix first).
+@lru_cache(maxsize=1)
+def _search_index() -> _TrieNode:
     """
-    locations = load_locations()
-    query_lower = query.lower().strip()
-    if not query_lower:
-        return locations[:limit]
+    Build a trie over every suffix of each lowercased "name, state" string.
 
-    results = []
-    for loc in locations:
-        name_lower = loc["name"].lower()
-        state_lower = loc["state"].lower()
+    Walking the trie along a query lands on the node listing every location
+    whose search string contains the query, so a search costs O(len(query))
+    plus the number of matches instead of a scan over all locations.
+    """
+    root = _TrieNode()
+    for idx, (name_lower, state_lower) in enumerate(_search_keys()):
         full = f"{name_lower}, {state_lower}"
+        for start in range(len(full)):
+            node = root
+            for ch in full[start:]:
+                node = node.children.setdefault(ch, _TrieNode())
+                if not node.ids or node.ids[-1] != idx:
+                    node.ids.append(idx)
+    return root
+
+
+@lru_cache(maxsize=256)
+def _ranked_matches(query_lower: str) -> tuple[int, ...]:
+    """Indices of locations matching a normalized query, best match first."""
+    node = _search_index()
+    for ch in query_lower:
+        node = node.children.get(ch)
+        if node is None:
+            return ()
+
+    # Every candidate contains the query somewhere in "name, state";
+    # rank them by where it matched.
+    keys = _search_keys()
+    results = []
+    for idx in node.ids:
+        name_lower, state_lower = keys[idx]
 
         # Score: exact prefix match on name is best
         if name_lower.startswith(query_lower):
-            results.append((0, loc))
+            results.append((0, idx))
         elif query_lower in name_lower:
-            results.append((1, loc))
+            results.append((1, idx))
         elif state_lower == query_lower:
-            results.append((2, loc))
-        elif query_lower in full:
-            results.append((3, loc))
+            results.append((2, idx))
+        else:
+            results.append((3, idx))
 
     results.sort(key=lambda x: x[0])
-    return [r[1] for r in results[:limit]]
+    return tuple(r[1] for r in results)
+
+
+def search_locations(query: str, limit: int = 20) -> list[dict]:
+    """
+    Search locations by city name or state, case-insensitive partial match.
+    Returns abbreviated results sorted by relevance (exact prefix first).
+    """
+    locations = load_locations()
+    query_lower = query.lower().strip()
+    if not query_lower:
+        return list(locations[:limit])
+
+    return [locations[idx] for idx in _ranked_matches(query_lower)[:limit]]
 
 
 def _get_pressure_from_elevation(elevation_ft: float, unit_system: UnitSystem) -> float:
@@ -140,22 +194,52 @@ def resolve_design_conditions(
     Returns:
         dict with location info, resolved points, and pressure used.
     """
+    # Callers rely on psychrolib being left in unit_system; the cached body
+    # only sets it on a miss
+    if unit_system == "IP":
+        psychrolib.SetUnitSystem(psychrolib.IP)
+    else:
+        psychrolib.SetUnitSystem(psychrolib.SI)
+
+    # Normalize to a hashable key; label order doesn't affect the result
+    result = _resolve_cached(
+        location_name.lower().strip(),
+        location_state.lower().strip(),
+        tuple(sorted(set(condition_labels))),
+        unit_system,
+        pressure_override,
+    )
+    if result is None:
+        raise ValueError(f"Location '{location_name}' not found in design day database.")
+    return copy.deepcopy(result)
+
+
+@lru_cache(maxsize=128)
+def _resolve_cached(
+    name_lower: str,
+    state_lower: str,
+    condition_labels: tuple[str, ...],
+    unit_system: UnitSystem,
+    pressure_override: Optional[float],
+) -> Optional[dict]:
+    """
+    Cached body of resolve_design_conditions; None if the location is unknown.
+    Callers must not mutate the result.
+    """
     locations = load_locations()
 
     # Find the location
     location = None
-    name_lower = location_name.lower().strip()
-    state_lower = location_state.lower().strip()
 
-    for loc in locations:
-        if loc["name"].lower() == name_lower:
-            if state_lower and loc["state"].lower() != state_lower:
+    for loc, (loc_name, loc_state) in zip(locations, _search_keys()):
+        if loc_name == name_lower:
+            if state_lower and loc_state != state_lower:
                 continue
             location = loc
             break
 
     if location is None:
-        raise ValueError(f"Location '{location_name}' not found in design day database.")
+        return None
 
     # Determine pressure
     if pressure_override is not None:
@@ -26,6 +26,7 @@ from app.models.process import (
     ProcessType,
     CoolingDehumMode,
 )
+from app.models.state_point import StatePointOutput
 
 
 class CoolingDehumSolver(ProcessSolver):
@@ -33,21 +34,10 @@ class CoolingDehumSolver(ProcessSolver):
 
     def solve(self, process_input: ProcessInput) -> ProcessOutput:
         pi = process_input
+        self.validate(pi)
         mode = pi.cooling_dehum_mode
 
-        if mode is None:
-            raise ValueError(
-                "cooling_dehum_mode is required for cooling & dehumidification"
-            )
-
-        # Resolve the entering (start) state
-        start = resolve_state_point(
-            input_pair=pi.start_point_pair,
-            values=pi.start_point_values,
-            pressure=pi.pressure,
-            unit_system=pi.unit_system,
-            label="entering",
-        )
+        start = self._resolve_start(pi)
 
         warnings: list[str] = []
 
@@ -58,16 +48,77 @@ class CoolingDehumSolver(ProcessSolver):
         else:
             raise ValueError(f"Unknown cooling/dehum mode: {mode}")
 
-    def _solve_forward(self, pi, start, warnings):
-        """Forward mode: ADP + BF → leaving state."""
-        if pi.adp_Tdb is None or pi.bypass_factor is None:
+    @staticmethod
+    def validate(process_input: ProcessInput) -> None:
+        """
+        Check the cooling & dehumidification fields required by the selected
+        mode, without doing any psychrometric work.
+
+        Raises:
+            ValueError: If a required field is missing or out of range
+        """
+        pi = process_input
+        mode = pi.cooling_dehum_mode
+
+        if mode is None:
             raise ValueError(
-                "adp_Tdb and bypass_factor are required for forward mode"
+                "cooling_dehum_mode is required for cooling & dehumidification"
             )
 
+        if mode == CoolingDehumMode.FORWARD:
+            if pi.adp_Tdb is None or pi.bypass_factor is None:
+                raise ValueError(
+                    "adp_Tdb and bypass_factor are required for forward mode"
+                )
+            if not (0.0 < pi.bypass_factor < 1.0):
+                raise ValueError("bypass_factor must be between 0 and 1 (exclusive)")
+        elif mode == CoolingDehumMode.REVERSE:
+            if pi.leaving_Tdb is None or pi.leaving_RH is None:
+                raise ValueError(
+                    "leaving_Tdb and leaving_RH are required for reverse mode"
+                )
+
+    def round_trip_verify(
+        self, process_input: ProcessInput
+    ) -> tuple[ProcessOutput, ProcessOutput]:
+        """
+        Solve a forward-mode input, then feed its leaving state back through
+        reverse mode. Returns (forward, reverse).
+
+        Both solves share the same entering conditions, so the entering state
+        is resolved once and reused for the reverse pass.
+        """
+        pi = process_input
+        if pi.cooling_dehum_mode != CoolingDehumMode.FORWARD:
+            raise ValueError("round_trip_verify requires a forward-mode input")
+        self.validate(pi)
+
+        start = self._resolve_start(pi)
+        forward = self._solve_forward(pi, start, [])
+
+        reverse_input = pi.model_copy(update={
+            "cooling_dehum_mode": CoolingDehumMode.REVERSE,
+            "leaving_Tdb": forward.end_point["Tdb"],
+            "leaving_RH": forward.end_point["RH"],
+        })
+        reverse = self._solve_reverse(reverse_input, start, [])
+        return forward, reverse
+
+    def _resolve_start(self, pi: ProcessInput) -> StatePointOutput:
+        """Resolve the entering (start) state."""
+        return resolve_state_point(
+            input_pair=pi.start_point_pair,
+            values=pi.start_point_values,
+            pressure=pi.pressure,
+            unit_system=pi.unit_system,
+            label="entering",
+        )
+
+    def _solve_forward(
+        self, pi: ProcessInput, start: StatePointOutput, warnings: list[str]
+    ) -> ProcessOutput:
+        """Forward mode: ADP + BF → leaving state."""
         BF = pi.bypass_factor
-        if not (0.0 < BF < 1.0):
-            raise ValueError("bypass_factor must be between 0 and 1 (exclusive)")
 
         # Resolve ADP as a saturated state (100% RH)
         set_unit_system(pi.unit_system)
@@ -141,13 +192,10 @@ class CoolingDehumSolver(ProcessSolver):
             warnings=warnings,
         )
 
-    def _solve_reverse(self, pi, start, warnings):
+    def _solve_reverse(
+        self, pi: ProcessInput, start: StatePointOutput, warnings: list[str]
+    ) -> ProcessOutput:
         """Reverse mode: entering + leaving → ADP + BF."""
-        if pi.leaving_Tdb is None or pi.leaving_RH is None:
-            raise ValueError(
-                "leaving_Tdb and leaving_RH are required for reverse mode"
-            )
-
         # Resolve the leaving state
         end = resolve_state_point(
             input_pair=("Tdb", "RH"),
@@ -19,6 +19,9 @@ Indirect-direct two-stage (IDEC):
     Each stage has its own effectiveness.
 """
 
+from typing import Optional
+
+import numpy as np
 import psychrolib
 
 from app.config import UnitSystem, GRAINS_PER_LB
@@ -30,6 +33,7 @@ from app.models.process import (
     ProcessType,
     PathPoint,
 )
+from app.models.state_point import StatePointOutput
 
 
 def _set_unit_system(unit_system: UnitSystem) -> None:
@@ -99,21 +103,53 @@ class DirectEvaporativeSolver(ProcessSolver):
 
     def solve(self, process_input: ProcessInput) -> ProcessOutput:
         pi = process_input
+        self._check_effectiveness(pi.effectiveness)
 
-        if pi.effectiveness is None:
+        start = self._resolve_start(pi)
+        eff = pi.effectiveness
+        end_Tdb = start.Tdb - eff * (start.Tdb - start.Twb)
+        return self._solve_from_start(pi, start, eff, end_Tdb)
+
+    def solve_many(
+        self, process_input: ProcessInput, effectiveness_values
+    ) -> list[ProcessOutput]:
+        """
+        Solve one entering state at several effectiveness values.
+
+        The start state is resolved once and all leaving dry-bulbs are blended
+        in one array operation; only the end state and path are per value.
+        process_input.effectiveness is ignored.
+
+        Returns:
+            One ProcessOutput per effectiveness value, in the same order.
+        """
+        pi = process_input
+        eff_values = np.asarray(effectiveness_values, dtype=np.float64)
+        for eff in eff_values:
+            self._check_effectiveness(float(eff))
+
+        start = self._resolve_start(pi)
+        end_Tdbs = start.Tdb - eff_values * (start.Tdb - start.Twb)
+        return [
+            self._solve_from_start(pi, start, float(eff), float(end_Tdb))
+            for eff, end_Tdb in zip(eff_values, end_Tdbs)
+        ]
+
+    @staticmethod
+    def _check_effectiveness(eff: Optional[float]) -> None:
+        if eff is None:
             raise ValueError(
                 "effectiveness is required for direct evaporative cooling"
             )
-
-        eff = pi.effectiveness
         if eff < 0 or eff > 1:
             raise ValueError(
                 f"effectiveness must be between 0 and 1, got {eff}"
             )
 
+    @staticmethod
+    def _resolve_start(pi: ProcessInput) -> StatePointOutput:
         _set_unit_system(pi.unit_system)
-
-        start = resolve_state_point(
+        return resolve_state_point(
             input_pair=pi.start_point_pair,
             values=pi.start_point_values,
             pressure=pi.pressure,
@@ -121,13 +157,16 @@ class DirectEvaporativeSolver(ProcessSolver):
             label="start",
         )
 
+    @staticmethod
+    def _solve_from_start(
+        pi: ProcessInput, start: StatePointOutput, eff: float, end_Tdb: float
+    ) -> ProcessOutput:
+        """Build the output for one effectiveness from a resolved start state."""
         warnings: list[str] = []
         Twb = start.Twb
 
-        # End Tdb via effectiveness
-        end_Tdb = start.Tdb - eff * (start.Tdb - Twb)
-
         # End W along constant Twb
+        _set_unit_system(pi.unit_system)
         end_W = psychrolib.GetHumRatioFromTWetBulb(end_Tdb, Twb, pi.pressure)
         end = resolve_state_point(
             input_pair=("Tdb", "W"),
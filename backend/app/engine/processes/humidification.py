@@ -16,12 +16,15 @@ Heated water spray humidification:
     When water_temp >> Tdb, both Tdb and W increase (steam-like but not vertical).
 """
 
+import numpy as np
 import psychrolib
 from scipy.optimize import brentq
 
 from app.config import UnitSystem, GRAINS_PER_LB
 from app.engine.state_resolver import resolve_state_point
 from app.engine.processes.base import ProcessSolver
+from app.engine.processes.utils import hum_ratio_array
+from app.models.state_point import StatePointOutput
 from app.models.process import (
     ProcessInput,
     ProcessOutput,
@@ -46,6 +49,17 @@ def _w_display(W: float, unit_system: UnitSystem) -> float:
         return round(W * 1000.0, 4)
 
 
+def _resolve_start(pi: ProcessInput) -> StatePointOutput:
+    """Resolve the entering state of a humidification process."""
+    return resolve_state_point(
+        input_pair=pi.start_point_pair,
+        values=pi.start_point_values,
+        pressure=pi.pressure,
+        unit_system=pi.unit_system,
+        label="start",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Steam humidification — constant Tdb (vertical line)
 # ---------------------------------------------------------------------------
@@ -54,6 +68,49 @@ class SteamHumidificationSolver(ProcessSolver):
     """Solver for steam humidification (constant dry-bulb temperature)."""
 
     def solve(self, process_input: ProcessInput) -> ProcessOutput:
+        return self.solve_from_state(_resolve_start(process_input), process_input)
+
+    def solve_batch(
+        self,
+        Tdb: np.ndarray,
+        pressure: float,
+        unit_system: UnitSystem,
+        mode: HumidificationMode,
+        targets: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Leaving states for a batch of starts at dry-bulb Tdb sharing one pressure.
+
+        targets holds target RH (%) or target W per start, depending on mode.
+        Steam leaves at the entering Tdb and the target sets W, so the
+        entering humidity does not enter the result. Only the leaving Tdb/W
+        are computed, in one array pass; use solve() for the full state
+        points, path and metadata.
+
+        Returns:
+            (end_Tdb, end_W) arrays.
+        """
+        Tdb = np.asarray(Tdb, dtype=np.float64)
+        targets = np.asarray(targets, dtype=np.float64)
+        if mode == HumidificationMode.TARGET_RH:
+            if np.any((targets <= 0) | (targets > 100)):
+                raise ValueError("target_RH must be between 0 and 100")
+            end_W = hum_ratio_array(Tdb, targets, pressure, unit_system)
+        elif mode == HumidificationMode.TARGET_W:
+            if np.any(targets < 0):
+                raise ValueError("target_W must be non-negative")
+            end_W = np.broadcast_to(targets, np.broadcast(Tdb, targets).shape).copy()
+        else:
+            raise ValueError(
+                f"Unsupported humidification_mode '{mode}' for steam humidification. "
+                f"Use 'target_rh' or 'target_w'."
+            )
+        return np.broadcast_to(Tdb, end_W.shape).copy(), end_W
+
+    def solve_from_state(
+        self, start: StatePointOutput, process_input: ProcessInput
+    ) -> ProcessOutput:
+        """Solve from an already-resolved start state; start_point_* is ignored."""
         pi = process_input
         mode = pi.humidification_mode
         if mode is None:
@@ -63,15 +120,6 @@ class SteamHumidificationSolver(ProcessSolver):
 
         _set_unit_system(pi.unit_system)
 
-        # Resolve start state
-        start = resolve_state_point(
-            input_pair=pi.start_point_pair,
-            values=pi.start_point_values,
-            pressure=pi.pressure,
-            unit_system=pi.unit_system,
-            label="start",
-        )
-
         warnings: list[str] = []
 
         # Determine end humidity ratio
@@ -166,6 +214,12 @@ class AdiabaticHumidificationSolver(ProcessSolver):
     """Solver for adiabatic humidification (constant wet-bulb temperature)."""
 
     def solve(self, process_input: ProcessInput) -> ProcessOutput:
+        return self.solve_from_state(_resolve_start(process_input), process_input)
+
+    def solve_from_state(
+        self, start: StatePointOutput, process_input: ProcessInput
+    ) -> ProcessOutput:
+        """Solve from an already-resolved start state; start_point_* is ignored."""
         pi = process_input
         mode = pi.humidification_mode
         if mode is None:
@@ -175,15 +229,6 @@ class AdiabaticHumidificationSolver(ProcessSolver):
 
         _set_unit_system(pi.unit_system)
 
-        # Resolve start state
-        start = resolve_state_point(
-            input_pair=pi.start_point_pair,
-            values=pi.start_point_values,
-            pressure=pi.pressure,
-            unit_system=pi.unit_system,
-            label="start",
-        )
-
         warnings: list[str] = []
         Twb = start.Twb
 
@@ -301,6 +346,43 @@ class HeatedWaterHumidificationSolver(ProcessSolver):
     """
 
     def solve(self, process_input: ProcessInput) -> ProcessOutput:
+        return self.solve_from_state(_resolve_start(process_input), process_input)
+
+    def solve_batch(
+        self,
+        Tdb: np.ndarray,
+        RH: np.ndarray,
+        pressure: float,
+        unit_system: UnitSystem,
+        effectiveness: np.ndarray,
+        water_temperature: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Leaving states for a batch of (Tdb, RH) starts sharing one pressure.
+
+        Each start is blended toward saturation at its water temperature in
+        one array pass; use solve() for the full state points, path and
+        metadata.
+
+        Returns:
+            (end_Tdb, end_W) arrays.
+        """
+        Tdb = np.asarray(Tdb, dtype=np.float64)
+        eff = np.asarray(effectiveness, dtype=np.float64)
+        T_water = np.asarray(water_temperature, dtype=np.float64)
+        if np.any((eff < 0) | (eff > 1)):
+            raise ValueError("effectiveness must be between 0 and 1")
+
+        W = hum_ratio_array(Tdb, RH, pressure, unit_system)
+        W_sat = hum_ratio_array(T_water, 100.0, pressure, unit_system)
+        end_Tdb = Tdb + eff * (T_water - Tdb)
+        end_W = W + eff * (W_sat - W)
+        return end_Tdb, end_W
+
+    def solve_from_state(
+        self, start: StatePointOutput, process_input: ProcessInput
+    ) -> ProcessOutput:
+        """Solve from an already-resolved start state; start_point_* is ignored."""
         pi = process_input
 
         if pi.effectiveness is None:
@@ -320,15 +402,6 @@ class HeatedWaterHumidificationSolver(ProcessSolver):
 
         _set_unit_system(pi.unit_system)
 
-        # Resolve start state
-        start = resolve_state_point(
-            input_pair=pi.start_point_pair,
-            values=pi.start_point_values,
-            pressure=pi.pressure,
-            unit_system=pi.unit_system,
-            label="start",
-        )
-
         # Saturation state at the water temperature
         sat_water = resolve_state_point(
             input_pair=("Tdb", "RH"),
@@ -55,6 +55,33 @@ def _generate_path_points(
     return points
 
 
+def _compute_mix(
+    W_1: float, h_1: float,
+    W_2: float, h_2: float,
+    f: float,
+    unit_system: UnitSystem,
+) -> tuple[float, float, float]:
+    """
+    Lever-rule core: mass-weighted W and h, and the Tdb they imply.
+
+    Pure arithmetic with the dry-bulb from ASHRAE Fundamentals (2017) ch. 1
+    eqn 30 inlined (as psychrolib.GetTDryBulbFromEnthalpyAndHumRatio), so it
+    needs no psychrolib unit-system state.
+
+    Returns:
+        (Tdb_mix, W_mix, h_mix)
+    """
+    W_mix = f * W_1 + (1.0 - f) * W_2
+    h_mix = f * h_1 + (1.0 - f) * h_2
+
+    W_b = max(W_mix, 1e-7)
+    if unit_system == UnitSystem.IP:
+        Tdb_mix = (h_mix - 1061.0 * W_b) / (0.240 + 0.444 * W_b)
+    else:
+        Tdb_mix = (h_mix / 1000.0 - 2501.0 * W_b) / (1.006 + 1.86 * W_b)
+    return Tdb_mix, W_mix, h_mix
+
+
 class MixingSolver(ProcessSolver):
     """Solver for adiabatic mixing of two airstreams."""
 
@@ -105,12 +132,10 @@ class MixingSolver(ProcessSolver):
             label="stream_2",
         )
 
-        # --- Mass-weighted averages ---
-        W_mix = f * stream1.W + (1.0 - f) * stream2.W
-        h_mix = f * stream1.h + (1.0 - f) * stream2.h
-
-        # --- Back-calculate Tdb from h and W (algebraic, not iterative) ---
-        Tdb_mix = psychrolib.GetTDryBulbFromEnthalpyAndHumRatio(h_mix, W_mix)
+        # --- Mass-weighted averages; Tdb back-calculated from h and W ---
+        Tdb_mix, W_mix, h_mix = _compute_mix(
+            stream1.W, stream1.h, stream2.W, stream2.h, f, pi.unit_system,
+        )
 
         # --- Resolve full mixed state ---
         mixed = resolve_state_point(
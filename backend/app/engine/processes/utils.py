@@ -5,6 +5,11 @@ These functions are used by multiple solvers (cooling_dehum, coil analysis, SHR)
 and are extracted here to avoid duplication.
 """
 
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
 import psychrolib
 from scipy.optimize import brentq
 
@@ -28,6 +33,43 @@ def w_display(W: float, unit_system: UnitSystem) -> float:
         return round(W * 1000.0, 4)
 
 
+# adp_newton stops once every step is below _ADP_NEWTON_XTOL (°, matching
+# find_adp's brentq) and gives up after _ADP_NEWTON_MAX_ITERS steps
+_ADP_NEWTON_XTOL = 1e-8
+_ADP_NEWTON_MAX_ITERS = 50
+
+# dew_point_array stops once every Newton step is below this (°)
+_DEW_POINT_XTOL = 1e-10
+_DEW_POINT_MAX_ITERS = 50
+
+# Bisection steps in wet_bulb_array; shrinks a 100° dew-point-to-dry-bulb
+# bracket below 1e-10°
+_WET_BULB_BISECT_ITERS = 40
+
+
+class PressureCtx(NamedTuple):
+    """Pressure-dependent constants shared by every ADP search at one pressure."""
+    Tdb_min: float    # lower end of the ADP search bracket (chart minimum)
+    W_sat_min: float  # saturation humidity ratio at Tdb_min
+
+
+@lru_cache(maxsize=4)
+def _pressure_ctx(pressure: float, unit_system: UnitSystem) -> PressureCtx:
+    """
+    Precompute the saturation state at the bottom of the ADP search bracket.
+
+    Only a handful of distinct pressures are seen in practice (typically the
+    IP and SI defaults), so the cache is warm after the first solve in each.
+    Uses the unit-explicit sat_hum_ratio_array rather than psychrolib, so the
+    cached body neither depends on nor changes psychrolib's unit system.
+    """
+    Tdb_min = CHART_RANGES[unit_system.value]["Tdb_min"]
+    return PressureCtx(
+        Tdb_min=Tdb_min,
+        W_sat_min=float(sat_hum_ratio_array(Tdb_min, pressure, unit_system)),
+    )
+
+
 def find_adp(
     entering_Tdb: float,
     entering_W: float,
@@ -62,12 +104,12 @@ def find_adp(
         return W_sat - W_on_line
 
     # Search domain: from chart minimum up to the leaving Tdb
-    ranges = CHART_RANGES[unit_system.value]
-    Tdb_min = ranges["Tdb_min"]
+    ctx = _pressure_ctx(pressure, unit_system)
+    Tdb_min = ctx.Tdb_min
     Tdb_max = leaving_Tdb
 
     # Verify that the objective changes sign in the search interval
-    f_min = objective(Tdb_min)
+    f_min = ctx.W_sat_min - (entering_W + slope * (Tdb_min - entering_Tdb))
     f_max = objective(Tdb_max)
 
     if f_min * f_max > 0:
@@ -80,6 +122,256 @@ def find_adp(
     return adp_Tdb
 
 
+# ASHRAE Handbook - Fundamentals (2017) ch. 1 eqns 5 & 6 coefficients
+# (ice, liquid water) and triple point, per unit system
+_SAT_VAP_PRES_COEFFS = {
+    UnitSystem.IP: (
+        (-1.0214165E+04, -4.8932428, -5.3765794E-03, 1.9202377E-07,
+         3.5575832E-10, -9.0344688E-14, 4.1635019),
+        (-1.0440397E+04, -1.1294650E+01, -2.7022355E-02, 1.2890360E-05,
+         -2.4780681E-09, 0.0, 6.5459673),
+        32.018,
+        459.67,
+    ),
+    UnitSystem.SI: (
+        (-5.6745359E+03, 6.3925247, -9.677843E-03, 6.2215701E-07,
+         2.0747825E-09, -9.484024E-13, 4.1635019),
+        (-5.8002206E+03, 1.3914993, -4.8640239E-02, 4.1764768E-05,
+         -1.4452093E-08, 0.0, 6.5459673),
+        0.01,
+        273.15,
+    ),
+}
+
+
+def ln_sat_vap_pres(
+    Tdb: float | np.ndarray, unit_system: UnitSystem
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    Natural log of saturation vapor pressure and its derivative d(ln Pws)/dTdb.
+
+    ASHRAE Handbook - Fundamentals (2017) ch. 1 eqns 5 & 6, the same
+    correlation psychrolib uses, split at the triple point. A Python float
+    takes a math-module path returning floats, which the scalar Newton
+    solves call once per iteration; arrays are evaluated elementwise.
+    """
+    c_ice, c_water, triple_point, offset = _SAT_VAP_PRES_COEFFS[unit_system]
+    T = Tdb + offset
+
+    if isinstance(Tdb, (int, float)):
+        c1, c2, c3, c4, c5, c6, c7 = c_ice if Tdb <= triple_point else c_water
+        log_T = math.log(T)
+    else:
+        c = np.where(np.asarray(Tdb <= triple_point)[..., None], c_ice, c_water)
+        c1, c2, c3, c4, c5, c6, c7 = np.moveaxis(c, -1, 0)
+        log_T = np.log(T)
+    ln_p = c1 / T + c2 + c3 * T + c4 * T**2 + c5 * T**3 + c6 * T**4 + c7 * log_T
+    d_ln_p = -c1 / T**2 + c3 + 2 * c4 * T + 3 * c5 * T**2 + 4 * c6 * T**3 + c7 / T
+    return ln_p, d_ln_p
+
+
+def sat_vap_pres_array(Tdb: np.ndarray, unit_system: UnitSystem) -> np.ndarray:
+    """Vectorized equivalent of psychrolib.GetSatVapPres over an array of Tdb."""
+    return np.exp(ln_sat_vap_pres(np.asarray(Tdb, dtype=np.float64), unit_system)[0])
+
+
+def sat_hum_ratio_array(
+    Tdb: np.ndarray, pressure: float, unit_system: UnitSystem
+) -> np.ndarray:
+    """Vectorized equivalent of psychrolib.GetSatHumRatio over an array of Tdb."""
+    Pws = sat_vap_pres_array(Tdb, unit_system)
+    W_sat = 0.621945 * Pws / (pressure - Pws)
+    return np.maximum(W_sat, 1e-7)
+
+
+def hum_ratio_array(
+    Tdb: np.ndarray, RH: np.ndarray, pressure: float, unit_system: UnitSystem
+) -> np.ndarray:
+    """
+    Vectorized equivalent of psychrolib.GetHumRatioFromRelHum.
+
+    RH is in percent (0-100), matching the API inputs.
+    """
+    Tdb = np.asarray(Tdb, dtype=np.float64)
+    Pws = np.exp(ln_sat_vap_pres(Tdb, unit_system)[0])
+    Pv = np.asarray(RH, dtype=np.float64) / 100.0 * Pws
+    return np.maximum(0.621945 * Pv / (pressure - Pv), 1e-7)
+
+
+def dew_point_array(
+    Tdb: np.ndarray, W: np.ndarray, pressure: float | np.ndarray, unit_system: UnitSystem
+) -> np.ndarray:
+    """
+    Vectorized equivalent of psychrolib.GetTDewPointFromHumRatio.
+
+    Newton on ln Pws from the dry-bulb. ln Pws is increasing and concave in
+    Tdb, so after the first step the iterates climb monotonically to the
+    root. Like psychrolib, the result is capped at the dry-bulb.
+
+    Raises:
+        ValueError: If any row has not converged after _DEW_POINT_MAX_ITERS
+            steps
+    """
+    Tdb = np.asarray(Tdb, dtype=np.float64)
+    W = np.maximum(np.asarray(W, dtype=np.float64), 1e-7)
+    ln_Pv = np.log(pressure * W / (0.621945 + W))
+    Tdp = Tdb
+    for _ in range(_DEW_POINT_MAX_ITERS):
+        ln_p, d_ln_p = ln_sat_vap_pres(Tdp, unit_system)
+        step = (ln_p - ln_Pv) / d_ln_p
+        Tdp = Tdp - step
+        if np.all(np.abs(step) < _DEW_POINT_XTOL):
+            return np.minimum(Tdp, Tdb)
+
+    raise ValueError(
+        f"Dew point iteration did not converge in {_DEW_POINT_MAX_ITERS} steps"
+    )
+
+
+def hum_ratio_from_wet_bulb_array(
+    Tdb: np.ndarray,
+    Twb: np.ndarray,
+    pressure: float | np.ndarray,
+    unit_system: UnitSystem,
+) -> np.ndarray:
+    """
+    Vectorized equivalent of psychrolib.GetHumRatioFromTWetBulb.
+
+    ASHRAE Handbook - Fundamentals (2017) ch. 1 eqns 33 & 35, split at the
+    freezing point of the wet-bulb. pressure may be a scalar or an array.
+    """
+    Tdb = np.asarray(Tdb, dtype=np.float64)
+    Twb = np.asarray(Twb, dtype=np.float64)
+    Ws_star = sat_hum_ratio_array(Twb, pressure, unit_system)
+    if unit_system == UnitSystem.IP:
+        W = np.where(
+            Twb >= 32.0,
+            ((1093.0 - 0.556 * Twb) * Ws_star - 0.240 * (Tdb - Twb))
+            / (1093.0 + 0.444 * Tdb - Twb),
+            ((1220.0 - 0.04 * Twb) * Ws_star - 0.240 * (Tdb - Twb))
+            / (1220.0 + 0.444 * Tdb - 0.48 * Twb),
+        )
+    else:
+        W = np.where(
+            Twb >= 0.0,
+            ((2501.0 - 2.326 * Twb) * Ws_star - 1.006 * (Tdb - Twb))
+            / (2501.0 + 1.86 * Tdb - 4.186 * Twb),
+            ((2830.0 - 0.24 * Twb) * Ws_star - 1.006 * (Tdb - Twb))
+            / (2830.0 + 1.86 * Tdb - 2.1 * Twb),
+        )
+    return np.maximum(W, 1e-7)
+
+
+def wet_bulb_array(
+    Tdb: np.ndarray,
+    W: np.ndarray,
+    Tdp: np.ndarray,
+    pressure: float | np.ndarray,
+    unit_system: UnitSystem,
+) -> np.ndarray:
+    """
+    Vectorized equivalent of psychrolib.GetTWetBulbFromHumRatio.
+
+    Bisects every row at once between its dew point and dry-bulb, the same
+    bracket psychrolib uses, with a fixed step count so the whole batch
+    does uniform work.
+    """
+    lo = np.asarray(Tdp, dtype=np.float64)
+    hi = np.asarray(Tdb, dtype=np.float64)
+    for _ in range(_WET_BULB_BISECT_ITERS):
+        mid = 0.5 * (lo + hi)
+        too_wet = hum_ratio_from_wet_bulb_array(Tdb, mid, pressure, unit_system) > W
+        hi = np.where(too_wet, mid, hi)
+        lo = np.where(too_wet, lo, mid)
+    return 0.5 * (lo + hi)
+
+
+def find_adp_batch(
+    entering_Tdb: np.ndarray,
+    entering_W: np.ndarray,
+    leaving_Tdb: np.ndarray,
+    leaving_W: np.ndarray,
+    pressure: float,
+    unit_system: UnitSystem,
+) -> np.ndarray:
+    """
+    Vectorized find_adp: solve the ADP for a batch of entering/leaving pairs
+    sharing one pressure and unit system.
+
+    All process lines are iterated together against the saturation curve,
+    so the whole batch costs one array evaluation per Newton step instead of
+    one root-find per pair.
+
+    Returns an array of ADP dry-bulb temperatures.
+    """
+    entering_Tdb = np.asarray(entering_Tdb, dtype=np.float64)
+    entering_W = np.asarray(entering_W, dtype=np.float64)
+    leaving_Tdb = np.asarray(leaving_Tdb, dtype=np.float64)
+    leaving_W = np.asarray(leaving_W, dtype=np.float64)
+
+    dT = leaving_Tdb - entering_Tdb
+    if np.any(np.abs(dT) < 1e-10):
+        raise ValueError(
+            "Entering and leaving Tdb are identical — cannot determine process line."
+        )
+    slope = (leaving_W - entering_W) / dT
+
+    def objective(Tdb: np.ndarray) -> np.ndarray:
+        W_on_line = entering_W + slope * (Tdb - entering_Tdb)
+        return sat_hum_ratio_array(Tdb, pressure, unit_system) - W_on_line
+
+    ctx = _pressure_ctx(pressure, unit_system)
+    lo = np.full_like(leaving_Tdb, ctx.Tdb_min)
+    hi = leaving_Tdb.copy()
+
+    f_lo = ctx.W_sat_min - (entering_W + slope * (lo - entering_Tdb))
+    if np.any(f_lo * objective(hi) > 0):
+        raise ValueError(
+            "Process line does not intersect the saturation curve. "
+            "Check entering and leaving conditions."
+        )
+
+    return adp_newton(hi, entering_Tdb, entering_W, slope, pressure, unit_system)
+
+
+def adp_newton(
+    Tdb: np.ndarray,
+    line_Tdb: np.ndarray,
+    line_W: np.ndarray,
+    slope: np.ndarray,
+    pressure: float,
+    unit_system: UnitSystem,
+) -> np.ndarray:
+    """
+    Newton iteration for where the lines W = line_W + slope × (Tdb - line_Tdb)
+    meet the saturation curve, starting from Tdb on the unsaturated side.
+
+    W_sat is convex in Tdb and each line is straight, so the residual is
+    convex and increasing through the root: iterates approach it
+    monotonically from above without bracketing. Wide brackets (low SHR,
+    low pressure) take more steps, so the whole batch iterates until every
+    step is below _ADP_NEWTON_XTOL.
+
+    Raises:
+        ValueError: If any line has not converged after _ADP_NEWTON_MAX_ITERS
+            steps
+    """
+    for _ in range(_ADP_NEWTON_MAX_ITERS):
+        ln_p, d_ln_p = ln_sat_vap_pres(Tdb, unit_system)
+        Pws = np.exp(ln_p)
+        W_sat = 0.621945 * Pws / (pressure - Pws)
+        dW_sat = 0.621945 * pressure * Pws * d_ln_p / (pressure - Pws) ** 2
+        residual = W_sat - (line_W + slope * (Tdb - line_Tdb))
+        step = residual / (dW_sat - slope)
+        Tdb = Tdb - step
+        if np.all(np.abs(step) < _ADP_NEWTON_XTOL):
+            return Tdb
+
+    raise ValueError(
+        f"ADP Newton iteration did not converge in {_ADP_NEWTON_MAX_ITERS} steps"
+    )
+
+
 def generate_path_points(
     start_Tdb: float,
     start_W: float,
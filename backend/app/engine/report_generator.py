@@ -12,9 +12,8 @@ Produces a professional multi-page PDF report containing:
 
 import base64
 import io
-import tempfile
-import os
 from datetime import datetime
+from typing import Optional
 
 from fpdf import FPDF
 
@@ -82,8 +81,13 @@ class PsychroReport(FPDF):
         self.cell(0, 8, f"Page {self.page_no()}/{{nb}}", align="C")
 
 
-def generate_report(inp: ReportInput) -> bytes:
-    """Generate a PDF report and return the bytes."""
+def generate_report(inp: ReportInput, chart_image_bytes: Optional[bytes] = None) -> bytes:
+    """
+    Generate a PDF report and return the bytes.
+
+    chart_image_bytes, when given, is the chart PNG already decoded and is
+    used instead of decoding inp.chart_image_base64.
+    """
     pdf = PsychroReport(inp.title)
     pdf.alias_nb_pages()
 
@@ -112,8 +116,11 @@ def generate_report(inp: ReportInput) -> bytes:
     pdf.ln(4)
 
     # Chart image
-    if "chart" in inp.include_sections and inp.chart_image_base64:
-        _add_chart_image(pdf, inp.chart_image_base64)
+    if "chart" in inp.include_sections:
+        if chart_image_bytes:
+            _add_chart_image(pdf, chart_image_bytes)
+        elif inp.chart_image_base64:
+            _add_chart_image(pdf, _decode_chart_image(inp.chart_image_base64))
 
     # ── State Points Table ──
     if "state_points" in inp.include_sections and inp.state_points:
@@ -150,28 +157,23 @@ def generate_report(inp: ReportInput) -> bytes:
     return pdf.output()
 
 
-def _add_chart_image(pdf: FPDF, b64_data: str) -> None:
-    """Decode base64 PNG and add to PDF."""
+def _decode_chart_image(b64_data: str) -> bytes:
+    """Decode a base64 PNG, with or without a data URI prefix."""
     # Strip data URI prefix if present
     if "," in b64_data:
         b64_data = b64_data.split(",", 1)[1]
 
-    img_bytes = base64.b64decode(b64_data)
+    return base64.b64decode(b64_data)
 
-    # Write to a temp file (fpdf2 needs a file path or BytesIO)
-    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-    try:
-        tmp.write(img_bytes)
-        tmp.flush()
-        tmp.close()
 
-        # Landscape letter: usable width ~257mm, height ~170mm (accounting for margins/header)
-        available_width = pdf.w - 20  # 10mm margins each side
-        available_height = pdf.h - pdf.get_y() - 20
+def _add_chart_image(pdf: FPDF, img_bytes: bytes) -> None:
+    """Add PNG bytes to the PDF."""
+    # Landscape letter: usable width ~257mm, height ~170mm (accounting for margins/header)
+    available_width = pdf.w - 20  # 10mm margins each side
+    available_height = pdf.h - pdf.get_y() - 20
 
-        pdf.image(tmp.name, x=10, w=available_width, h=min(available_height, 120))
-    finally:
-        os.unlink(tmp.name)
+    # fpdf2 reads the image straight from memory; no temp file to share
+    pdf.image(io.BytesIO(img_bytes), x=10, w=available_width, h=min(available_height, 120))
 
 
 def _add_section_heading(pdf: FPDF, text: str) -> None:
@@ -7,12 +7,20 @@ Provides:
   - Effective SHR (ESHR): GSHR adjusted for coil bypass factor
 """
 
+from functools import lru_cache
+
+import numpy as np
 import psychrolib
 from scipy.optimize import brentq
 
 from app.config import UnitSystem, CHART_RANGES
 from app.engine.state_resolver import resolve_state_point
-from app.engine.processes.utils import set_unit_system, w_display
+from app.engine.processes.utils import (
+    adp_newton,
+    sat_hum_ratio_array,
+    set_unit_system,
+    w_display,
+)
 from app.models.process import PathPoint
 from app.models.shr import (
     SHRLineInput,
@@ -29,6 +37,7 @@ _HFG_IP = 1061.0  # BTU/lb — latent heat of vaporization at ~60°F
 _HFG_SI = 2501.0  # kJ/kg — latent heat of vaporization at ~0°C
 
 
+@lru_cache(maxsize=64)
 def compute_shr_slope(shr: float, unit_system: UnitSystem) -> float:
     """
     Compute the slope dW/dTdb for a given SHR value.
@@ -58,6 +67,22 @@ def compute_shr_slope(shr: float, unit_system: UnitSystem) -> float:
     return cp * (1.0 - shr) / (hfg * shr)
 
 
+def compute_shr_slope_vec(shr: np.ndarray, unit_system: UnitSystem) -> np.ndarray:
+    """Vectorized compute_shr_slope over an array of SHR values."""
+    shr = np.asarray(shr, dtype=np.float64)
+    if np.any(shr <= 0):
+        raise ValueError("SHR must be greater than 0")
+    if np.any(shr > 1.0):
+        raise ValueError("SHR must not exceed 1.0")
+
+    if unit_system == UnitSystem.IP:
+        cp, hfg = _CP_IP, _HFG_IP
+    else:
+        cp, hfg = _CP_SI, _HFG_SI
+
+    return cp * (1.0 - shr) / (hfg * shr)
+
+
 def generate_shr_line(
     room_Tdb: float,
     room_W: float,
@@ -167,6 +192,40 @@ def find_adp_from_shr(
     return adp_Tdb
 
 
+def find_adp_from_shr_batch(
+    room_Tdb: np.ndarray,
+    room_W: np.ndarray,
+    slope: np.ndarray,
+    pressure: float,
+    unit_system: UnitSystem,
+) -> np.ndarray:
+    """
+    Vectorized find_adp_from_shr: the ADP for a batch of room states and/or
+    SHR slopes sharing one pressure and unit system.
+
+    All lines are iterated together from the room Tdb (see find_adp_batch),
+    so a sweep costs one array evaluation per Newton step.
+    """
+    room_Tdb, room_W, slope = np.broadcast_arrays(
+        np.asarray(room_Tdb, dtype=np.float64),
+        np.asarray(room_W, dtype=np.float64),
+        np.asarray(slope, dtype=np.float64),
+    )
+
+    Tdb_min = CHART_RANGES[unit_system.value]["Tdb_min"]
+    f_min = sat_hum_ratio_array(Tdb_min, pressure, unit_system) - (
+        room_W + slope * (Tdb_min - room_Tdb)
+    )
+    f_max = sat_hum_ratio_array(room_Tdb, pressure, unit_system) - room_W
+    if np.any(f_min * f_max > 0):
+        raise ValueError(
+            "SHR line does not intersect the saturation curve. "
+            "Check room conditions and SHR value."
+        )
+
+    return adp_newton(room_Tdb, room_Tdb, room_W, slope, pressure, unit_system)
+
+
 def calculate_shr_line(shr_input: SHRLineInput) -> SHRLineOutput:
     """Calculate SHR line through room point with ADP intersection."""
     si = shr_input
@@ -4,12 +4,15 @@ Core state point resolver.
 Given any supported pair of independent psychrometric properties and atmospheric
 pressure, resolves all other psychrometric properties using psychrolib.
 
-For input pairs that psychrolib doesn't support directly (e.g., Tdb+h, Twb+RH),
-we use scipy root-finding to converge on the solution.
+For input pairs that psychrolib doesn't support directly (Twb+RH, Tdp+RH),
+we use a safeguarded Newton iteration with analytic derivatives to converge
+on the solution.
 """
 
+import math
+from functools import lru_cache
+
 import psychrolib
-from scipy.optimize import brentq
 
 from app.config import (
     UnitSystem,
@@ -17,6 +20,7 @@ from app.config import (
     GRAINS_PER_LB,
 )
 from app.models.state_point import StatePointOutput
+from app.engine.processes.utils import ln_sat_vap_pres
 
 
 def _set_unit_system(unit_system: UnitSystem) -> None:
@@ -27,6 +31,64 @@ def _set_unit_system(unit_system: UnitSystem) -> None:
         psychrolib.SetUnitSystem(psychrolib.SI)
 
 
+# Newton steps allowed in _newton_bracketed before giving up
+_NEWTON_MAX_ITERS = 50
+
+# |ln(RH) residual| at Tdb == Twb below which _resolve_twb_rh treats the
+# state as saturated; round-off there is ~1e-16
+_SATURATION_RESIDUAL_TOL = 1e-12
+
+
+def _newton_bracketed(func, lo: float, hi: float, xtol: float) -> tuple[float, int]:
+    """
+    Safeguarded Newton-Raphson for a root of func on [lo, hi].
+
+    func(x) returns (f, df/dx), and f must change sign over [lo, hi]. The
+    bracket shrinks around the root as iterates land on either side. A
+    Newton step that would leave it, or that shrinks slower than bisection
+    would (the damping test from Numerical Recipes' rtsafe), is replaced by
+    a bisection step, so convergence is quadratic near the root and never
+    worse than bisection.
+
+    Returns:
+        (root, number of Newton/bisection steps taken)
+
+    Raises:
+        ValueError: If f does not change sign over [lo, hi] or the
+            iteration does not converge
+    """
+    f_lo, df = func(lo)
+    if f_lo == 0.0:
+        return lo, 0
+    f_hi, _ = func(hi)
+    if f_hi == 0.0:
+        return hi, 0
+    if (f_lo > 0) == (f_hi > 0):
+        raise ValueError("f(lo) and f(hi) must have different signs")
+    lo_positive = f_lo > 0
+
+    x, f = lo, f_lo
+    step_old = hi - lo
+    for i in range(1, _NEWTON_MAX_ITERS + 1):
+        step = f / df if df != 0.0 else math.inf
+        if not lo <= x - step <= hi or abs(2.0 * f) > abs(step_old * df):
+            step = x - 0.5 * (lo + hi)
+        x -= step
+        if abs(step) < xtol:
+            return x, i
+        step_old = step
+
+        f, df = func(x)
+        if f == 0.0:
+            return x, i
+        if (f > 0) == lo_positive:
+            lo = x
+        else:
+            hi = x
+
+    raise ValueError(f"Newton iteration did not converge in {_NEWTON_MAX_ITERS} steps")
+
+
 def _get_sat_press(Tdb: float) -> float:
     """Get saturation vapor pressure at a given dry-bulb temperature."""
     return psychrolib.GetSatVapPres(Tdb)
@@ -39,8 +101,20 @@ def _calc_all_from_tdb_w(
     Given Tdb and W (humidity ratio), calculate all other properties.
     This is our canonical resolution path — most input pairs ultimately
     get converted to Tdb + W, and then we compute everything else.
+
+    Results are shared through a (pressure, Tdb, W) cache keyed on the
+    exact inputs, so a hit returns exactly what a fresh calculation would.
     """
     _set_unit_system(unit_system)
+    return dict(_state_from_tdb_w(Tdb, W, pressure, unit_system))
+
+
+@lru_cache(maxsize=256)
+def _state_from_tdb_w(
+    Tdb: float, W: float, pressure: float, unit_system: UnitSystem
+) -> dict:
+    """Cached body of _calc_all_from_tdb_w. Callers must not mutate the result."""
+    _set_unit_system(unit_system)
 
     # Core calculations from psychrolib
     Twb = psychrolib.GetTWetBulbFromHumRatio(Tdb, W, pressure)
@@ -110,28 +184,19 @@ def _resolve_tdb_h(Tdb: float, h_target: float, pressure: float, unit_system: Un
     """
     Resolve from dry-bulb temperature and specific enthalpy.
 
-    psychrolib doesn't have a direct GetHumRatioFromEnthalpy function,
-    so we use root-finding: find W such that GetMoistAirEnthalpy(Tdb, W) == h_target.
-
-    The enthalpy equation is: h = 0.240 * Tdb + W * (1061 + 0.444 * Tdb) [IP]
-    This is linear in W, so we can actually solve directly:
-        W = (h - 0.240 * Tdb) / (1061 + 0.444 * Tdb)  [IP]
-        W = (h - 1.006 * Tdb) / (2501 + 1.86 * Tdb)    [SI, kJ/kg with Tdb in °C]
-
-    But we'll use the general solver approach for robustness.
+    Enthalpy is linear in W at fixed Tdb:
+        h = 0.240 * Tdb + W * (1061 + 0.444 * Tdb)  [IP]
+        h = 1.006 * Tdb + W * (2501 + 1.86 * Tdb)    [SI, kJ/kg with Tdb in °C]
+    so W follows in closed form (psychrolib's GetHumRatioFromEnthalpyAndTDryBulb);
+    no iteration is needed.
     """
     _set_unit_system(unit_system)
 
-    def objective(W: float) -> float:
-        h_calc = psychrolib.GetMoistAirEnthalpy(Tdb, W)
-        return h_calc - h_target
-
     # W bounds: 0 to saturation
     W_sat = psychrolib.GetSatHumRatio(Tdb, pressure)
-    W_min = 0.0
 
     # Check if the target enthalpy is achievable at this Tdb
-    h_at_min = psychrolib.GetMoistAirEnthalpy(Tdb, W_min)
+    h_at_min = psychrolib.GetMoistAirEnthalpy(Tdb, 0.0)
     h_at_max = psychrolib.GetMoistAirEnthalpy(Tdb, W_sat)
 
     if h_target < h_at_min or h_target > h_at_max:
@@ -140,7 +205,7 @@ def _resolve_tdb_h(Tdb: float, h_target: float, pressure: float, unit_system: Un
             f"[{h_at_min:.2f}, {h_at_max:.2f}] at Tdb={Tdb}"
         )
 
-    W = brentq(objective, W_min, W_sat, xtol=1e-10)
+    W = psychrolib.GetHumRatioFromEnthalpyAndTDryBulb(h_target, Tdb)
     return _calc_all_from_tdb_w(Tdb, W, pressure, unit_system)
 
 
@@ -151,16 +216,32 @@ def _resolve_twb_rh(Twb: float, RH_pct: float, pressure: float, unit_system: Uni
     psychrolib doesn't support this directly. We find Tdb such that:
     - GetHumRatioFromTWetBulb(Tdb, Twb, pressure) gives a W, and
     - GetRelHumFromHumRatio(Tdb, W, pressure) == target RH
+
+    Newton runs on ln(RH) = ln(Pv(W)) - ln(Pws(Tdb)), which is close to
+    linear in Tdb, with the derivative taken analytically through the
+    wet-bulb equation.
     """
     _set_unit_system(unit_system)
     RH = RH_pct / 100.0
 
-    def objective(Tdb: float) -> float:
+    # Wet-bulb equation (ASHRAE Fundamentals 2017 ch. 1 eqns 33 & 35) has the
+    # form W = (A * Ws* - cp_a * (Tdb - Twb)) / (d0 + cp_v * Tdb), so
+    # dW/dTdb = -(cp_a + cp_v * W) / (d0 + cp_v * Tdb)
+    if unit_system == UnitSystem.IP:
+        cp_a, cp_v = 0.240, 0.444
+        d0 = 1093.0 - Twb if Twb >= 32.0 else 1220.0 - 0.48 * Twb
+    else:
+        cp_a, cp_v = 1.006, 1.86
+        d0 = 2501.0 - 4.186 * Twb if Twb >= 0.0 else 2830.0 - 2.1 * Twb
+
+    def objective(Tdb: float) -> tuple[float, float]:
         W = psychrolib.GetHumRatioFromTWetBulb(Tdb, Twb, pressure)
-        if W < 0:
-            return -1.0  # invalid region
-        RH_calc = psychrolib.GetRelHumFromHumRatio(Tdb, W, pressure)
-        return RH_calc - RH
+        Pv = pressure * W / (0.621945 + W)
+        ln_Ps, d_ln_Ps = ln_sat_vap_pres(Tdb, unit_system)
+        f = math.log(Pv) - ln_Ps - ln_RH
+        dW = -(cp_a + cp_v * W) / (d0 + cp_v * Tdb)
+        df = 0.621945 / (W * (0.621945 + W)) * dW - d_ln_Ps
+        return f, df
 
     # Tdb must be >= Twb (dry-bulb is always >= wet-bulb)
     # Upper bound: pick a reasonable max
@@ -172,12 +253,21 @@ def _resolve_twb_rh(Twb: float, RH_pct: float, pressure: float, unit_system: Uni
 
     # At Tdb == Twb, RH == 100%. As Tdb increases, RH decreases.
     # So if target RH < 100%, Tdb > Twb.
-    try:
-        Tdb = brentq(objective, Tdb_min, Tdb_max, xtol=1e-8)
-    except ValueError:
-        raise ValueError(
-            f"Cannot find a valid Tdb for Twb={Twb}, RH={RH_pct}%"
-        )
+    if RH <= 0.0:
+        raise ValueError(f"Cannot find a valid Tdb for Twb={Twb}, RH={RH_pct}%")
+    ln_RH = math.log(RH)
+
+    # A root at Tdb == Twb (RH == 100% above freezing) leaves a residual of
+    # pure round-off there, whose sign must not decide whether a root exists
+    if abs(objective(Tdb_min)[0]) < _SATURATION_RESIDUAL_TOL:
+        Tdb = Tdb_min
+    else:
+        try:
+            Tdb, _ = _newton_bracketed(objective, Tdb_min, Tdb_max, xtol=1e-8)
+        except ValueError:
+            raise ValueError(
+                f"Cannot find a valid Tdb for Twb={Twb}, RH={RH_pct}%"
+            )
 
     W = psychrolib.GetHumRatioFromTWetBulb(Tdb, Twb, pressure)
     return _calc_all_from_tdb_w(Tdb, W, pressure, unit_system)
@@ -189,17 +279,23 @@ def _resolve_tdp_rh(Tdp: float, RH_pct: float, pressure: float, unit_system: Uni
 
     Given Tdp, the vapor pressure is fixed: Pv = GetSatVapPres(Tdp).
     Given RH, we have: RH = Pv / Ps(Tdb), so Ps(Tdb) = Pv / RH.
-    We find Tdb such that GetSatVapPres(Tdb) == Pv / RH.
+    We find Tdb such that GetSatVapPres(Tdb) == Pv / RH, by Newton on
+    ln(Ps), which ln_sat_vap_pres evaluates along with its derivative.
+    ln(Ps) is concave in Tdb, so iterates from Tdp approach the root from
+    below.
     """
     _set_unit_system(unit_system)
     RH = RH_pct / 100.0
 
-    Pv = psychrolib.GetSatVapPres(Tdp)
-    Ps_target = Pv / RH
+    if RH <= 0.0:
+        raise ValueError(f"Cannot find a valid Tdb for Tdp={Tdp}, RH={RH_pct}%")
+    # Target from the same correlation as the objective, so RH == 100%
+    # lands exactly on Tdb == Tdp
+    ln_Ps_target = ln_sat_vap_pres(float(Tdp), unit_system)[0] - math.log(RH)
 
-    def objective(Tdb: float) -> float:
-        Ps_calc = psychrolib.GetSatVapPres(Tdb)
-        return Ps_calc - Ps_target
+    def objective(Tdb: float) -> tuple[float, float]:
+        ln_Ps, d_ln_Ps = ln_sat_vap_pres(Tdb, unit_system)
+        return ln_Ps - ln_Ps_target, d_ln_Ps
 
     # Tdb must be >= Tdp
     Tdb_min = Tdp
@@ -209,7 +305,7 @@ def _resolve_tdp_rh(Tdp: float, RH_pct: float, pressure: float, unit_system: Uni
         Tdb_max = 90.0
 
     try:
-        Tdb = brentq(objective, Tdb_min, Tdb_max, xtol=1e-8)
+        Tdb, _ = _newton_bracketed(objective, Tdb_min, Tdb_max, xtol=1e-8)
     except ValueError:
         raise ValueError(
             f"Cannot find a valid Tdb for Tdp={Tdp}, RH={RH_pct}%"
@@ -295,4 +391,14 @@ def get_pressure_from_altitude(altitude: float, unit_system: UnitSystem) -> floa
         Atmospheric pressure in psia (IP) or Pa (SI)
     """
     _set_unit_system(unit_system)
+    return _standard_atm_pressure(altitude, unit_system)
+
+
+@lru_cache(maxsize=64)
+def _standard_atm_pressure(altitude: float, unit_system: UnitSystem) -> float:
+    """
+    Memoized body of get_pressure_from_altitude; the standard atmosphere is a
+    pure function of altitude. The caller sets the unit system, so a cache
+    hit still leaves psychrolib configured for unit_system.
+    """
     return psychrolib.GetStandardAtmPressure(altitude)
@@ -11,9 +11,13 @@ import io
 from typing import Optional
 
 import numpy as np
-import psychrolib
 
 from app.config import UnitSystem
+from app.engine.processes.utils import sat_vap_pres_array
+
+# psychrolib's valid range for saturation vapor pressure, °C
+_T_MIN_C = -100.0
+_T_MAX_C = 200.0
 
 
 def parse_tmy3(
@@ -43,7 +47,8 @@ def parse_tmy3(
         w_bin_size: Bin size for W axis (default auto-computed)
 
     Returns:
-        dict matching TMYProcessOutput schema
+        dict matching TMYProcessOutput schema, plus "arrays": the scatter
+        points as per-field NumPy arrays (not part of the response model)
     """
     lines = file_content.strip().splitlines()
     if len(lines) < 10:
@@ -89,11 +94,11 @@ def parse_tmy3(
     scatter_points = []
     hour = 0
 
-    # Set up psychrolib for W calculation
-    # TMY3 data is always in SI (°C), we convert to target unit system
-    psychrolib.SetUnitSystem(psychrolib.SI)
+    # TMY3 data is always in SI (°C), we convert to target unit system.
+    # W uses the unit-explicit SI saturation pressure, so parsing never
+    # touches psychrolib's global unit system.
 
-    # Determine SI pressure for psychrolib calcs
+    # Determine SI pressure for W calcs
     if unit_system == "IP":
         pressure_si = pressure * 6894.76  # psia to Pa
         w_factor = 7000.0  # grains/lb
@@ -112,12 +117,21 @@ def parse_tmy3(
 
             tdb_c = float(row[tdb_col])
 
+            # GetHumRatioFromTDewPoint / GetHumRatioFromRelHum, with
+            # psychrolib's range checks
             if tdp_col is not None:
                 tdp_c = float(row[tdp_col])
-                W = psychrolib.GetHumRatioFromTDewPoint(tdp_c, pressure_si)
+                if tdp_c < _T_MIN_C or tdp_c > _T_MAX_C:
+                    raise ValueError("Dew point is outside range")
+                Pv = float(sat_vap_pres_array(tdp_c, UnitSystem.SI))
             else:
                 rh = float(row[rh_col]) / 100.0
-                W = psychrolib.GetHumRatioFromRelHum(tdb_c, rh, pressure_si)
+                if rh < 0.0 or rh > 1.0:
+                    raise ValueError("Relative humidity is outside range [0, 1]")
+                if tdb_c < _T_MIN_C or tdb_c > _T_MAX_C:
+                    raise ValueError("Dry bulb temperature is outside range")
+                Pv = rh * float(sat_vap_pres_array(tdb_c, UnitSystem.SI))
+            W = max(0.621945 * Pv / (pressure_si - Pv), 1e-7)
 
             # Convert to target unit system
             if unit_system == "IP":
@@ -147,7 +161,8 @@ def parse_tmy3(
     if w_bin_size is None:
         w_bin_size = 10.0 if unit_system == "IP" else 2.0
 
-    bin_result = _bin_data(scatter_points, tdb_bin_size, w_bin_size)
+    arrays = _scatter_arrays(scatter_points)
+    bin_result = _bin_data(arrays, tdb_bin_size, w_bin_size)
 
     return {
         "unit_system": unit_system,
@@ -157,9 +172,15 @@ def parse_tmy3(
         "bin_matrix": bin_result["matrix"],
         "location_name": location_name,
         "total_hours": len(scatter_points),
+        "arrays": arrays,
     }
 
 
+# Columns read from each EPW data row, in file order:
+# month, day, hour, dry-bulb (°C), dew point (°C), station pressure (Pa)
+_EPW_COLUMNS = (1, 2, 3, 6, 7, 9)
+
+
 def parse_epw_raw(file_content: str) -> dict:
     """
     Parse an EPW file and return raw SI data without display conversions.
@@ -167,7 +188,9 @@ def parse_epw_raw(file_content: str) -> dict:
     Returns a dict with:
         - location: dict with city, state, country, latitude, longitude, timezone, elevation
         - location_name: formatted string e.g. "City, ST, USA"
-        - records: list of dicts, each with tdb_c, tdp_c, pressure_pa, month, day, hour
+        - hourly: dict of index-aligned NumPy arrays tdb_c, tdp_c, pressure_pa
+          (float64) and month, day, hour (int64); see records_as_dicts() for
+          the per-hour dict view
 
     This is the shared low-level parser used by both parse_epw() (for scatter/heatmap)
     and the weather analysis pipeline (for clustering/design point extraction).
@@ -181,58 +204,78 @@ def parse_epw_raw(file_content: str) -> dict:
     location = _extract_epw_location_full(lines[0])
 
     DATA_START = 8
-    records = []
-
-    for line_idx in range(DATA_START, len(lines)):
-        line = lines[line_idx].strip()
-        if not line:
-            continue
+    data = _read_epw_columns(lines[DATA_START:])
+    month, day, hour, tdb_c, tdp_c, atm_pressure_pa = data.T
 
-        try:
-            reader = csv.reader(io.StringIO(line))
-            row = next(reader)
-
-            if len(row) < 10:
-                continue
-
-            month = int(row[1])
-            day = int(row[2])
-            hour = int(row[3])
-            tdb_c = float(row[6])
-            tdp_c = float(row[7])
-            atm_pressure_pa = float(row[9])
-
-            # Skip EPW missing-value sentinels
-            if tdb_c > 70 or tdb_c < -70:
-                continue
-            if tdp_c > 70 or tdp_c < -70:
-                continue
-
-            # Use row-level atmospheric pressure if valid, else default
-            if not (50000 <= atm_pressure_pa <= 120000):
-                atm_pressure_pa = 101325.0
-
-            records.append({
-                "tdb_c": tdb_c,
-                "tdp_c": tdp_c,
-                "pressure_pa": atm_pressure_pa,
-                "month": month,
-                "day": day,
-                "hour": hour,
-            })
-        except (ValueError, IndexError):
-            continue
-
-    if len(records) == 0:
+    # Skip EPW missing-value sentinels
+    keep = (np.abs(tdb_c) <= 70) & (np.abs(tdp_c) <= 70)
+    if not keep.any():
         raise ValueError("No valid data points found in EPW file.")
 
+    # Use row-level atmospheric pressure if valid, else default
+    atm_pressure_pa = np.where(
+        (atm_pressure_pa >= 50000) & (atm_pressure_pa <= 120000),
+        atm_pressure_pa,
+        101325.0,
+    )
+
     return {
         "location": location,
         "location_name": location_name,
-        "records": records,
+        "hourly": {
+            "tdb_c": tdb_c[keep],
+            "tdp_c": tdp_c[keep],
+            "pressure_pa": atm_pressure_pa[keep],
+            "month": month[keep].astype(np.int64),
+            "day": day[keep].astype(np.int64),
+            "hour": hour[keep].astype(np.int64),
+        },
     }
 
 
+def _read_epw_columns(data_lines: list[str]) -> np.ndarray:
+    """
+    Read the _EPW_COLUMNS fields of EPW data rows into an (n, 6) float array.
+
+    Well-formed files go through NumPy's C parser; if any row is short or
+    non-numeric, fall back to a row-by-row pass that drops the bad rows.
+    """
+    try:
+        return np.loadtxt(
+            data_lines,
+            delimiter=",",
+            usecols=_EPW_COLUMNS,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2,
+        )
+    except ValueError:
+        pass
+
+    rows = []
+    for row in csv.reader(data_lines):
+        if len(row) < 10:
+            continue
+        try:
+            rows.append([float(row[i]) for i in _EPW_COLUMNS])
+        except ValueError:
+            continue
+
+    return np.array(rows, dtype=np.float64).reshape(-1, len(_EPW_COLUMNS))
+
+
+def records_as_dicts(hourly: dict[str, np.ndarray]) -> list[dict]:
+    """
+    Per-hour view of parse_epw_raw()'s hourly arrays: one dict per hour with
+    keys tdb_c, tdp_c, pressure_pa, month, day, hour.
+    """
+    keys = list(hourly)
+    return [
+        dict(zip(keys, values))
+        for values in zip(*(hourly[key].tolist() for key in keys))
+    ]
+
+
 def parse_epw(
     file_content: str,
     unit_system: UnitSystem,
@@ -254,45 +297,41 @@ def parse_epw(
         w_bin_size: Bin size for W axis (default auto-computed)
 
     Returns:
-        dict matching TMYProcessOutput schema
+        dict matching TMYProcessOutput schema, plus "arrays": the scatter
+        points as per-field NumPy arrays (not part of the response model)
     """
     raw = parse_epw_raw(file_content)
-
-    psychrolib.SetUnitSystem(psychrolib.SI)
+    hourly = raw["hourly"]
 
     if unit_system == "IP":
         w_factor = 7000.0  # grains/lb
+        tdb_display = hourly["tdb_c"] * 9.0 / 5.0 + 32.0
     else:
         w_factor = 1000.0  # g/kg
-
-    scatter_points = []
-    for idx, rec in enumerate(raw["records"]):
-        try:
-            W = psychrolib.GetHumRatioFromTDewPoint(rec["tdp_c"], rec["pressure_pa"])
-
-            if unit_system == "IP":
-                tdb_display = rec["tdb_c"] * 9.0 / 5.0 + 32.0
-            else:
-                tdb_display = rec["tdb_c"]
-
-            W_display = W * w_factor
-
-            scatter_points.append({
-                "Tdb": round(tdb_display, 2),
-                "W_display": round(W_display, 2),
-                "hour": idx,
-                "month": rec["month"],
-            })
-        except (ValueError, IndexError):
-            continue
-
-    if len(scatter_points) == 0:
-        raise ValueError("No valid data points found in EPW file.")
+        tdb_display = hourly["tdb_c"]
+
+    # psychrolib.GetHumRatioFromTDewPoint over the whole year
+    Pv = sat_vap_pres_array(hourly["tdp_c"], UnitSystem.SI)
+    W = np.maximum(0.621945 * Pv / (hourly["pressure_pa"] - Pv), 1e-7)
+    W_display = W * w_factor
+
+    scatter_points = [
+        {
+            "Tdb": round(tdb, 2),
+            "W_display": round(w, 2),
+            "hour": idx,
+            "month": month,
+        }
+        for idx, (tdb, w, month) in enumerate(zip(
+            tdb_display.tolist(), W_display.tolist(), hourly["month"].tolist()
+        ))
+    ]
 
     if w_bin_size is None:
         w_bin_size = 10.0 if unit_system == "IP" else 2.0
 
-    bin_result = _bin_data(scatter_points, tdb_bin_size, w_bin_size)
+    arrays = _scatter_arrays(scatter_points)
+    bin_result = _bin_data(arrays, tdb_bin_size, w_bin_size)
 
     return {
         "unit_system": unit_system,
@@ -302,6 +341,7 @@ def parse_epw(
         "bin_matrix": bin_result["matrix"],
         "location_name": raw["location_name"],
         "total_hours": len(scatter_points),
+        "arrays": arrays,
     }
 
 
@@ -403,14 +443,24 @@ def _extract_month(row: list[str], hour_index: int) -> int:
     return 12
 
 
+def _scatter_arrays(scatter_points: list[dict]) -> dict[str, np.ndarray]:
+    """Scatter points as one NumPy array per field (Tdb, W_display, hour, month)."""
+    return {
+        "Tdb": np.array([p["Tdb"] for p in scatter_points]),
+        "W_display": np.array([p["W_display"] for p in scatter_points]),
+        "hour": np.array([p["hour"] for p in scatter_points], dtype=np.int64),
+        "month": np.array([p["month"] for p in scatter_points], dtype=np.int64),
+    }
+
+
 def _bin_data(
-    scatter_points: list[dict],
+    arrays: dict[str, np.ndarray],
     tdb_bin_size: float,
     w_bin_size: float,
 ) -> dict:
     """Bin scatter points into a 2D grid for heatmap display."""
-    tdbs = np.array([p["Tdb"] for p in scatter_points])
-    ws = np.array([p["W_display"] for p in scatter_points])
+    tdbs = arrays["Tdb"]
+    ws = arrays["W_display"]
 
     # Create bin edges
     tdb_min = np.floor(tdbs.min() / tdb_bin_size) * tdb_bin_size
@@ -427,5 +477,5 @@ def _bin_data(
     return {
         "tdb_edges": [round(float(e), 2) for e in tdb_edges],
         "w_edges": [round(float(e), 2) for e in w_edges],
-        "matrix": [[int(c) for c in row] for row in matrix.tolist()],
+        "matrix": matrix.astype(np.int64).tolist(),
     }
@@ -6,20 +6,59 @@ HVAC operating regimes, then extracts per-cluster metadata (hour counts,
 centroids, worst-case points).
 """
 
+import warnings
+from typing import NamedTuple
+
 import numpy as np
-import psychrolib
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
 
+from app.config import UnitSystem
+from app.engine.processes.utils import dew_point_array, sat_vap_pres_array, wet_bulb_array
 from app.models.weather_analysis import HourlyPsychroState
 
 DEFAULT_K = 5
 
+# k-means restarts (best distortion wins) and Lloyd iterations per restart
+_N_INIT = 3
+_MAX_ITER = 20
+
+# label_cluster bins: Cold < 45 °F <= Cool < 60 <= Mild < 75 <= Warm < 90 <= Hot,
+# Dry < 0.35 <= Moderate < 0.65 <= Humid
+_TDB_F_BINS = np.array([45.0, 60.0, 75.0, 90.0])
+_RH_BINS = np.array([0.35, 0.65])
+_LABELS = np.array([
+    [f"{t} {m}" for m in ("Dry", "Moderate", "Humid")]
+    for t in ("Cold", "Cool", "Mild", "Warm", "Hot")
+], dtype=object)
+
+
+class ScaledFeatures(NamedTuple):
+    """Standardized (Tdb, W) clustering features, X_scaled = (X - mean) / std."""
+    X_scaled: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+
+
+def scale_features(states: list[HourlyPsychroState]) -> ScaledFeatures:
+    """
+    Build the (Tdb_c, humidity_ratio) feature matrix and standardize it.
+
+    Independent of n_clusters, so one result can serve a sweep over k.
+    """
+    X = np.array([[s.dry_bulb_c, s.humidity_ratio] for s in states])
+
+    # Normalize so both axes contribute equally to distance; a constant
+    # column is left unscaled
+    mean = X.mean(axis=0)
+    std = X.std(axis=0)
+    std[std == 0.0] = 1.0
+    return ScaledFeatures((X - mean) / std, mean, std)
+
 
 def cluster_weather_data(
     states: list[HourlyPsychroState],
     n_clusters: int = DEFAULT_K,
     random_state: int = 42,
+    features: ScaledFeatures | None = None,
 ) -> dict:
     """
     Cluster hourly psychrometric states using k-means on (Tdb, W).
@@ -28,6 +67,7 @@ def cluster_weather_data(
         states: List of HourlyPsychroState (SI units).
         n_clusters: Number of clusters (default 5).
         random_state: Random seed for reproducibility.
+        features: scale_features(states), if already computed.
 
     Returns:
         dict with:
@@ -41,34 +81,30 @@ def cluster_weather_data(
     if n < n_clusters:
         n_clusters = max(1, n)
 
-    # Build feature matrix: (Tdb_c, humidity_ratio)
-    X = np.array([[s.dry_bulb_c, s.humidity_ratio] for s in states])
+    if features is None:
+        features = scale_features(states)
+    X_scaled, mean, std = features
 
-    # Normalize so both axes contribute equally to distance
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-
-    kmeans = KMeans(
-        n_clusters=n_clusters,
-        random_state=random_state,
-        n_init=10,
-        max_iter=300,
-    )
-    kmeans.fit(X_scaled)
-
-    labels = kmeans.labels_.tolist()
+    label_arr, centers = _kmeans(X_scaled, n_clusters, random_state)
+    labels = label_arr.tolist()
 
     # Transform centroids back to original scale
-    centroids_original = scaler.inverse_transform(kmeans.cluster_centers_)
+    centroids_original = centers * std + mean
 
     # Compute mean pressure across all states for centroid state resolution
     mean_pressure = np.mean([s.pressure_pa for s in states])
 
+    # Group hours by cluster in one sort: by label, then enthalpy descending,
+    # so the first hour of each group is its worst case (stable sort keeps the
+    # earliest hour on ties, as max() did)
+    enthalpy = np.array([s.enthalpy_j_per_kg for s in states])
+    order = np.lexsort((-enthalpy, label_arr))
+    counts = np.bincount(label_arr, minlength=n_clusters)
+    group_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
     cluster_infos = []
     for cid in range(n_clusters):
-        mask = [i for i, lbl in enumerate(labels) if lbl == cid]
-        hour_count = len(mask)
-        cluster_states = [states[i] for i in mask]
+        hour_count = int(counts[cid])
 
         # Centroid in original coordinates
         centroid_tdb_c = float(centroids_original[cid, 0])
@@ -79,8 +115,12 @@ def cluster_weather_data(
             centroid_tdb_c, centroid_w, mean_pressure
         )
 
-        # Worst-case: highest enthalpy in this cluster
-        worst_case = max(cluster_states, key=lambda s: s.enthalpy_j_per_kg)
+        # Worst-case: highest enthalpy in this cluster (the centroid itself
+        # if no hour landed in it)
+        if hour_count:
+            worst_case = states[order[group_starts[cid]]]
+        else:
+            worst_case = centroid_state
 
         # Descriptive label based on centroid conditions
         label = label_cluster(centroid_tdb_c, centroid_state.relative_humidity)
@@ -102,6 +142,39 @@ def cluster_weather_data(
     }
 
 
+def _kmeans(
+    X: np.ndarray, n_clusters: int, random_state: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    k-means++ / Lloyd clustering of X with _N_INIT seeded restarts.
+
+    Returns (labels, centers) of the restart with the fewest empty clusters,
+    then the lowest distortion.
+    """
+    # Deferred: scipy.cluster is only needed once a weather file is analyzed
+    from scipy.cluster.vq import kmeans2
+
+    best = None
+    for i in range(_N_INIT):
+        with warnings.catch_warnings():
+            # An empty cluster keeps its previous centroid and is ranked out
+            # below; duplicate-only data also trips a 0/0 in the ++ seeding
+            warnings.simplefilter("ignore", UserWarning)
+            warnings.simplefilter("ignore", RuntimeWarning)
+            centers, labels = kmeans2(
+                X, n_clusters, iter=_MAX_ITER, minit="++",
+                seed=random_state + i,
+            )
+        n_empty = n_clusters - np.count_nonzero(
+            np.bincount(labels, minlength=n_clusters)
+        )
+        distortion = float(np.sum((X - centers[labels]) ** 2))
+        if best is None or (n_empty, distortion) < best[0]:
+            best = ((n_empty, distortion), labels, centers)
+
+    return best[1], best[2]
+
+
 def label_cluster(centroid_tdb_c: float, centroid_rh: float) -> str:
     """
     Assign a descriptive label based on centroid conditions.
@@ -116,25 +189,8 @@ def label_cluster(centroid_tdb_c: float, centroid_rh: float) -> str:
     # Convert to °F for labeling thresholds (per IMPLEMENTATION_PLAN.md)
     tdb_f = centroid_tdb_c * 9.0 / 5.0 + 32.0
 
-    if tdb_f >= 90:
-        temp_label = "Hot"
-    elif tdb_f >= 75:
-        temp_label = "Warm"
-    elif tdb_f >= 60:
-        temp_label = "Mild"
-    elif tdb_f >= 45:
-        temp_label = "Cool"
-    else:
-        temp_label = "Cold"
-
-    if centroid_rh >= 0.65:
-        moisture_label = "Humid"
-    elif centroid_rh >= 0.35:
-        moisture_label = "Moderate"
-    else:
-        moisture_label = "Dry"
-
-    return f"{temp_label} {moisture_label}"
+    # Lower bounds are inclusive: digitize puts x == bin edge in the upper bin
+    return str(_LABELS[np.digitize(tdb_f, _TDB_F_BINS), np.digitize(centroid_rh, _RH_BINS)])
 
 
 def _resolve_state_from_tdb_w(
@@ -142,15 +198,18 @@ def _resolve_state_from_tdb_w(
 ) -> HourlyPsychroState:
     """
     Compute full psychrometric state from Tdb and humidity ratio (SI).
-    Used for centroid state resolution.
+    Used for centroid state resolution. Like psychrometric_calc, it uses the
+    unit-explicit equivalents in app.engine.processes.utils and never touches
+    psychrolib's global unit system.
     """
-    psychrolib.SetUnitSystem(psychrolib.SI)
-
-    twb = psychrolib.GetTWetBulbFromHumRatio(tdb_c, w, pressure_pa)
-    tdp = psychrolib.GetTDewPointFromHumRatio(tdb_c, w, pressure_pa)
-    rh = psychrolib.GetRelHumFromHumRatio(tdb_c, w, pressure_pa)
-    h = psychrolib.GetMoistAirEnthalpy(tdb_c, w)
-    v = psychrolib.GetMoistAirVolume(tdb_c, w, pressure_pa)
+    tdp = float(dew_point_array(tdb_c, w, pressure_pa, UnitSystem.SI))
+    twb = float(wet_bulb_array(tdb_c, w, tdp, pressure_pa, UnitSystem.SI))
+    # GetRelHumFromHumRatio
+    Pv = pressure_pa * w / (0.621945 + w)
+    rh = min(max(Pv / float(sat_vap_pres_array(tdb_c, UnitSystem.SI)), 0.0), 1.0)
+    # GetMoistAirEnthalpy / GetMoistAirVolume (SI)
+    h = (1.006 * tdb_c + w * (2501.0 + 1.86 * tdb_c)) * 1000.0
+    v = 287.042 * (tdb_c + 273.15) * (1.0 + 1.607858 * w) / pressure_pa
 
     return HourlyPsychroState(
         month=0,
@@ -5,55 +5,153 @@ Parses EPW → computes psychrometric states → extracts extreme design points
 clusters → packages everything into a structured result.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
 import numpy as np
 
 from app.config import UnitSystem
 from app.engine.tmy_processor import parse_epw_raw
 from app.engine.weather_analysis.psychrometric_calc import compute_hourly_states
-from app.engine.weather_analysis.clustering import cluster_weather_data
+from app.engine.weather_analysis.clustering import (
+    ScaledFeatures,
+    cluster_weather_data,
+    scale_features,
+)
 from app.models.weather_analysis import (
     EPWLocation,
     HourlyPsychroState,
     DesignPoint,
     ClusterSummary,
+    WeatherChartArrays,
     WeatherChartPoint,
     WeatherAnalysisOutput,
 )
 
 
+class _PreparedWeather(NamedTuple):
+    """Per-file pipeline state that does not depend on n_clusters or units."""
+    location: EPWLocation
+    states: list[HourlyPsychroState]
+    features: ScaledFeatures
+    tdb_c: np.ndarray  # per-hour dry bulb, °C
+    w: np.ndarray  # per-hour humidity ratio, kg/kg
+    peaks: tuple[int, int, int]  # hour indices: cooling, heating, dehumidification
+
+
+# Prepared state for the most recent files, keyed by a content digest so the
+# EPW text itself is not held as a cache key (as in the API's analysis cache).
+_PREPARED_CACHE_SIZE = 2
+_prepared_cache: OrderedDict[bytes, _PreparedWeather] = OrderedDict()
+# The API runs the pipeline in threadpool workers
+_prepared_lock = threading.Lock()
+
+
+def _prepare(epw_content: str) -> _PreparedWeather:
+    """
+    Parse the EPW, compute hourly states and scale the clustering features,
+    once per file content. Shared across n_clusters and unit systems, so
+    callers must not mutate the result.
+    """
+    key = hashlib.blake2b(epw_content.encode(), digest_size=16).digest()
+    with _prepared_lock:
+        if key in _prepared_cache:
+            _prepared_cache.move_to_end(key)
+            return _prepared_cache[key]
+
+    # Step 1: Parse EPW file
+    raw = parse_epw_raw(epw_content)
+    location = EPWLocation(**raw["location"])
+
+    # Step 2: Compute full psychrometric states (SI)
+    states = compute_hourly_states(raw["hourly"])
+    prepared = _prepare_states(location, states)
+
+    with _prepared_lock:
+        _prepared_cache[key] = prepared
+        if len(_prepared_cache) > _PREPARED_CACHE_SIZE:
+            _prepared_cache.popitem(last=False)
+    return prepared
+
+
+def _prepare_states(
+    location: EPWLocation, states: list[HourlyPsychroState]
+) -> _PreparedWeather:
+    """Extreme hours, chart columns and scaled features for a set of states."""
+    if len(states) == 0:
+        raise ValueError("No valid psychrometric states could be computed.")
+
+    # Step 3: Extract extreme design points
+    tdb_c = np.array([s.dry_bulb_c for s in states])
+    w = np.array([s.humidity_ratio for s in states])
+    h = np.array([s.enthalpy_j_per_kg for s in states])
+    peaks = _extract_peaks(tdb_c, w, h)
+
+    return _PreparedWeather(location, states, scale_features(states), tdb_c, w, peaks)
+
+
 def extract_design_conditions(
     epw_content: str,
     n_clusters: int = 5,
     unit_system: str = "IP",
+    columnar: bool = False,
 ) -> WeatherAnalysisOutput:
     """
     Run the full weather analysis pipeline on EPW file content.
 
+    Parsing, state computation and feature scaling are cached per file
+    (_prepare), so a sweep over n_clusters or units re-runs only the fit
+    and extraction.
+
     Args:
         epw_content: Raw EPW file text.
         n_clusters: Number of clusters for k-means (default 5).
         unit_system: "IP" or "SI" for output display units.
+        columnar: Return the hourly chart points as chart_arrays columns
+            instead of one chart_data object per hour.
 
     Returns:
         WeatherAnalysisOutput with design points, cluster summaries, and chart data.
     """
-    # Step 1: Parse EPW file
-    raw = parse_epw_raw(epw_content)
-    location_dict = raw["location"]
-    location = EPWLocation(**location_dict)
+    return _extract(_prepare(epw_content), n_clusters, unit_system, columnar)
 
-    # Step 2: Compute full psychrometric states (SI)
-    states = compute_hourly_states(raw["records"])
-    if len(states) == 0:
-        raise ValueError("No valid psychrometric states could be computed.")
 
-    # Step 3: Extract extreme design points
-    peak_cooling = _extract_peak_cooling(states)
-    peak_heating = _extract_peak_heating(states)
-    peak_dehum = _extract_peak_dehumidification(states, peak_cooling)
+def extract_from_states(
+    states: list[HourlyPsychroState],
+    location: EPWLocation,
+    n_clusters: int = 5,
+    unit_system: str = "IP",
+    columnar: bool = False,
+) -> WeatherAnalysisOutput:
+    """
+    Run the analysis on hourly states that are already computed (e.g. by
+    compute_hourly_states), skipping the EPW parse.
+
+    Takes the same options as extract_design_conditions. Nothing is cached,
+    so to sweep n_clusters over one file, pass the file text to
+    extract_design_conditions instead.
+    """
+    return _extract(
+        _prepare_states(location, states), n_clusters, unit_system, columnar
+    )
+
+
+def _extract(
+    prepared: _PreparedWeather,
+    n_clusters: int,
+    unit_system: str,
+    columnar: bool,
+) -> WeatherAnalysisOutput:
+    """Cluster prepared weather data and package the design conditions."""
+    location, states, features, tdb_c, w, peaks = prepared
+    peak_cooling, peak_heating, peak_dehum = (states[i] for i in peaks)
 
     # Step 4: Cluster and extract intermediate points
-    cluster_result = cluster_weather_data(states, n_clusters=n_clusters)
+    cluster_result = cluster_weather_data(
+        states, n_clusters=n_clusters, features=features
+    )
     labels = cluster_result["labels"]
     cluster_infos = cluster_result["cluster_infos"]
 
@@ -93,14 +191,28 @@ def extract_design_conditions(
             centroid_humidity_ratio=_convert_w(ci["centroid_w"], unit_system),
         ))
 
-    # Step 7: Build chart data (all hours with cluster assignment)
+    # Step 7: Build chart data (all hours with cluster assignment).
+    # Unit conversion runs on whole arrays; round() stays per value so the
+    # output matches the scalar conversion exactly.
+    tdb_display = _convert_temp(tdb_c, unit_system)
+    w_display = _convert_w(w, unit_system)
     chart_data: list[WeatherChartPoint] = []
-    for i, state in enumerate(states):
-        chart_data.append(WeatherChartPoint(
-            dry_bulb=round(_convert_temp(state.dry_bulb_c, unit_system), 2),
-            humidity_ratio=round(_convert_w(state.humidity_ratio, unit_system), 2),
-            cluster_id=labels[i],
-        ))
+    chart_arrays = None
+    if columnar:
+        chart_arrays = WeatherChartArrays(
+            dry_bulb=[round(tdb, 2) for tdb in tdb_display.tolist()],
+            humidity_ratio=[round(w, 2) for w in w_display.tolist()],
+            cluster_id=labels,
+        )
+    else:
+        chart_data = [
+            WeatherChartPoint(
+                dry_bulb=round(tdb, 2),
+                humidity_ratio=round(w, 2),
+                cluster_id=cid,
+            )
+            for tdb, w, cid in zip(tdb_display.tolist(), w_display.tolist(), labels)
+        ]
 
     return WeatherAnalysisOutput(
         unit_system=unit_system,
@@ -108,39 +220,36 @@ def extract_design_conditions(
         design_points=design_points,
         cluster_summary=cluster_summary,
         chart_data=chart_data,
+        chart_arrays=chart_arrays,
         total_hours=len(states),
     )
 
 
-def _extract_peak_cooling(states: list[HourlyPsychroState]) -> HourlyPsychroState:
-    """Peak cooling = hour with highest moist air enthalpy."""
-    return max(states, key=lambda s: s.enthalpy_j_per_kg)
-
-
-def _extract_peak_heating(states: list[HourlyPsychroState]) -> HourlyPsychroState:
-    """Peak heating = hour with lowest dry-bulb temperature."""
-    return min(states, key=lambda s: s.dry_bulb_c)
-
-
-def _extract_peak_dehumidification(
-    states: list[HourlyPsychroState],
-    peak_cooling: HourlyPsychroState,
-) -> HourlyPsychroState:
+def _extract_peaks(
+    tdb_c: np.ndarray, w: np.ndarray, h: np.ndarray
+) -> tuple[int, int, int]:
     """
-    Peak dehumidification = highest humidity ratio at moderate temperature.
+    Hour indices of the three extreme design points:
+
+    - Peak cooling = hour with highest moist air enthalpy.
+    - Peak heating = hour with lowest dry-bulb temperature.
+    - Peak dehumidification = highest humidity ratio at moderate temperature:
+      among hours with Tdb < 85% of the peak cooling Tdb. If none qualify
+      (e.g., very narrow temperature range), the highest W overall.
 
-    Filters to hours where Tdb < 85% of peak cooling Tdb, then selects
-    the hour with the highest humidity ratio. If the filter yields no
-    results (e.g., very narrow temperature range), falls back to highest W overall.
+    Ties resolve to the earliest hour.
     """
-    threshold_c = peak_cooling.dry_bulb_c * 0.85
-    moderate_hours = [s for s in states if s.dry_bulb_c < threshold_c]
+    i_cool = int(np.argmax(h))
+    i_heat = int(np.argmin(tdb_c))
 
-    if not moderate_hours:
+    moderate = tdb_c < tdb_c[i_cool] * 0.85
+    if moderate.any():
+        i_dehum = int(np.argmax(np.where(moderate, w, -np.inf)))
+    else:
         # Fallback: just use the hour with highest W
-        moderate_hours = states
+        i_dehum = int(np.argmax(w))
 
-    return max(moderate_hours, key=lambda s: s.humidity_ratio)
+    return i_cool, i_heat, i_dehum
 
 
 def _state_to_design_point(
@@ -1,81 +1,127 @@
 """
 Compute full psychrometric state for each hourly weather record.
 
-Takes raw EPW parsed data (tdb_c, tdp_c, pressure_pa per hour) and returns
+Takes raw EPW parsed data (tdb_c, tdp_c, pressure_pa arrays) and returns
 a list of HourlyPsychroState objects with all derived properties.
+
+The whole year is computed as NumPy arrays at once, using the vectorized
+equivalents of the psychrolib functions in app.engine.processes.utils.
+These never touch psychrolib's global unit system: the weather pipeline is
+SI throughout, and IP display conversion happens in design_extractor.
 """
 
 import logging
+import math
 
-import psychrolib
+import numpy as np
 
+from app.config import UnitSystem
+from app.engine.processes.utils import sat_vap_pres_array, wet_bulb_array
 from app.models.weather_analysis import HourlyPsychroState
 
 logger = logging.getLogger(__name__)
 
+_FIELDS = ("tdb_c", "tdp_c", "pressure_pa", "month", "day", "hour")
+
+# psychrolib's valid range for saturation vapor pressure, °C
+_T_MIN_C = -100.0
+_T_MAX_C = 200.0
+
+
+def _as_float(rec: dict, key: str) -> float:
+    """rec[key] as a float, or NaN if it is missing or not numeric."""
+    try:
+        return float(rec[key])
+    except (KeyError, TypeError, ValueError):
+        return math.nan
+
+
+def _columns_from_records(records: list[dict]) -> dict[str, np.ndarray]:
+    """Per-hour dicts as float64 columns; missing or non-numeric values become NaN."""
+    n = len(records)
+    return {
+        key: np.fromiter((_as_float(rec, key) for rec in records), np.float64, count=n)
+        for key in _FIELDS
+    }
+
 
 def compute_hourly_states(
-    records: list[dict],
+    hourly: dict[str, np.ndarray] | list[dict],
 ) -> list[HourlyPsychroState]:
     """
     Compute full psychrometric state for each hourly record.
 
     Args:
-        records: List of dicts from parse_epw_raw(), each with keys:
-            tdb_c, tdp_c, pressure_pa, month, day, hour
+        hourly: The "hourly" dict of arrays from parse_epw_raw() (keys
+            tdb_c, tdp_c, pressure_pa, month, day, hour), or a list of
+            per-hour dicts with the same keys
 
     Returns:
         List of HourlyPsychroState with all psychrometric properties (SI units).
         Corrupt records are skipped with a warning.
     """
-    psychrolib.SetUnitSystem(psychrolib.SI)
-
-    states: list[HourlyPsychroState] = []
-
-    for idx, rec in enumerate(records):
-        try:
-            tdb_c = rec["tdb_c"]
-            tdp_c = rec["tdp_c"]
-            pressure_pa = rec["pressure_pa"]
-
-            # Clamp dewpoint to not exceed dry-bulb (physically impossible)
-            if tdp_c > tdb_c:
-                tdp_c = tdb_c
-
-            humidity_ratio = psychrolib.GetHumRatioFromTDewPoint(
-                tdp_c, pressure_pa
-            )
-            wet_bulb_c = psychrolib.GetTWetBulbFromTDewPoint(
-                tdb_c, tdp_c, pressure_pa
-            )
-            rh = psychrolib.GetRelHumFromTDewPoint(tdb_c, tdp_c)
-            enthalpy = psychrolib.GetMoistAirEnthalpy(tdb_c, humidity_ratio)
-            specific_volume = psychrolib.GetMoistAirVolume(
-                tdb_c, humidity_ratio, pressure_pa
-            )
-
-            states.append(HourlyPsychroState(
-                month=rec["month"],
-                day=rec["day"],
-                hour=rec["hour"],
-                dry_bulb_c=tdb_c,
-                wet_bulb_c=wet_bulb_c,
-                dewpoint_c=tdp_c,
-                humidity_ratio=humidity_ratio,
-                relative_humidity=rh,
-                enthalpy_j_per_kg=enthalpy,
-                specific_volume=specific_volume,
-                pressure_pa=pressure_pa,
-            ))
-        except Exception as e:
-            logger.warning(
-                "Skipping hour %d (month=%s, day=%s, hour=%s): %s",
-                idx,
-                rec.get("month"),
-                rec.get("day"),
-                rec.get("hour"),
-                e,
-            )
-            continue
-
-    return states
+    if isinstance(hourly, dict):
+        cols = {key: np.asarray(hourly[key], dtype=np.float64) for key in _FIELDS}
+    else:
+        cols = _columns_from_records(hourly)
+    tdb = cols["tdb_c"]
+    tdp = cols["tdp_c"]
+    pressure = cols["pressure_pa"]
+
+    valid = np.logical_and.reduce([np.isfinite(col) for col in cols.values()])
+    with np.errstate(invalid="ignore"):
+        valid &= (tdb >= _T_MIN_C) & (tdb <= _T_MAX_C)
+        valid &= (tdp >= _T_MIN_C) & (pressure > 0.0)
+
+    for idx in np.flatnonzero(~valid):
+        logger.warning(
+            "Skipping hour %d (month=%s, day=%s, hour=%s): invalid or out-of-range data",
+            idx,
+            cols["month"][idx],
+            cols["day"][idx],
+            cols["hour"][idx],
+        )
+
+    tdb = tdb[valid]
+    pressure = pressure[valid]
+    # Clamp dewpoint to not exceed dry-bulb (physically impossible)
+    tdp = np.minimum(tdp[valid], tdb)
+
+    # GetHumRatioFromTDewPoint / GetRelHumFromTDewPoint
+    Pv = sat_vap_pres_array(tdp, UnitSystem.SI)
+    humidity_ratio = np.maximum(0.621945 * Pv / (pressure - Pv), 1e-7)
+    rh = Pv / sat_vap_pres_array(tdb, UnitSystem.SI)
+    # GetTWetBulbFromTDewPoint
+    wet_bulb_c = wet_bulb_array(tdb, humidity_ratio, tdp, pressure, UnitSystem.SI)
+    # GetMoistAirEnthalpy / GetMoistAirVolume (SI)
+    enthalpy = (1.006 * tdb + humidity_ratio * (2501.0 + 1.86 * tdb)) * 1000.0
+    specific_volume = 287.042 * (tdb + 273.15) * (1.0 + 1.607858 * humidity_ratio) / pressure
+
+    return [
+        HourlyPsychroState(
+            month=month,
+            day=day,
+            hour=hour,
+            dry_bulb_c=t,
+            wet_bulb_c=twb,
+            dewpoint_c=td,
+            humidity_ratio=w,
+            relative_humidity=phi,
+            enthalpy_j_per_kg=h,
+            specific_volume=v,
+            pressure_pa=p,
+        )
+        for month, day, hour, t, twb, td, w, phi, h, v, p in zip(
+            cols["month"][valid].astype(np.int64).tolist(),
+            cols["day"][valid].astype(np.int64).tolist(),
+            cols["hour"][valid].astype(np.int64).tolist(),
+            tdb.tolist(),
+            wet_bulb_c.tolist(),
+            tdp.tolist(),
+            humidity_ratio.tolist(),
+            rh.tolist(),
+            enthalpy.tolist(),
+            specific_volume.tolist(),
+            pressure.tolist(),
+        )
+    ]
@@ -42,6 +42,23 @@ class CoilInput(BaseModel):
     water_entering_temp: Optional[float] = None  # °F or °C
     water_leaving_temp: Optional[float] = None   # °F or °C
 
+    def validate_for_solve(self) -> None:
+        """
+        Check that the fields required by the selected mode are present and
+        in range, without doing any psychrometric work.
+
+        Raises:
+            ValueError: If a required field is missing or out of range
+        """
+        if self.mode == CoilMode.FORWARD:
+            if self.adp_Tdb is None or self.bypass_factor is None:
+                raise ValueError("adp_Tdb and bypass_factor are required for forward mode")
+            if not (0.0 < self.bypass_factor < 1.0):
+                raise ValueError("bypass_factor must be between 0 and 1 (exclusive)")
+        elif self.mode == CoilMode.REVERSE:
+            if self.leaving_pair is None or self.leaving_values is None:
+                raise ValueError("leaving_pair and leaving_values are required for reverse mode")
+
 
 class CoilOutput(BaseModel):
     """Result of a coil analysis calculation."""
@@ -5,6 +5,7 @@ Pydantic models for psychrometric process input/output.
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP
@@ -115,3 +116,15 @@ class ProcessOutput(BaseModel):
 
     metadata: dict = Field(default_factory=dict)
     warnings: list[str] = Field(default_factory=list)
+
+    def path_array(self) -> np.ndarray:
+        """
+        path_points as a structured array with Tdb, W and W_display columns.
+
+        Built on each call for vectorized checks and never stored on the
+        model, so equality and model_copy see only the serialized fields.
+        """
+        return np.array(
+            [(p.Tdb, p.W, p.W_display) for p in self.path_points],
+            dtype=[("Tdb", "f8"), ("W", "f8"), ("W_display", "f8")],
+        )
@@ -4,6 +4,7 @@ Pydantic models for SHR (Sensible Heat Ratio) line calculations.
 
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP
@@ -36,6 +37,18 @@ class SHRLineOutput(BaseModel):
 
     warnings: list[str] = Field(default_factory=list)
 
+    def line_array(self) -> np.ndarray:
+        """
+        line_points as a structured array with Tdb, W and W_display columns.
+
+        Built on each call for vectorized checks and never stored on the
+        model, so equality and model_copy see only the serialized fields.
+        """
+        return np.array(
+            [(p.Tdb, p.W, p.W_display) for p in self.line_points],
+            dtype=[("Tdb", "f8"), ("W", "f8"), ("W_display", "f8")],
+        )
+
 
 class GSHRInput(BaseModel):
     """Input for Grand SHR (GSHR) and Effective SHR (ESHR) calculation."""
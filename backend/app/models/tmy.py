@@ -15,10 +15,19 @@ class TMYScatterPoint(BaseModel):
     month: int      # 1-12
 
 
+class TMYScatterArrays(BaseModel):
+    """Hourly data as parallel columns (one list per field), index-aligned."""
+    Tdb: list[float]
+    W_display: list[float]
+    hour: list[int]
+    month: list[int]
+
+
 class TMYProcessOutput(BaseModel):
     """Processed TMY data ready for chart overlay."""
     unit_system: UnitSystem
-    scatter_points: list[TMYScatterPoint]
+    scatter_points: list[TMYScatterPoint] = []     # empty when scatter_arrays is sent
+    scatter_arrays: Optional[TMYScatterArrays] = None
     bin_Tdb_edges: list[float]
     bin_W_edges: list[float]
     bin_matrix: list[list[int]]    # 2D grid [Tdb_bins x W_bins] of hourly counts
@@ -2,7 +2,7 @@
 Pydantic models for weather data analysis and design condition extraction.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 from app.config import UnitSystem
@@ -10,6 +10,10 @@ from app.config import UnitSystem
 
 class EPWLocation(BaseModel):
     """Location metadata extracted from EPW file header."""
+
+    # Cached per file and shared by every analysis of it, so immutable.
+    model_config = ConfigDict(frozen=True)
+
     city: str
     state: str
     country: str
@@ -21,6 +25,10 @@ class EPWLocation(BaseModel):
 
 class HourlyPsychroState(BaseModel):
     """Full psychrometric state for a single hour, stored in SI internally."""
+
+    # Cached per file and shared by every analysis of it, so immutable.
+    model_config = ConfigDict(frozen=True)
+
     month: int
     day: int
     hour: int
@@ -69,11 +77,19 @@ class WeatherChartPoint(BaseModel):
     cluster_id: int
 
 
+class WeatherChartArrays(BaseModel):
+    """Chart points as parallel columns (one list per field), index-aligned."""
+    dry_bulb: list[float]
+    humidity_ratio: list[float]  # display units
+    cluster_id: list[int]
+
+
 class WeatherAnalysisOutput(BaseModel):
     """Full result from weather analysis pipeline."""
     unit_system: UnitSystem
     location: EPWLocation
     design_points: list[DesignPoint]
     cluster_summary: list[ClusterSummary]
-    chart_data: list[WeatherChartPoint]
+    chart_data: list[WeatherChartPoint] = []     # empty when chart_arrays is sent
+    chart_arrays: Optional[WeatherChartArrays] = None
     total_hours: int
@@ -0,0 +1,44 @@
+"""
+Regenerate app/engine/_locations_data.py from app/data/design_days.json.
+
+The design day dataset ships as JSON, but load_locations() imports it as a
+Python literal so it is loaded from cached bytecode instead of being parsed
+on every process start. Run this after editing the JSON:
+
+    cd backend
+    python scripts/gen_locations.py
+"""
+
+import json
+import os
+import pprint
+
+_BACKEND = os.path.join(os.path.dirname(__file__), "..")
+_SRC = os.path.join(_BACKEND, "app", "data", "design_days.json")
+_DST = os.path.join(_BACKEND, "app", "engine", "_locations_data.py")
+
+_HEADER = '''"""
+Design day locations dataset.
+
+GENERATED by scripts/gen_locations.py from app/data/design_days.json.
+Do not edit by hand; edit the JSON and regenerate.
+"""
+
+'''
+
+
+def render() -> str:
+    """Source text of _locations_data.py for the current JSON."""
+    with open(_SRC, "r") as f:
+        locations = json.load(f)
+    body = pprint.pformat(tuple(locations), indent=1, width=100, sort_dicts=False)
+    return f"{_HEADER}LOCATIONS = {body}\n"
+
+
+def main() -> None:
+    with open(_DST, "w") as f:
+        f.write(render())
+
+
+if __name__ == "__main__":
+    main()
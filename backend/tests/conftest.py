@@ -0,0 +1,226 @@
+"""
+Shared pytest fixtures.
+"""
+
+import subprocess
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.process import _SOLVERS
+from app.config import UnitSystem
+from app.engine.processes.cooling_dehum import CoolingDehumSolver
+from app.engine.processes.evaporative import DirectEvaporativeSolver
+from app.engine.state_resolver import resolve_state_point
+from app.main import app
+from app.models.process import ProcessInput, ProcessType
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="also run tests marked slow",
+    )
+    parser.addoption(
+        "--fast", action="store_true", default=False,
+        help="skip tests that render real PDFs and stub PDF generation in the API",
+    )
+    parser.addoption(
+        "--changed", nargs="?", const="HEAD", default=None, metavar="REF",
+        help="skip PDF tests when the report sources are unchanged vs REF (default: HEAD)",
+    )
+
+
+# Sources the pdf-marked tests depend on, relative to backend/.
+_PDF_SOURCES = {
+    "app/engine/report_generator.py",
+    "app/models/report.py",
+}
+
+
+def _changed_files(ref):
+    """
+    Files that differ from ``ref`` (committed or not), relative to backend/,
+    or None if git is unavailable. Runs git from this file's directory, so
+    the result does not depend on where pytest was started.
+    """
+    here = str(Path(__file__).parent)
+    try:
+        prefix = subprocess.run(
+            ["git", "-C", here, "rev-parse", "--show-prefix"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        out = subprocess.run(
+            ["git", "-C", here, "diff", "--name-only", ref],
+            capture_output=True, text=True, check=True,
+        ).stdout
+    except OSError:
+        return None
+    except subprocess.CalledProcessError as exc:
+        raise pytest.UsageError(f"--changed {ref}: {exc.stderr.strip()}")
+    # diff paths are relative to the repository root; the prefix is tests/'s
+    # path within it
+    backend = prefix.removesuffix("tests/")
+    return {path.removeprefix(backend) for path in out.split() if path.startswith(backend)}
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: subprocess and integration tests")
+    config.addinivalue_line("markers", "pdf: renders a real PDF; skipped under --fast")
+    config.addinivalue_line("markers", "fast: closed-form checks; -m fast runs only these")
+
+
+def _check_duplicate_modules(items):
+    """
+    Fail collection when two test files share a name. tests/ is a package,
+    but a copy in a subdirectory without __init__.py still imports cleanly
+    under its bare name, so a duplicated module would silently run twice.
+    """
+    paths = {}
+    for item in items:
+        paths.setdefault(item.path.name, set()).add(item.path)
+    dupes = sorted(str(p) for same in paths.values() if len(same) > 1 for p in same)
+    if dupes:
+        raise pytest.UsageError(f"duplicate test modules: {', '.join(dupes)}")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Reject duplicated test modules, skip slow tests unless --runslow is given
+    or an -m expression names them, and skip real-PDF tests under --fast or
+    when --changed finds the report sources untouched.
+    """
+    _check_duplicate_modules(items)
+    skip_slow = not (config.getoption("--runslow") or "slow" in config.getoption("-m"))
+    skip_pdf = config.getoption("--fast")
+    unaffected = False
+    ref = config.getoption("--changed")
+    if ref is not None and not skip_pdf:
+        changed = _changed_files(ref)
+        unaffected = changed is not None and not (changed & _PDF_SOURCES)
+    for item in items:
+        if skip_slow and "slow" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason="slow; use --runslow to run"))
+        if skip_pdf and "pdf" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason="renders a PDF; skipped under --fast"))
+        elif unaffected and "pdf" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason="unaffected by diff"))
+
+
+# One throwaway state per resolver path; values no test uses, so no test
+# starts from a pre-filled cache entry
+_WARMUP_STATES = [
+    (("Tdb", "RH"), (71.0, 41.0)),
+    (("Tdb", "Twb"), (71.0, 61.0)),
+    (("Tdb", "Tdp"), (71.0, 51.0)),
+    (("Tdb", "W"), (71.0, 0.008)),
+    (("Tdb", "h"), (71.0, 26.0)),
+    (("Twb", "RH"), (61.0, 41.0)),
+    (("Tdp", "RH"), (51.0, 41.0)),
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """
+    Throwaway solves so the first real test doesn't pay first-call setup:
+    one process solve, and one state through each resolver input pair.
+    """
+    DirectEvaporativeSolver().solve(ProcessInput(
+        process_type=ProcessType.DIRECT_EVAPORATIVE,
+        unit_system="IP",
+        pressure=14.696,
+        start_point_pair=("Tdb", "RH"),
+        start_point_values=(90.0, 30.0),
+        effectiveness=0.5,
+    ))
+    for pair, values in _WARMUP_STATES:
+        resolve_state_point(pair, values, 14.696, UnitSystem.IP)
+
+
+@pytest.fixture(scope="session")
+def cooling_solver():
+    """One CoolingDehumSolver shared across the whole session (solvers are stateless)."""
+    return CoolingDehumSolver()
+
+
+@pytest.fixture(scope="session")
+def solved_cache():
+    """
+    solve(process_input) through the API's solver table, memoized for the
+    session. Keyed on the input's JSON dump, so equal inputs share one
+    entry. Callers must not mutate the returned output.
+    """
+    cache = {}
+
+    def _solve(process_input: ProcessInput):
+        key = process_input.model_dump_json()
+        if key not in cache:
+            solver = _SOLVERS[process_input.process_type]
+            cache[key] = solver.solve(process_input)
+        return cache[key]
+
+    return _solve
+
+
+@pytest.fixture(scope="session")
+def resolved_cache():
+    """
+    resolve_state_point(pair, values, pressure, unit_system), memoized for
+    the session. For tests that need a state as an input, not for tests of
+    the resolver itself. Callers must not mutate the returned state.
+    """
+    cache = {}
+
+    def _resolve(input_pair, values, pressure, unit_system, label=""):
+        key = (tuple(input_pair), tuple(values), pressure, unit_system, label)
+        if key not in cache:
+            cache[key] = resolve_state_point(input_pair, values, pressure, unit_system, label)
+        return cache[key]
+
+    return _resolve
+
+
+@pytest.fixture(scope="session")
+def start_72F_20RH_IP(resolved_cache):
+    """72°F / 20% RH at sea level, the shared steam humidification start state."""
+    return resolved_cache(("Tdb", "RH"), (72.0, 20.0), 14.696, UnitSystem.IP, "start")
+
+
+@pytest.fixture(scope="session")
+def twb_80F_30RH_IP(resolved_cache):
+    """Wet-bulb of 80°F / 30% RH at sea level, resolved once per session."""
+    return resolved_cache(("Tdb", "RH"), (80.0, 30.0), 14.696, UnitSystem.IP, "start").Twb
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the session; app startup/shutdown run once."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def fast_pdf(monkeypatch, request):
+    """Under --fast, the report route returns a stub PDF instead of rendering one."""
+    if request.config.getoption("--fast"):
+        monkeypatch.setattr(
+            "app.api.report.generate_report",
+            lambda inp: b"%PDF-1.4\n" + b"x" * 1000,
+        )
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run anyio-marked tests on asyncio; session scope allows session async fixtures."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def aclient(anyio_backend):
+    """In-process async HTTP client that calls the ASGI app directly."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
@@ -65,8 +65,10 @@ class TestCFactor:
 class TestSensibleSolveQ:
     """Solve for Qs given CFM and ΔT at sea level."""
 
-    def setup_method(self):
-        self.result = calculate_airflow(AirflowCalcInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_airflow(AirflowCalcInput(
             calc_mode=CalcMode.SOLVE_Q,
             load_type=LoadType.SENSIBLE,
             unit_system=UnitSystem.IP,
@@ -92,8 +94,10 @@ class TestSensibleSolveQ:
 class TestSensibleSolveCFM:
     """Solve for CFM given Qs and ΔT."""
 
-    def setup_method(self):
-        self.result = calculate_airflow(AirflowCalcInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_airflow(AirflowCalcInput(
             calc_mode=CalcMode.SOLVE_AIRFLOW,
             load_type=LoadType.SENSIBLE,
             unit_system=UnitSystem.IP,
@@ -110,8 +114,10 @@ class TestSensibleSolveCFM:
 class TestSensibleSolveDelta:
     """Solve for ΔT given Qs and CFM."""
 
-    def setup_method(self):
-        self.result = calculate_airflow(AirflowCalcInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_airflow(AirflowCalcInput(
             calc_mode=CalcMode.SOLVE_DELTA,
             load_type=LoadType.SENSIBLE,
             unit_system=UnitSystem.IP,
@@ -132,9 +138,11 @@ class TestSensibleSolveDelta:
 class TestRoundTrip:
     """Compute Q from airflow+delta, then solve back for each variable."""
 
-    def setup_method(self):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
         # First: solve for Q
-        self.forward = calculate_airflow(AirflowCalcInput(
+        cls.forward = calculate_airflow(AirflowCalcInput(
             calc_mode=CalcMode.SOLVE_Q,
             load_type=LoadType.SENSIBLE,
             unit_system=UnitSystem.IP,
@@ -173,10 +181,12 @@ class TestRoundTrip:
 class TestAltitudeCorrection:
     """At 5000 ft, density and C-factor are lower than sea level."""
 
-    def setup_method(self):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
         # Compute pressure at 5000 ft
         psychrolib.SetUnitSystem(psychrolib.IP)
-        self.pressure_5000 = psychrolib.GetStandardAtmPressure(5000.0)
+        cls.pressure_5000 = psychrolib.GetStandardAtmPressure(5000.0)
 
     def test_c_factor_lower_at_altitude(self):
         C_sea, _ = compute_c_factor(
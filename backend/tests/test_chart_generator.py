@@ -28,8 +28,10 @@ from app.engine.chart_generator import (
 # ---------------------------------------------------------------------------
 
 class TestSaturationCurve:
-    def setup_method(self):
-        self.points = generate_saturation_curve(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.points = generate_saturation_curve(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_has_points(self):
         assert len(self.points) > 100
@@ -65,8 +67,10 @@ class TestSaturationCurve:
 # ---------------------------------------------------------------------------
 
 class TestRhLines:
-    def setup_method(self):
-        self.lines = generate_rh_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.lines = generate_rh_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_expected_rh_values(self):
         expected = {"10", "20", "30", "40", "50", "60", "70", "80", "90"}
@@ -105,8 +109,10 @@ class TestRhLines:
 # ---------------------------------------------------------------------------
 
 class TestTwbLines:
-    def setup_method(self):
-        self.lines = generate_twb_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.lines = generate_twb_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_has_lines(self):
         assert len(self.lines) >= 8  # at least 8 Twb lines
@@ -138,8 +144,10 @@ class TestTwbLines:
 # ---------------------------------------------------------------------------
 
 class TestEnthalpyLines:
-    def setup_method(self):
-        self.lines = generate_enthalpy_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.lines = generate_enthalpy_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_has_lines(self):
         assert len(self.lines) >= 5
@@ -169,8 +177,10 @@ class TestEnthalpyLines:
 # ---------------------------------------------------------------------------
 
 class TestVolumeLines:
-    def setup_method(self):
-        self.lines = generate_volume_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.lines = generate_volume_lines(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_has_lines(self):
         assert len(self.lines) >= 3
@@ -198,8 +208,10 @@ class TestVolumeLines:
 # ---------------------------------------------------------------------------
 
 class TestFullChartData:
-    def setup_method(self):
-        self.data = generate_chart_data(DEFAULT_PRESSURE_IP, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.data = generate_chart_data(DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
     def test_has_all_sections(self):
         assert "saturation_curve" in self.data
@@ -227,8 +239,10 @@ class TestFullChartData:
 # ---------------------------------------------------------------------------
 
 class TestChartDataSI:
-    def setup_method(self):
-        self.data = generate_chart_data(DEFAULT_PRESSURE_SI, UnitSystem.SI)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.data = generate_chart_data(DEFAULT_PRESSURE_SI, UnitSystem.SI)
 
     def test_has_all_sections(self):
         assert "saturation_curve" in self.data
@@ -255,8 +269,10 @@ class TestChartDataSI:
 class TestNonStandardPressure:
     """Chart data at Denver altitude (~12.1 psia)."""
 
-    def setup_method(self):
-        self.data = generate_chart_data(12.1, UnitSystem.IP)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.data = generate_chart_data(12.1, UnitSystem.IP)
 
     def test_saturation_higher_than_sea_level(self):
         """At lower pressure, saturation W should be higher at the same Tdb."""
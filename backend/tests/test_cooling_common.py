@@ -0,0 +1,464 @@
+"""
+Shared scenarios for the two cooling & dehumidification front ends.
+
+Coil analysis (analyze_coil) and the process builder (CoolingDehumSolver) both
+implement the same ADP/bypass-factor coil model. The forward, reverse,
+round-trip, SI, and edge-case scenarios below run against both through thin
+adapters that normalize their outputs into a common ResultView.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import psychrolib
+import pytest
+from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
+from app.engine.coil import analyze_coil
+from app.engine.processes.cooling_dehum import CoolingDehumSolver
+from app.engine.processes.utils import (
+    find_adp,
+    find_adp_batch,
+    sat_hum_ratio_array,
+    set_unit_system,
+)
+from app.models.coil import CoilInput, CoilMode
+from app.models.process import ProcessInput, ProcessOutput, ProcessType, CoolingDehumMode
+
+
+def approx(value: float, rel_tol: float = 0.01, abs_tol: float = 0.1):
+    return pytest.approx(value, rel=rel_tol, abs=abs_tol)
+
+
+@dataclass
+class ResultView:
+    """Common view over CoilOutput and ProcessOutput."""
+
+    unit_system: UnitSystem
+    entering: dict
+    leaving: dict
+    adp_Tdb: float
+    bypass_factor: float
+    contact_factor: float
+    Qs: float
+    Ql: float
+    Qt: float
+    SHR: float
+    path_points: list
+    warnings: list[str] = field(default_factory=list)
+
+
+def _solve_coil(
+    mode: str,
+    entering_pair: tuple[str, str],
+    entering_values: tuple[float, float],
+    unit_system: UnitSystem = UnitSystem.IP,
+    pressure: float = DEFAULT_PRESSURE_IP,
+    adp_Tdb: float | None = None,
+    bypass_factor: float | None = None,
+    leaving_values: tuple[float, float] | None = None,
+) -> ResultView:
+    result = analyze_coil(CoilInput(
+        mode=CoilMode(mode),
+        unit_system=unit_system,
+        pressure=pressure,
+        entering_pair=entering_pair,
+        entering_values=entering_values,
+        adp_Tdb=adp_Tdb,
+        bypass_factor=bypass_factor,
+        leaving_pair=("Tdb", "RH") if leaving_values is not None else None,
+        leaving_values=leaving_values,
+    ))
+    return ResultView(
+        unit_system=result.unit_system,
+        entering=result.entering,
+        leaving=result.leaving,
+        adp_Tdb=result.adp["Tdb"],
+        bypass_factor=result.bypass_factor,
+        contact_factor=result.contact_factor,
+        Qs=result.Qs,
+        Ql=result.Ql,
+        Qt=result.Qt,
+        SHR=result.SHR,
+        path_points=result.path_points,
+        warnings=result.warnings,
+    )
+
+
+def _process_input(
+    mode: str,
+    entering_pair: tuple[str, str],
+    entering_values: tuple[float, float],
+    unit_system: UnitSystem = UnitSystem.IP,
+    pressure: float = DEFAULT_PRESSURE_IP,
+    adp_Tdb: float | None = None,
+    bypass_factor: float | None = None,
+    leaving_values: tuple[float, float] | None = None,
+) -> ProcessInput:
+    leaving_Tdb, leaving_RH = leaving_values or (None, None)
+    return ProcessInput(
+        process_type=ProcessType.COOLING_DEHUMIDIFICATION,
+        unit_system=unit_system,
+        pressure=pressure,
+        start_point_pair=entering_pair,
+        start_point_values=entering_values,
+        cooling_dehum_mode=CoolingDehumMode(mode),
+        adp_Tdb=adp_Tdb,
+        bypass_factor=bypass_factor,
+        leaving_Tdb=leaving_Tdb,
+        leaving_RH=leaving_RH,
+    )
+
+
+def _process_view(result: ProcessOutput) -> ResultView:
+    md = result.metadata
+    return ResultView(
+        unit_system=result.unit_system,
+        entering=result.start_point,
+        leaving=result.end_point,
+        adp_Tdb=md["ADP_Tdb"],
+        bypass_factor=md["BF"],
+        contact_factor=md["CF"],
+        Qs=md["Qs"],
+        Ql=md["Ql"],
+        Qt=md["Qt"],
+        SHR=md["SHR"],
+        path_points=result.path_points,
+        warnings=result.warnings,
+    )
+
+
+def _make_process_solver(solver: CoolingDehumSolver):
+    def _solve_process(mode: str, **kwargs) -> ResultView:
+        return _process_view(solver.solve(_process_input(mode, **kwargs)))
+
+    return _solve_process
+
+
+@pytest.fixture(scope="class", params=["coil", "proc"])
+def solve(request, cooling_solver):
+    if request.param == "coil":
+        return _solve_coil
+    return _make_process_solver(cooling_solver)
+
+
+@pytest.fixture(params=["coil", "proc"])
+def validate(request, cooling_solver):
+    """Run only the input-validation step of each front end."""
+    if request.param == "coil":
+        def _validate_coil(mode: str, leaving_values=None, **kwargs) -> None:
+            CoilInput(
+                mode=CoilMode(mode),
+                leaving_pair=("Tdb", "RH") if leaving_values is not None else None,
+                leaving_values=leaving_values,
+                **kwargs,
+            ).validate_for_solve()
+        return _validate_coil
+
+    def _validate_process(mode: str, **kwargs) -> None:
+        cooling_solver.validate(_process_input(mode, **kwargs))
+    return _validate_process
+
+
+# Typical summer design entering condition: 80°F db / 67°F wb
+ENTERING_IP = dict(entering_pair=("Tdb", "Twb"), entering_values=(80.0, 67.0))
+
+
+# ---------------------------------------------------------------------------
+# Forward mode: ADP + BF → leaving state
+# ---------------------------------------------------------------------------
+
+class TestForward:
+    """
+    Entering 80°F/67°F wb, ADP=45°F, BF=0.15.
+    Leaving Tdb = ADP + BF × (entering - ADP) = 45 + 0.15 × (80-45) = 50.25°F
+    """
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solve):
+        return solve("forward", **ENTERING_IP, adp_Tdb=45.0, bypass_factor=0.15)
+
+    @pytest.mark.parametrize("get, expected, abs_tol", [
+        pytest.param(lambda r: r.leaving["Tdb"], 50.25, 0.5, id="leaving_Tdb"),
+        pytest.param(lambda r: r.adp_Tdb, 45.0, 0.1, id="adp_Tdb"),
+        pytest.param(lambda r: r.bypass_factor, 0.15, 0.1, id="bypass_factor"),
+        pytest.param(lambda r: r.contact_factor, 0.85, 0.1, id="contact_factor"),
+    ])
+    def test_property(self, result, get, expected, abs_tol):
+        assert get(result) == approx(expected, abs_tol=abs_tol)
+
+    def test_leaving_w_lower(self, result):
+        """Leaving W must be lower than entering W (dehumidification occurred)."""
+        assert result.leaving["W"] < result.entering["W"]
+
+    def test_leaving_rh_high(self, result):
+        """Leaving air off a cooling coil should have high RH (typically 85-95%)."""
+        assert result.leaving["RH"] > 80.0
+
+    def test_shr_in_range(self, result):
+        assert 0.0 < result.SHR < 1.0
+
+    def test_qt_positive(self, result):
+        """Total heat should be positive (heat removed from air)."""
+        assert result.Qt > 0
+
+    def test_qs_positive(self, result):
+        assert result.Qs > 0
+
+    def test_ql_positive(self, result):
+        assert result.Ql > 0
+
+    def test_qt_equals_qs_plus_ql(self, result):
+        assert result.Qt == approx(result.Qs + result.Ql, abs_tol=0.05)
+
+    def test_path_has_intermediate_points(self, result):
+        """Path should have more than just start and end."""
+        assert len(result.path_points) >= 3
+
+    def test_no_warnings(self, result):
+        assert len(result.warnings) == 0
+
+
+# ---------------------------------------------------------------------------
+# Reverse mode: entering + leaving → ADP + BF
+# ---------------------------------------------------------------------------
+
+class TestReverse:
+    """
+    Classic textbook problem.
+    Entering: 80°F db, 67°F wb
+    Leaving: 55°F db, 90% RH (approximately 54°F wb)
+    """
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solve):
+        return solve("reverse", **ENTERING_IP, leaving_values=(55.0, 90.0))
+
+    def test_adp_tdb_reasonable(self, result):
+        """ADP should be a reasonable coil temperature, below the leaving Tdb."""
+        assert 35.0 < result.adp_Tdb < 55.0
+
+    def test_bf_in_range(self, result):
+        assert 0.0 < result.bypass_factor < 1.0
+
+    def test_bf_reasonable(self, result):
+        """Typical coil BF is 0.05-0.25."""
+        assert 0.01 <= result.bypass_factor <= 0.40
+
+    def test_cf_complement(self, result):
+        assert result.contact_factor == approx(1.0 - result.bypass_factor)
+
+    def test_shr_in_range(self, result):
+        assert 0.0 < result.SHR < 1.0
+
+    def test_leaving_tdb(self, result):
+        assert result.leaving["Tdb"] == approx(55.0)
+
+    def test_leaving_rh(self, result):
+        assert result.leaving["RH"] == approx(90.0)
+
+
+# ---------------------------------------------------------------------------
+# Round-trip consistency: forward then reverse should match
+# ---------------------------------------------------------------------------
+
+class TestRoundTrip:
+    """Forward result fed into reverse should recover the same ADP and BF."""
+
+    @pytest.fixture(scope="class", params=["coil", "proc"])
+    @classmethod
+    def pair(cls, request, cooling_solver):
+        if request.param == "proc":
+            fwd, rev = cooling_solver.round_trip_verify(
+                _process_input("forward", **ENTERING_IP, adp_Tdb=45.0, bypass_factor=0.15)
+            )
+            return _process_view(fwd), _process_view(rev)
+
+        fwd = _solve_coil("forward", **ENTERING_IP, adp_Tdb=45.0, bypass_factor=0.15)
+        rev = _solve_coil(
+            "reverse", **ENTERING_IP,
+            leaving_values=(fwd.leaving["Tdb"], fwd.leaving["RH"]),
+        )
+        return fwd, rev
+
+    def test_adp_matches(self, pair):
+        fwd, rev = pair
+        assert rev.adp_Tdb == approx(fwd.adp_Tdb, abs_tol=0.5)
+
+    def test_bf_matches(self, pair):
+        fwd, rev = pair
+        assert rev.bypass_factor == approx(fwd.bypass_factor, rel_tol=0.02, abs_tol=0.01)
+
+    def test_shr_matches(self, pair):
+        fwd, rev = pair
+        assert rev.SHR == approx(fwd.SHR, rel_tol=0.02, abs_tol=0.02)
+
+
+# ---------------------------------------------------------------------------
+# SI units
+# ---------------------------------------------------------------------------
+
+class TestSI:
+    """27°C/20°C wb entering (~80°F/68°F wb), ADP=7°C, BF=0.15."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solve):
+        return solve(
+            "forward",
+            unit_system=UnitSystem.SI,
+            pressure=DEFAULT_PRESSURE_SI,
+            entering_pair=("Tdb", "Twb"),
+            entering_values=(27.0, 20.0),
+            adp_Tdb=7.0,
+            bypass_factor=0.15,
+        )
+
+    def test_unit_system(self, result):
+        assert result.unit_system == UnitSystem.SI
+
+    def test_leaving_tdb(self, result):
+        """Leaving = 7 + 0.15 × (27-7) = 10.0°C"""
+        assert result.leaving["Tdb"] == approx(10.0, abs_tol=0.5)
+
+    def test_w_decreased(self, result):
+        assert result.leaving["W"] < result.entering["W"]
+
+    def test_qt_positive(self, result):
+        assert result.Qt > 0
+
+
+# ---------------------------------------------------------------------------
+# Edge cases and validation errors
+# ---------------------------------------------------------------------------
+
+class TestEdgeCases:
+
+    def test_forward_missing_adp(self, validate):
+        with pytest.raises(ValueError, match="adp_Tdb and bypass_factor"):
+            validate("forward", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0))
+
+    def test_forward_bf_out_of_range(self, validate):
+        with pytest.raises(ValueError, match="bypass_factor must be between 0 and 1"):
+            validate(
+                "forward", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0),
+                adp_Tdb=45.0, bypass_factor=1.5,
+            )
+
+    def test_reverse_missing_leaving(self, validate):
+        with pytest.raises(ValueError, match="are required for reverse mode"):
+            validate("reverse", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0))
+
+    def test_solve_runs_validation(self, solve):
+        with pytest.raises(ValueError, match="bypass_factor must be between 0 and 1"):
+            solve(
+                "forward", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0),
+                adp_Tdb=45.0, bypass_factor=0.0,
+            )
+
+    def test_reverse_leaving_tdb_higher_than_entering(self, solve):
+        with pytest.raises(ValueError, match="Leaving Tdb.*must be less than entering"):
+            solve(
+                "reverse", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0),
+                leaving_values=(85.0, 40.0),
+            )
+
+    def test_adp_above_dew_point_warns(self, solve):
+        """80°F/50% RH has dew point ~59°F; ADP at 65°F is above it."""
+        result = solve(
+            "forward", entering_pair=("Tdb", "RH"), entering_values=(80.0, 50.0),
+            adp_Tdb=65.0, bypass_factor=0.15,
+        )
+        assert len(result.warnings) > 0
+        assert "dew point" in result.warnings[0].lower()
+
+
+# ---------------------------------------------------------------------------
+# Batched ADP search (shared by both front ends' reverse mode)
+# ---------------------------------------------------------------------------
+
+class TestFindAdpBatch:
+    """find_adp_batch should match the scalar find_adp for every reverse case."""
+
+    # Reverse-mode scenarios as (entering pair, values, leaving pair, values).
+    # Mixed input pairs all normalize to (Tdb, W), so each unit system's
+    # cases stack into a single batch.
+    REVERSE_CASES = {
+        UnitSystem.IP: [
+            (("Tdb", "Twb"), (80.0, 67.0), ("Tdb", "RH"), (55.0, 90.0)),
+            (("Tdb", "Twb"), (80.0, 67.0), ("Tdb", "RH"), (52.0, 95.0)),
+            (("Tdb", "Twb"), (80.0, 67.0), ("Tdb", "RH"), (58.0, 85.0)),
+            (("Tdb", "Twb"), (80.0, 67.0), ("Tdb", "RH"), (50.25, 92.0)),
+            (("Tdb", "Tdp"), (80.0, 60.0), ("Tdb", "Twb"), (55.0, 54.0)),
+        ],
+        UnitSystem.SI: [
+            (("Tdb", "Twb"), (27.0, 20.0), ("Tdb", "RH"), (12.0, 90.0)),
+            (("Tdb", "Twb"), (27.0, 19.5), ("Tdb", "RH"), (10.0, 95.0)),
+            (("Tdb", "Tdp"), (27.0, 16.0), ("Tdb", "Twb"), (13.0, 12.0)),
+        ],
+    }
+    PRESSURES = {UnitSystem.IP: DEFAULT_PRESSURE_IP, UnitSystem.SI: DEFAULT_PRESSURE_SI}
+
+    @pytest.fixture(scope="class", params=[UnitSystem.IP, UnitSystem.SI], ids=["IP", "SI"])
+    @classmethod
+    def batch(cls, request, resolved_cache):
+        """Normalize every case to (Tdb, W) and solve them in one call."""
+        unit_system = request.param
+        pressure = cls.PRESSURES[unit_system]
+        cases = cls.REVERSE_CASES[unit_system]
+        entering = [resolved_cache(p, v, pressure, unit_system) for p, v, _, _ in cases]
+        leaving = [resolved_cache(p, v, pressure, unit_system) for _, _, p, v in cases]
+        adp = find_adp_batch(
+            np.array([s.Tdb for s in entering]), np.array([s.W for s in entering]),
+            np.array([s.Tdb for s in leaving]), np.array([s.W for s in leaving]),
+            pressure, unit_system,
+        )
+        return unit_system, pressure, cases, entering, leaving, adp
+
+    def test_matches_scalar(self, batch):
+        unit_system, pressure, _, entering, leaving, adp = batch
+        for got, en, lv in zip(adp, entering, leaving):
+            scalar = find_adp(en.Tdb, en.W, lv.Tdb, lv.W, pressure, unit_system)
+            assert got == pytest.approx(scalar, abs=1e-6)
+
+    def test_matches_coil_reverse(self, batch):
+        unit_system, pressure, cases, _, _, adp = batch
+        for got, (e_pair, e_vals, l_pair, l_vals) in zip(adp, cases):
+            result = analyze_coil(CoilInput(
+                mode=CoilMode.REVERSE,
+                unit_system=unit_system,
+                pressure=pressure,
+                entering_pair=e_pair,
+                entering_values=e_vals,
+                leaving_pair=l_pair,
+                leaving_values=l_vals,
+            ))
+            assert got == pytest.approx(result.adp["Tdb"], abs=1e-3)
+            assert 0.0 < result.bypass_factor < 1.0
+            assert result.Qt > 0
+
+    @pytest.mark.parametrize("unit_system, pressure, lo, hi", [
+        (UnitSystem.IP, DEFAULT_PRESSURE_IP, 20.0, 120.0),
+        (UnitSystem.SI, DEFAULT_PRESSURE_SI, -10.0, 55.0),
+    ])
+    def test_sat_hum_ratio_matches_psychrolib(self, unit_system, pressure, lo, hi):
+        Tdb = np.linspace(lo, hi, 41)
+        set_unit_system(unit_system)
+        expected = [psychrolib.GetSatHumRatio(t, pressure) for t in Tdb]
+        assert sat_hum_ratio_array(Tdb, pressure, unit_system) == pytest.approx(expected, rel=1e-12)
+
+    def test_no_intersection_raises(self):
+        with pytest.raises(ValueError, match="does not intersect"):
+            find_adp_batch(
+                [80.0], [0.0112], [70.0], [0.0200],
+                DEFAULT_PRESSURE_IP, UnitSystem.IP,
+            )
+
+    def test_newton_non_convergence_raises(self, monkeypatch):
+        monkeypatch.setattr("app.engine.processes.utils._ADP_NEWTON_MAX_ITERS", 1)
+        with pytest.raises(ValueError, match="did not converge"):
+            find_adp_batch(
+                [80.0], [0.0112], [55.0], [0.0085],
+                DEFAULT_PRESSURE_IP, UnitSystem.IP,
+            )
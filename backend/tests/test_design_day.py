@@ -2,30 +2,56 @@
 Tests for ASHRAE design day conditions engine and API.
 """
 
+import importlib.util
+import json
+import os
+
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.engine.design_day import (
     load_locations,
     search_locations,
     resolve_design_conditions,
 )
 
-client = TestClient(app)
+
+@pytest.fixture(scope="module", autouse=True)
+def locations():
+    """The bundled dataset, parsed once before the first test."""
+    return load_locations()
 
 
 # ─── Engine tests ───
 
 
 class TestLoadLocations:
-    def test_loads_nonempty(self):
-        locs = load_locations()
-        assert len(locs) > 0
+    def test_loads_nonempty(self, locations):
+        assert len(locations) > 0
+
+    def test_loaded_once(self, locations):
+        assert load_locations() is locations
+
+    def test_matches_source_json(self, locations):
+        """The generated module must be regenerated whenever the JSON changes."""
+        path = os.path.join(
+            os.path.dirname(__file__), "..", "app", "data", "design_days.json"
+        )
+        with open(path, "r") as f:
+            assert list(locations) == json.load(f)
+
+    def test_generated_module_is_current(self):
+        """_locations_data.py is exactly what scripts/gen_locations.py writes."""
+        backend = os.path.join(os.path.dirname(__file__), "..")
+        spec = importlib.util.spec_from_file_location(
+            "gen_locations", os.path.join(backend, "scripts", "gen_locations.py")
+        )
+        gen_locations = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(gen_locations)
+        with open(os.path.join(backend, "app", "engine", "_locations_data.py"), "r") as f:
+            assert f.read() == gen_locations.render()
 
-    def test_location_has_required_fields(self):
-        locs = load_locations()
-        for loc in locs:
+    def test_location_has_required_fields(self, locations):
+        for loc in locations:
             assert "name" in loc
             assert "state" in loc
             assert "country" in loc
@@ -63,6 +89,10 @@ class TestSearchLocations:
         results = search_locations("", limit=3)
         assert len(results) == 3
 
+    def test_search_name_and_state(self):
+        results = search_locations("phoenix, az")
+        assert [(r["name"], r["state"]) for r in results] == [("Phoenix", "AZ")]
+
     def test_search_no_match(self):
         results = search_locations("Zzzznotacity")
         assert len(results) == 0
@@ -162,6 +192,18 @@ class TestResolveDesignConditions:
                 unit_system="IP",
             )
 
+    def test_repeat_resolve_returns_independent_copies(self):
+        kwargs = dict(
+            location_name="Phoenix",
+            location_state="AZ",
+            condition_labels=["0.4% Cooling DB / MCWB"],
+            unit_system="IP",
+        )
+        first = resolve_design_conditions(**kwargs)
+        first["points"].clear()
+        second = resolve_design_conditions(**kwargs)
+        assert len(second["points"]) == 1
+
     def test_pressure_from_elevation_denver(self):
         """Denver is at 5331 ft, pressure should be lower than sea level."""
         result = resolve_design_conditions(
@@ -172,26 +214,45 @@ class TestResolveDesignConditions:
         )
         assert result["pressure_used"] < 14.696  # less than sea level
 
+    def test_unit_system_set_on_cache_hit(self):
+        import psychrolib
+
+        kwargs = dict(
+            location_name="Phoenix",
+            location_state="AZ",
+            condition_labels=[],
+            unit_system="IP",
+        )
+        resolve_design_conditions(**kwargs)
+        resolve_design_conditions(**{**kwargs, "unit_system": "SI"})
+        resolve_design_conditions(**kwargs)
+        assert psychrolib.isIP()
+
 
 # ─── API tests ───
 
 
+@pytest.mark.anyio
 class TestDesignDayAPI:
-    def test_search_endpoint(self):
-        resp = client.get("/api/v1/design-days/search?q=Phoenix")
+    async def test_search_endpoint(self, aclient):
+        resp = await aclient.get("/api/v1/design-days/search?q=Phoenix")
         assert resp.status_code == 200
         data = resp.json()
         assert len(data) >= 1
         assert data[0]["name"] == "Phoenix"
 
-    def test_search_endpoint_empty(self):
-        resp = client.get("/api/v1/design-days/search?q=&limit=5")
+    async def test_search_endpoint_cacheable(self, aclient):
+        resp = await aclient.get("/api/v1/design-days/search?q=Phoenix")
+        assert resp.headers["cache-control"] == "public, max-age=3600"
+
+    async def test_search_endpoint_empty(self, aclient):
+        resp = await aclient.get("/api/v1/design-days/search?q=&limit=5")
         assert resp.status_code == 200
         data = resp.json()
         assert len(data) == 5
 
-    def test_resolve_endpoint(self):
-        resp = client.post("/api/v1/design-days/resolve", json={
+    async def test_resolve_endpoint(self, aclient):
+        resp = await aclient.post("/api/v1/design-days/resolve", json={
             "location_name": "Miami",
             "location_state": "FL",
             "condition_labels": [],
@@ -202,8 +263,8 @@ class TestDesignDayAPI:
         assert data["location"]["name"] == "Miami"
         assert len(data["points"]) > 0
 
-    def test_resolve_endpoint_not_found(self):
-        resp = client.post("/api/v1/design-days/resolve", json={
+    async def test_resolve_endpoint_not_found(self, aclient):
+        resp = await aclient.post("/api/v1/design-days/resolve", json={
             "location_name": "Nonexistent",
             "condition_labels": [],
             "unit_system": "IP",
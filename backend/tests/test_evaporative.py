@@ -2,6 +2,7 @@
 Tests for evaporative cooling process solvers: direct, indirect, two-stage.
 """
 
+import numpy as np
 import pytest
 
 from app.models.process import ProcessInput, ProcessType
@@ -12,106 +13,99 @@ from app.engine.processes.evaporative import (
 )
 
 
-# ────────────────────────────────────────────────────────────────────────────
-# Direct Evaporative Cooling
-# ────────────────────────────────────────────────────────────────────────────
+# Absolute tolerances for the plain abs() comparisons below
+TOL_TDB = 0.5         # °F/°C on temperatures
+TOL_W = 1e-4          # lb/lb or kg/kg on humidity ratio
+TOL_EFF = 0.01        # effectiveness (dimensionless)
+TOL_RH = 1.0          # % RH
+TOL_NO_CHANGE = 0.1   # Tdb shift at zero effectiveness
+TOL_ROUND = 0.01      # output rounding
 
-class TestDirectEvaporative:
-    """Direct evaporative cooling at 80% effectiveness."""
 
-    @pytest.fixture()
-    def result(self):
-        solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=0.8,
-        )
-        return solver.solve(inp)
+# Fields shared by every input in this module; _mk patches in the rest.
+_IP_BASE = dict(unit_system="IP", pressure=14.696, start_point_pair=("Tdb", "RH"))
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
 
-    def test_w_increases(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+def _mk(**kw) -> ProcessInput:
+    return ProcessInput(**{**_IP_BASE, **kw})
 
-    def test_twb_constant(self, result):
-        """Wet-bulb should remain approximately constant."""
-        assert result.end_point["Twb"] == pytest.approx(
-            result.start_point["Twb"], abs=0.5
-        )
 
-    def test_effectiveness_formula(self, result):
-        """Verify ε = (Tdb_in - Tdb_out) / (Tdb_in - Twb_in)."""
-        Tdb_in = result.start_point["Tdb"]
-        Tdb_out = result.end_point["Tdb"]
-        Twb = result.start_point["Twb"]
-        computed_eff = (Tdb_in - Tdb_out) / (Tdb_in - Twb)
-        assert computed_eff == pytest.approx(0.8, abs=0.01)
+# ────────────────────────────────────────────────────────────────────────────
+# Direct Evaporative Cooling
+# ────────────────────────────────────────────────────────────────────────────
 
-    def test_rh_increases(self, result):
-        assert result.end_point["RH"] > result.start_point["RH"]
+# (unit_system, pressure, start (Tdb, RH), effectiveness)
+DEC_CASES = [
+    pytest.param(("IP", 14.696, (95.0, 20.0), 0.8), id="IP-80pct"),
+    pytest.param(("IP", 14.696, (95.0, 20.0), 1.0), id="IP-100pct"),
+    pytest.param(("SI", 101325.0, (35.0, 20.0), 0.85), id="SI-85pct"),
+]
 
-    def test_process_type(self, result):
-        assert result.process_type == ProcessType.DIRECT_EVAPORATIVE
 
-    def test_no_warnings(self, result):
-        assert len(result.warnings) == 0
+@pytest.fixture(scope="module", params=DEC_CASES)
+def dec_case(request):
+    return request.param
 
-    def test_metadata(self, result):
-        assert result.metadata["effectiveness"] == pytest.approx(0.8, abs=0.01)
-        assert result.metadata["delta_Tdb"] < 0  # cooling
 
+@pytest.fixture(scope="module")
+def dec_result(dec_case):
+    unit_system, pressure, start, effectiveness = dec_case
+    solver = DirectEvaporativeSolver()
+    inp = _mk(
+        process_type=ProcessType.DIRECT_EVAPORATIVE,
+        unit_system=unit_system,
+        pressure=pressure,
+        start_point_values=start,
+        effectiveness=effectiveness,
+    )
+    return solver.solve(inp)
 
-class TestDirectEvaporative100Pct:
-    """DEC at 100% effectiveness → saturation."""
 
-    @pytest.fixture()
-    def result(self):
-        solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=1.0,
-        )
-        return solver.solve(inp)
+class TestDirectEvaporative:
+    """Direct evaporative cooling across effectiveness levels and unit systems."""
 
-    def test_end_rh_100(self, result):
-        assert result.end_point["RH"] == pytest.approx(100.0, abs=1.0)
+    def test_tdb_decreases(self, dec_result):
+        assert dec_result.end_point["Tdb"] < dec_result.start_point["Tdb"]
 
-    def test_end_tdb_equals_twb(self, result):
-        assert result.end_point["Tdb"] == pytest.approx(
-            result.start_point["Twb"], abs=0.5
-        )
+    def test_w_increases(self, dec_result):
+        assert dec_result.end_point["W"] > dec_result.start_point["W"]
 
+    def test_twb_constant(self, dec_result):
+        """Wet-bulb should remain approximately constant."""
+        assert abs(dec_result.end_point["Twb"] - dec_result.start_point["Twb"]) <= TOL_TDB
 
-class TestDirectEvaporativeSI:
-    """DEC in SI units."""
+    def test_effectiveness_formula(self, dec_case, dec_result):
+        """Verify ε = (Tdb_in - Tdb_out) / (Tdb_in - Twb_in)."""
+        Tdb_in = dec_result.start_point["Tdb"]
+        Tdb_out = dec_result.end_point["Tdb"]
+        Twb = dec_result.start_point["Twb"]
+        computed_eff = (Tdb_in - Tdb_out) / (Tdb_in - Twb)
+        assert abs(computed_eff - dec_case[3]) <= TOL_EFF
 
-    @pytest.fixture()
-    def result(self):
-        solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.DIRECT_EVAPORATIVE,
-            unit_system="SI",
-            pressure=101325.0,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(35.0, 20.0),
-            effectiveness=0.85,
-        )
-        return solver.solve(inp)
+    def test_end_rh(self, dec_case, dec_result):
+        """RH rises; at 100% effectiveness the air leaves saturated at Twb_in."""
+        assert dec_result.end_point["RH"] > dec_result.start_point["RH"]
+        if dec_case[3] == 1.0:
+            assert abs(dec_result.end_point["RH"] - 100.0) <= TOL_RH
+            assert abs(dec_result.end_point["Tdb"] - dec_result.start_point["Twb"]) <= TOL_TDB
+        else:
+            assert dec_result.end_point["RH"] < 99.0
+
+    def test_process_type(self, dec_result):
+        assert dec_result.process_type == ProcessType.DIRECT_EVAPORATIVE
+
+    def test_unit_system(self, dec_case, dec_result):
+        assert dec_result.unit_system == dec_case[0]
+
+    def test_no_warnings(self, dec_result):
+        assert len(dec_result.warnings) == 0
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 35.0
+    def test_metadata(self, dec_case, dec_result):
+        assert abs(dec_result.metadata["effectiveness"] - dec_case[3]) <= TOL_EFF
+        assert dec_result.metadata["delta_Tdb"] < 0  # cooling
 
-    def test_unit_system(self, result):
-        assert result.unit_system == "SI"
+    def test_path_has_many_points(self, dec_result):
+        assert len(dec_result.path_points) >= 10
 
 
 class TestDirectEvaporativeEdgeCases:
@@ -119,9 +113,8 @@ class TestDirectEvaporativeEdgeCases:
 
     def test_missing_effectiveness(self):
         solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.DIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
         )
         with pytest.raises(ValueError, match="effectiveness"):
@@ -129,157 +122,107 @@ class TestDirectEvaporativeEdgeCases:
 
     def test_effectiveness_out_of_range(self):
         solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.DIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
             effectiveness=1.5,
         )
         with pytest.raises(ValueError, match="between 0 and 1"):
             solver.solve(inp)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            solver.solve_many(inp, [0.0, 1.5])
 
-    def test_zero_effectiveness(self):
-        solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=0.0,
-        )
-        result = solver.solve(inp)
-        assert result.end_point["Tdb"] == pytest.approx(95.0, abs=0.1)
-
-    def test_path_has_many_points(self):
+    def test_effectiveness_sweep(self):
+        """One shared start state, swept from no cooling to saturation."""
         solver = DirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
-            effectiveness=0.8,
         )
-        result = solver.solve(inp)
-        assert len(result.path_points) >= 10
+        zero, mid, full = solver.solve_many(inp, [0.0, 0.8, 1.0])
+        assert abs(zero.end_point["Tdb"] - 95.0) <= TOL_NO_CHANGE
+        assert abs(full.end_point["RH"] - 100.0) <= TOL_RH
+        assert zero.end_point["Tdb"] > mid.end_point["Tdb"] > full.end_point["Tdb"]
+        assert mid.end_point == solver.solve(inp.model_copy(update={"effectiveness": 0.8})).end_point
 
 
 # ────────────────────────────────────────────────────────────────────────────
 # Indirect Evaporative Cooling
 # ────────────────────────────────────────────────────────────────────────────
 
-class TestIndirectEvaporative:
-    """IEC with default secondary air (same as primary)."""
+# (unit_system, pressure, start (Tdb, RH), effectiveness, secondary (Tdb, RH) or None)
+IEC_CASES = [
+    pytest.param(("IP", 14.696, (95.0, 20.0), 0.7, None), id="IP-default-secondary"),
+    # Secondary 85°F/50% RH has a higher Twb than the primary
+    pytest.param(("IP", 14.696, (95.0, 20.0), 0.7, (85.0, 50.0)), id="IP-secondary"),
+    pytest.param(("SI", 101325.0, (35.0, 20.0), 0.7, None), id="SI-default-secondary"),
+]
 
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=0.7,
-        )
-        return solver.solve(inp)
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
+@pytest.fixture(scope="module", params=IEC_CASES)
+def iec_case(request):
+    return request.param
 
-    def test_w_constant(self, result):
-        """Indirect evap is sensible cooling — W stays constant."""
-        assert result.end_point["W"] == pytest.approx(
-            result.start_point["W"], abs=0.0001
-        )
 
-    def test_rh_increases(self, result):
-        """RH increases because Tdb drops while W stays constant."""
-        assert result.end_point["RH"] > result.start_point["RH"]
-
-    def test_process_type(self, result):
-        assert result.process_type == ProcessType.INDIRECT_EVAPORATIVE
-
-    def test_effectiveness_formula(self, result):
-        """ε = (Tdb_in - Tdb_out) / (Tdb_in - Twb_secondary)."""
-        Tdb_in = result.start_point["Tdb"]
-        Tdb_out = result.end_point["Tdb"]
-        Twb_sec = result.metadata["secondary_Twb"]
-        computed_eff = (Tdb_in - Tdb_out) / (Tdb_in - Twb_sec)
-        assert computed_eff == pytest.approx(0.7, abs=0.01)
+@pytest.fixture(scope="module")
+def iec_result(iec_case):
+    unit_system, pressure, start, effectiveness, secondary = iec_case
+    solver = IndirectEvaporativeSolver()
+    inp = _mk(
+        process_type=ProcessType.INDIRECT_EVAPORATIVE,
+        unit_system=unit_system,
+        pressure=pressure,
+        start_point_values=start,
+        effectiveness=effectiveness,
+        secondary_air_pair=("Tdb", "RH") if secondary else None,
+        secondary_air_values=secondary,
+    )
+    return solver.solve(inp)
 
-    def test_no_warnings(self, result):
-        assert len(result.warnings) == 0
 
+class TestIndirectEvaporative:
+    """IEC with the default (primary) and an explicit secondary airstream."""
 
-class TestIndirectEvaporativeWithSecondary:
-    """IEC with a different secondary airstream."""
+    def test_tdb_decreases(self, iec_result):
+        assert iec_result.end_point["Tdb"] < iec_result.start_point["Tdb"]
 
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectEvaporativeSolver()
-        # Primary: 95°F/20% RH. Secondary: 85°F/50% RH (lower Twb)
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=0.7,
-            secondary_air_pair=("Tdb", "RH"),
-            secondary_air_values=(85.0, 50.0),
-        )
-        return solver.solve(inp)
+    def test_w_constant(self, iec_result):
+        """Indirect evap is sensible cooling — W stays constant."""
+        assert abs(iec_result.end_point["W"] - iec_result.start_point["W"]) <= TOL_W
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 95.0
+    def test_rh_increases(self, iec_result):
+        """RH increases because Tdb drops while W stays constant."""
+        assert iec_result.end_point["RH"] > iec_result.start_point["RH"]
 
-    def test_w_constant(self, result):
-        assert result.end_point["W"] == pytest.approx(
-            result.start_point["W"], abs=0.0001
-        )
+    def test_process_type(self, iec_result):
+        assert iec_result.process_type == ProcessType.INDIRECT_EVAPORATIVE
 
-    def test_secondary_twb_used(self, result):
-        """The secondary Twb should be different from the primary."""
-        assert result.metadata["secondary_Twb"] != pytest.approx(
-            result.start_point["Twb"], abs=1.0
-        )
+    def test_unit_system(self, iec_case, iec_result):
+        assert iec_result.unit_system == iec_case[0]
 
-    def test_effectiveness_formula(self, result):
-        Tdb_in = result.start_point["Tdb"]
-        Tdb_out = result.end_point["Tdb"]
-        Twb_sec = result.metadata["secondary_Twb"]
+    def test_effectiveness_formula(self, iec_case, iec_result):
+        """ε = (Tdb_in - Tdb_out) / (Tdb_in - Twb_secondary)."""
+        Tdb_in = iec_result.start_point["Tdb"]
+        Tdb_out = iec_result.end_point["Tdb"]
+        Twb_sec = iec_result.metadata["secondary_Twb"]
         computed_eff = (Tdb_in - Tdb_out) / (Tdb_in - Twb_sec)
-        assert computed_eff == pytest.approx(0.7, abs=0.01)
+        assert abs(computed_eff - iec_case[3]) <= TOL_EFF
 
+    def test_secondary_twb(self, iec_case, iec_result):
+        """Without a secondary stream the primary Twb drives the wet side."""
+        shift = abs(iec_result.metadata["secondary_Twb"] - iec_result.start_point["Twb"])
+        if iec_case[4] is None:
+            assert shift <= TOL_ROUND
+        else:
+            assert shift > 1.0
 
-class TestIndirectEvaporativeSI:
-    """IEC in SI units."""
+    def test_no_warnings(self, iec_result):
+        assert len(iec_result.warnings) == 0
 
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="SI",
-            pressure=101325.0,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(35.0, 20.0),
-            effectiveness=0.7,
-        )
-        return solver.solve(inp)
-
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 35.0
-
-    def test_w_constant(self, result):
-        assert result.end_point["W"] == pytest.approx(
-            result.start_point["W"], abs=0.0001
-        )
-
-    def test_unit_system(self, result):
-        assert result.unit_system == "SI"
+    def test_horizontal_path(self, iec_result):
+        """Path should be horizontal (all points have same W)."""
+        W = iec_result.path_array()["W"]
+        assert np.allclose(W, W[0], rtol=0, atol=1e-4)
 
 
 class TestIndirectEvaporativeEdgeCases:
@@ -287,9 +230,8 @@ class TestIndirectEvaporativeEdgeCases:
 
     def test_missing_effectiveness(self):
         solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
         )
         with pytest.raises(ValueError, match="effectiveness"):
@@ -297,9 +239,8 @@ class TestIndirectEvaporativeEdgeCases:
 
     def test_effectiveness_out_of_range(self):
         solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
             effectiveness=-0.1,
         )
@@ -308,150 +249,108 @@ class TestIndirectEvaporativeEdgeCases:
 
     def test_zero_effectiveness(self):
         solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(95.0, 20.0),
             effectiveness=0.0,
         )
         result = solver.solve(inp)
-        assert result.end_point["Tdb"] == pytest.approx(95.0, abs=0.1)
-
-    def test_horizontal_path(self):
-        """Path should be horizontal (all points have same W)."""
-        solver = IndirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(95.0, 20.0),
-            effectiveness=0.7,
-        )
-        result = solver.solve(inp)
-        W_values = [p.W for p in result.path_points]
-        assert all(abs(w - W_values[0]) < 0.0001 for w in W_values)
+        assert abs(result.end_point["Tdb"] - 95.0) <= TOL_NO_CHANGE
 
 
 # ────────────────────────────────────────────────────────────────────────────
 # Indirect-Direct Two-Stage
 # ────────────────────────────────────────────────────────────────────────────
 
-class TestIndirectDirectEvaporative:
-    """Two-stage IDEC: 70% IEC then 80% DEC."""
+# (unit_system, pressure, start (Tdb, RH), iec_eff, dec_eff, secondary (Tdb, RH) or None)
+IDEC_CASES = [
+    pytest.param(("IP", 14.696, (100.0, 15.0), 0.7, 0.8, None), id="IP-70-80"),
+    pytest.param(("IP", 14.696, (100.0, 15.0), 0.6, 0.7, (85.0, 40.0)), id="IP-secondary"),
+    pytest.param(("SI", 101325.0, (40.0, 15.0), 0.7, 0.8, None), id="SI-70-80"),
+]
+
+
+@pytest.fixture(scope="module", params=IDEC_CASES)
+def idec_case(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def idec_result(idec_case):
+    unit_system, pressure, start, iec_eff, dec_eff, secondary = idec_case
+    solver = IndirectDirectEvaporativeSolver()
+    inp = _mk(
+        process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
+        unit_system=unit_system,
+        pressure=pressure,
+        start_point_values=start,
+        iec_effectiveness=iec_eff,
+        dec_effectiveness=dec_eff,
+        secondary_air_pair=("Tdb", "RH") if secondary else None,
+        secondary_air_values=secondary,
+    )
+    return solver.solve(inp)
+
+
+@pytest.fixture(scope="module")
+def idec_iec_stage(idec_case):
+    """The IEC stage alone, same entering state and secondary air."""
+    unit_system, pressure, start, iec_eff, _, secondary = idec_case
+    iec_solver = IndirectEvaporativeSolver()
+    return iec_solver.solve(_mk(
+        process_type=ProcessType.INDIRECT_EVAPORATIVE,
+        unit_system=unit_system,
+        pressure=pressure,
+        start_point_values=start,
+        effectiveness=iec_eff,
+        secondary_air_pair=("Tdb", "RH") if secondary else None,
+        secondary_air_values=secondary,
+    ))
 
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(100.0, 15.0),
-            iec_effectiveness=0.7,
-            dec_effectiveness=0.8,
-        )
-        return solver.solve(inp)
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
+class TestIndirectDirectEvaporative:
+    """Two-stage IDEC: IEC then DEC."""
+
+    def test_tdb_decreases(self, idec_result):
+        assert idec_result.end_point["Tdb"] < idec_result.start_point["Tdb"]
 
-    def test_w_increases(self, result):
+    def test_w_increases(self, idec_result):
         """DEC stage adds moisture (W increases from intermediate onward)."""
-        assert result.end_point["W"] > result.start_point["W"]
+        assert idec_result.end_point["W"] > idec_result.start_point["W"]
 
-    def test_deeper_cooling_than_either_alone(self, result):
+    def test_deeper_cooling_than_either_alone(self, idec_result, idec_iec_stage):
         """Two-stage should cool more than IEC alone."""
-        # IEC alone at 70% effectiveness
-        iec_solver = IndirectEvaporativeSolver()
-        iec_result = iec_solver.solve(ProcessInput(
-            process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(100.0, 15.0),
-            effectiveness=0.7,
-        ))
-        assert result.end_point["Tdb"] < iec_result.end_point["Tdb"]
+        assert idec_result.end_point["Tdb"] < idec_iec_stage.end_point["Tdb"]
 
-    def test_intermediate_in_metadata(self, result):
-        assert "intermediate_Tdb" in result.metadata
-        assert "intermediate_RH" in result.metadata
+    def test_intermediate_in_metadata(self, idec_result):
+        assert "intermediate_Tdb" in idec_result.metadata
+        assert "intermediate_RH" in idec_result.metadata
         # Intermediate Tdb should be between start and end
-        assert result.start_point["Tdb"] > result.metadata["intermediate_Tdb"] > result.end_point["Tdb"]
+        intermediate_Tdb = idec_result.metadata["intermediate_Tdb"]
+        assert idec_result.start_point["Tdb"] > intermediate_Tdb > idec_result.end_point["Tdb"]
+
+    def test_secondary_twb_in_metadata(self, idec_result):
+        assert "secondary_Twb" in idec_result.metadata
+
+    def test_process_type(self, idec_result):
+        assert idec_result.process_type == ProcessType.INDIRECT_DIRECT_EVAPORATIVE
 
-    def test_process_type(self, result):
-        assert result.process_type == ProcessType.INDIRECT_DIRECT_EVAPORATIVE
+    def test_unit_system(self, idec_case, idec_result):
+        assert idec_result.unit_system == idec_case[0]
 
-    def test_no_warnings(self, result):
-        assert len(result.warnings) == 0
+    def test_no_warnings(self, idec_result):
+        assert len(idec_result.warnings) == 0
 
-    def test_path_has_two_segments(self, result):
+    def test_path_has_two_segments(self, idec_result):
         """Path should have points from both IEC (horizontal) and DEC (curved)."""
-        pts = result.path_points
-        assert len(pts) >= 15  # 6 + 14 (minus 1 duplicate at junction)
+        W = idec_result.path_array()["W"]
+        assert len(W) >= 15  # 6 + 14 (minus 1 duplicate at junction)
 
         # First few points should have roughly constant W (IEC segment)
-        W_iec = [p.W for p in pts[:5]]
-        assert all(abs(w - W_iec[0]) < 0.0002 for w in W_iec)
+        assert np.allclose(W[:5], W[0], rtol=0, atol=2e-4)
 
         # Last few points should have increasing W (DEC segment)
-        W_dec = [p.W for p in pts[-5:]]
-        for i in range(1, len(W_dec)):
-            assert W_dec[i] >= W_dec[i - 1] - 1e-7
-
-
-class TestIndirectDirectWithSecondary:
-    """IDEC with a specific secondary airstream."""
-
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(100.0, 15.0),
-            iec_effectiveness=0.6,
-            dec_effectiveness=0.7,
-            secondary_air_pair=("Tdb", "RH"),
-            secondary_air_values=(85.0, 40.0),
-        )
-        return solver.solve(inp)
-
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 100.0
-
-    def test_secondary_twb_in_metadata(self, result):
-        assert "secondary_Twb" in result.metadata
-
-
-class TestIndirectDirectSI:
-    """IDEC in SI units."""
-
-    @pytest.fixture()
-    def result(self):
-        solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            unit_system="SI",
-            pressure=101325.0,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(40.0, 15.0),
-            iec_effectiveness=0.7,
-            dec_effectiveness=0.8,
-        )
-        return solver.solve(inp)
-
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 40.0
-
-    def test_unit_system(self, result):
-        assert result.unit_system == "SI"
+        assert (np.diff(W[-5:]) >= -1e-7).all()
 
 
 class TestIndirectDirectEdgeCases:
@@ -459,9 +358,8 @@ class TestIndirectDirectEdgeCases:
 
     def test_missing_iec_effectiveness(self):
         solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             dec_effectiveness=0.8,
         )
@@ -470,9 +368,8 @@ class TestIndirectDirectEdgeCases:
 
     def test_missing_dec_effectiveness(self):
         solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             iec_effectiveness=0.7,
         )
@@ -481,9 +378,8 @@ class TestIndirectDirectEdgeCases:
 
     def test_iec_effectiveness_out_of_range(self):
         solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             iec_effectiveness=1.5,
             dec_effectiveness=0.8,
@@ -494,44 +390,31 @@ class TestIndirectDirectEdgeCases:
     def test_both_zero(self):
         """Both stages at zero → no change."""
         solver = IndirectDirectEvaporativeSolver()
-        inp = ProcessInput(
+        inp = _mk(
             process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             iec_effectiveness=0.0,
             dec_effectiveness=0.0,
         )
         result = solver.solve(inp)
-        assert result.end_point["Tdb"] == pytest.approx(100.0, abs=0.1)
+        assert abs(result.end_point["Tdb"] - 100.0) <= TOL_NO_CHANGE
 
     def test_iec_only(self):
         """IEC at 70%, DEC at 0% → same as IEC alone."""
         solver_idec = IndirectDirectEvaporativeSolver()
-        result_idec = solver_idec.solve(ProcessInput(
+        result_idec = solver_idec.solve(_mk(
             process_type=ProcessType.INDIRECT_DIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             iec_effectiveness=0.7,
             dec_effectiveness=0.0,
         ))
 
         solver_iec = IndirectEvaporativeSolver()
-        result_iec = solver_iec.solve(ProcessInput(
+        result_iec = solver_iec.solve(_mk(
             process_type=ProcessType.INDIRECT_EVAPORATIVE,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
             start_point_values=(100.0, 15.0),
             effectiveness=0.7,
         ))
 
-        assert result_idec.end_point["Tdb"] == pytest.approx(
-            result_iec.end_point["Tdb"], abs=0.5
-        )
-        assert result_idec.end_point["W"] == pytest.approx(
-            result_iec.end_point["W"], abs=0.0005
-        )
+        assert abs(result_idec.end_point["Tdb"] - result_iec.end_point["Tdb"]) <= TOL_TDB
+        assert abs(result_idec.end_point["W"] - result_iec.end_point["W"]) <= 5 * TOL_W
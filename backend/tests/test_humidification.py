@@ -2,6 +2,9 @@
 Tests for humidification process solvers: steam, adiabatic, heated water spray.
 """
 
+from functools import lru_cache
+
+import numpy as np
 import pytest
 
 from app.models.process import ProcessInput, ProcessType, HumidificationMode
@@ -12,6 +15,35 @@ from app.engine.processes.humidification import (
 )
 
 
+@lru_cache(maxsize=None)
+def _steam_input(mode=None, target_rh=None, target_w=None,
+                 start_values=(72.0, 20.0), effectiveness=None):
+    """Shared steam input at sea level; callers must not mutate it."""
+    return ProcessInput(
+        process_type=ProcessType.STEAM_HUMIDIFICATION,
+        unit_system="IP",
+        pressure=14.696,
+        start_point_pair=("Tdb", "RH"),
+        start_point_values=start_values,
+        humidification_mode=mode,
+        target_RH=target_rh,
+        target_W=target_w,
+        effectiveness=effectiveness,
+    )
+
+
+@pytest.fixture(scope="class")
+def start(result):
+    """start_point of the class's shared result, looked up once per class."""
+    return result.start_point
+
+
+@pytest.fixture(scope="class")
+def end(result):
+    """end_point of the class's shared result, looked up once per class."""
+    return result.end_point
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Steam Humidification
 # ────────────────────────────────────────────────────────────────────────────
@@ -19,29 +51,25 @@ from app.engine.processes.humidification import (
 class TestSteamHumidificationTargetRH:
     """Steam humidification: target RH mode at constant Tdb."""
 
-    @pytest.fixture()
-    def result(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-            humidification_mode=HumidificationMode.TARGET_RH,
-            target_RH=50.0,
+    # Constant-Tdb checks; built once so failures still show approx's repr
+    _TDB72 = pytest.approx(72.0, abs=0.1)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, start_72F_20RH_IP):
+        return SteamHumidificationSolver().solve_from_state(
+            start_72F_20RH_IP, _steam_input(HumidificationMode.TARGET_RH, target_rh=50.0)
         )
-        return solver.solve(inp)
 
-    def test_tdb_unchanged(self, result):
-        assert result.start_point["Tdb"] == pytest.approx(72.0, abs=0.1)
-        assert result.end_point["Tdb"] == pytest.approx(72.0, abs=0.1)
+    def test_tdb_unchanged(self, start, end):
+        assert start["Tdb"] == self._TDB72
+        assert end["Tdb"] == self._TDB72
 
-    def test_w_increased(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+    def test_w_increased(self, start, end):
+        assert end["W"] > start["W"]
 
-    def test_end_rh_matches_target(self, result):
-        assert result.end_point["RH"] == pytest.approx(50.0, abs=0.5)
+    def test_end_rh_matches_target(self, end):
+        assert abs(end["RH"] - 50.0) <= 0.5
 
     def test_process_type(self, result):
         assert result.process_type == ProcessType.STEAM_HUMIDIFICATION
@@ -51,44 +79,50 @@ class TestSteamHumidificationTargetRH:
 
     def test_path_is_vertical(self, result):
         """All path points should have the same Tdb."""
-        tdbs = [p.Tdb for p in result.path_points]
-        assert all(abs(t - tdbs[0]) < 0.01 for t in tdbs)
+        tdbs = result.path_array()["Tdb"]
+        assert np.abs(tdbs - tdbs[0]).max() < 0.01
+
+    def test_equality_after_path_array(self, result):
+        result.path_array()
+        assert result == result.model_copy()
 
     def test_metadata_present(self, result):
         assert "delta_W" in result.metadata
         assert "delta_h" in result.metadata
         assert result.metadata["delta_W"] > 0
 
+    def test_matches_solve(self, result):
+        inp = _steam_input(HumidificationMode.TARGET_RH, target_rh=50.0)
+        assert SteamHumidificationSolver().solve(inp) == result
+
 
 class TestSteamHumidificationTargetW:
     """Steam humidification: target W mode."""
 
-    @pytest.fixture()
-    def result(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            unit_system="IP",
-            pressure=14.696,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-            humidification_mode=HumidificationMode.TARGET_W,
-            target_W=0.008,
+    _TDB72 = pytest.approx(72.0, abs=0.1)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, start_72F_20RH_IP):
+        return SteamHumidificationSolver().solve_from_state(
+            start_72F_20RH_IP, _steam_input(HumidificationMode.TARGET_W, target_w=0.008)
         )
-        return solver.solve(inp)
 
-    def test_end_w_matches_target(self, result):
-        assert result.end_point["W"] == pytest.approx(0.008, abs=0.0001)
+    def test_end_w_matches_target(self, end):
+        assert abs(end["W"] - 0.008) <= 0.0001
 
-    def test_tdb_constant(self, result):
-        assert result.end_point["Tdb"] == pytest.approx(72.0, abs=0.1)
+    def test_tdb_constant(self, end):
+        assert end["Tdb"] == self._TDB72
 
 
 class TestSteamHumidificationSI:
     """Steam humidification in SI units."""
 
-    @pytest.fixture()
-    def result(self):
+    _TDB22 = pytest.approx(22.0, abs=0.1)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = SteamHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.STEAM_HUMIDIFICATION,
@@ -101,11 +135,11 @@ class TestSteamHumidificationSI:
         )
         return solver.solve(inp)
 
-    def test_tdb_constant(self, result):
-        assert result.end_point["Tdb"] == pytest.approx(22.0, abs=0.1)
+    def test_tdb_constant(self, end):
+        assert end["Tdb"] == self._TDB22
 
-    def test_w_increased(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+    def test_w_increased(self, start, end):
+        assert end["W"] > start["W"]
 
     def test_unit_system(self, result):
         assert result.unit_system == "SI"
@@ -114,64 +148,24 @@ class TestSteamHumidificationSI:
 class TestSteamHumidificationEdgeCases:
     """Edge cases for steam humidification."""
 
-    def test_missing_mode(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-        )
-        with pytest.raises(ValueError, match="humidification_mode"):
-            solver.solve(inp)
-
-    def test_missing_target_rh(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-            humidification_mode=HumidificationMode.TARGET_RH,
-        )
-        with pytest.raises(ValueError, match="target_RH"):
-            solver.solve(inp)
-
-    def test_missing_target_w(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-            humidification_mode=HumidificationMode.TARGET_W,
-        )
-        with pytest.raises(ValueError, match="target_W"):
-            solver.solve(inp)
+    @pytest.mark.parametrize("kwargs, match", [
+        ({}, "humidification_mode"),
+        ({"mode": HumidificationMode.TARGET_RH}, "target_RH"),
+        ({"mode": HumidificationMode.TARGET_W}, "target_W"),
+        ({"mode": HumidificationMode.EFFECTIVENESS, "effectiveness": 0.5}, "Unsupported"),
+    ])
+    def test_invalid_input(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            SteamHumidificationSolver().solve(_steam_input(**kwargs))
 
     def test_dehumidification_warning(self):
         """Target W below start W should produce a warning."""
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 50.0),
-            humidification_mode=HumidificationMode.TARGET_RH,
-            target_RH=20.0,
-        )
-        result = solver.solve(inp)
+        result = SteamHumidificationSolver().solve(_steam_input(
+            HumidificationMode.TARGET_RH, target_rh=20.0, start_values=(72.0, 50.0),
+        ))
         assert len(result.warnings) > 0
         assert "dehumidification" in result.warnings[0].lower()
 
-    def test_invalid_mode_for_steam(self):
-        solver = SteamHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.STEAM_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(72.0, 20.0),
-            humidification_mode=HumidificationMode.EFFECTIVENESS,
-            effectiveness=0.5,
-        )
-        with pytest.raises(ValueError, match="Unsupported"):
-            solver.solve(inp)
-
 
 # ────────────────────────────────────────────────────────────────────────────
 # Adiabatic Humidification
@@ -180,8 +174,9 @@ class TestSteamHumidificationEdgeCases:
 class TestAdiabaticHumidificationEffectiveness:
     """Adiabatic humidification with effectiveness mode."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = AdiabaticHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
@@ -194,25 +189,23 @@ class TestAdiabaticHumidificationEffectiveness:
         )
         return solver.solve(inp)
 
-    def test_tdb_decreases(self, result):
+    def test_tdb_decreases(self, start, end):
         """Adiabatic humidification cools the air (Tdb drops)."""
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
+        assert end["Tdb"] < start["Tdb"]
 
-    def test_w_increases(self, result):
+    def test_w_increases(self, start, end):
         """Humidity ratio increases."""
-        assert result.end_point["W"] > result.start_point["W"]
+        assert end["W"] > start["W"]
 
-    def test_twb_approximately_constant(self, result):
+    def test_twb_approximately_constant(self, start, end):
         """Wet-bulb should remain approximately constant."""
-        assert result.end_point["Twb"] == pytest.approx(
-            result.start_point["Twb"], abs=0.5
-        )
+        assert abs(end["Twb"] - start["Twb"]) <= 0.5
 
     def test_effectiveness_in_metadata(self, result):
-        assert result.metadata["effectiveness"] == pytest.approx(0.8, abs=0.01)
+        assert abs(result.metadata["effectiveness"] - 0.8) <= 0.01
 
-    def test_rh_increases(self, result):
-        assert result.end_point["RH"] > result.start_point["RH"]
+    def test_rh_increases(self, start, end):
+        assert end["RH"] > start["RH"]
 
     def test_process_type(self, result):
         assert result.process_type == ProcessType.ADIABATIC_HUMIDIFICATION
@@ -220,20 +213,21 @@ class TestAdiabaticHumidificationEffectiveness:
     def test_no_warnings(self, result):
         assert len(result.warnings) == 0
 
-    def test_effectiveness_formula(self, result):
+    def test_effectiveness_formula(self, start, end):
         """Verify ε = (Tdb_in - Tdb_out) / (Tdb_in - Twb_in)."""
-        start_Tdb = result.start_point["Tdb"]
-        end_Tdb = result.end_point["Tdb"]
-        Twb = result.start_point["Twb"]
+        start_Tdb = start["Tdb"]
+        end_Tdb = end["Tdb"]
+        Twb = start["Twb"]
         computed_eff = (start_Tdb - end_Tdb) / (start_Tdb - Twb)
-        assert computed_eff == pytest.approx(0.8, abs=0.01)
+        assert abs(computed_eff - 0.8) <= 0.01
 
 
 class TestAdiabaticHumidification100Percent:
     """Adiabatic humidification at 100% effectiveness → saturation."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = AdiabaticHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
@@ -246,20 +240,19 @@ class TestAdiabaticHumidification100Percent:
         )
         return solver.solve(inp)
 
-    def test_end_rh_is_100(self, result):
-        assert result.end_point["RH"] == pytest.approx(100.0, abs=1.0)
+    def test_end_rh_is_100(self, end):
+        assert abs(end["RH"] - 100.0) <= 1.0
 
-    def test_end_tdb_equals_twb(self, result):
-        assert result.end_point["Tdb"] == pytest.approx(
-            result.start_point["Twb"], abs=0.5
-        )
+    def test_end_tdb_equals_twb(self, start, end):
+        assert abs(end["Tdb"] - start["Twb"]) <= 0.5
 
 
 class TestAdiabaticHumidificationTargetRH:
     """Adiabatic humidification with target RH mode."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = AdiabaticHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
@@ -272,23 +265,22 @@ class TestAdiabaticHumidificationTargetRH:
         )
         return solver.solve(inp)
 
-    def test_end_rh_matches_target(self, result):
-        assert result.end_point["RH"] == pytest.approx(70.0, abs=1.0)
+    def test_end_rh_matches_target(self, end):
+        assert abs(end["RH"] - 70.0) <= 1.0
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
+    def test_tdb_decreases(self, start, end):
+        assert end["Tdb"] < start["Tdb"]
 
-    def test_twb_approximately_constant(self, result):
-        assert result.end_point["Twb"] == pytest.approx(
-            result.start_point["Twb"], abs=0.5
-        )
+    def test_twb_approximately_constant(self, start, end):
+        assert abs(end["Twb"] - start["Twb"]) <= 0.5
 
 
 class TestAdiabaticHumidificationSI:
     """Adiabatic humidification in SI units."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = AdiabaticHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
@@ -301,11 +293,11 @@ class TestAdiabaticHumidificationSI:
         )
         return solver.solve(inp)
 
-    def test_tdb_decreases(self, result):
-        assert result.end_point["Tdb"] < 30.0
+    def test_tdb_decreases(self, end):
+        assert end["Tdb"] < 30.0
 
-    def test_w_increases(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+    def test_w_increases(self, start, end):
+        assert end["W"] > start["W"]
 
     def test_unit_system(self, result):
         assert result.unit_system == "SI"
@@ -314,49 +306,21 @@ class TestAdiabaticHumidificationSI:
 class TestAdiabaticHumidificationEdgeCases:
     """Edge cases for adiabatic humidification."""
 
-    def test_missing_mode(self):
-        solver = AdiabaticHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(80.0, 30.0),
-        )
-        with pytest.raises(ValueError, match="humidification_mode"):
-            solver.solve(inp)
-
-    def test_missing_effectiveness(self):
+    @pytest.mark.parametrize("start_values, kwargs, match", [
+        ((80.0, 30.0), {}, "humidification_mode"),
+        ((80.0, 30.0), {"humidification_mode": HumidificationMode.EFFECTIVENESS}, "effectiveness"),
+        ((80.0, 30.0), {"humidification_mode": HumidificationMode.EFFECTIVENESS, "effectiveness": 1.5}, "between 0 and 1"),
+        ((80.0, 50.0), {"humidification_mode": HumidificationMode.TARGET_RH, "target_RH": 30.0}, "must be greater"),
+    ])
+    def test_invalid_input(self, start_values, kwargs, match):
         solver = AdiabaticHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
             start_point_pair=("Tdb", "RH"),
-            start_point_values=(80.0, 30.0),
-            humidification_mode=HumidificationMode.EFFECTIVENESS,
+            start_point_values=start_values,
+            **kwargs,
         )
-        with pytest.raises(ValueError, match="effectiveness"):
-            solver.solve(inp)
-
-    def test_effectiveness_out_of_range(self):
-        solver = AdiabaticHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(80.0, 30.0),
-            humidification_mode=HumidificationMode.EFFECTIVENESS,
-            effectiveness=1.5,
-        )
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            solver.solve(inp)
-
-    def test_target_rh_below_current(self):
-        solver = AdiabaticHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.ADIABATIC_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(80.0, 50.0),
-            humidification_mode=HumidificationMode.TARGET_RH,
-            target_RH=30.0,
-        )
-        with pytest.raises(ValueError, match="must be greater"):
+        with pytest.raises(ValueError, match=match):
             solver.solve(inp)
 
     def test_zero_effectiveness(self):
@@ -370,8 +334,8 @@ class TestAdiabaticHumidificationEdgeCases:
             effectiveness=0.0,
         )
         result = solver.solve(inp)
-        assert result.end_point["Tdb"] == pytest.approx(80.0, abs=0.1)
-        assert result.end_point["W"] == pytest.approx(result.start_point["W"], abs=0.0001)
+        assert abs(result.end_point["Tdb"] - 80.0) <= 0.1
+        assert abs(result.end_point["W"] - result.start_point["W"]) <= 0.0001
 
     def test_path_is_curved(self):
         """Path along constant Twb should not be a straight line."""
@@ -386,12 +350,11 @@ class TestAdiabaticHumidificationEdgeCases:
             effectiveness=0.9,
         )
         result = solver.solve(inp)
-        pts = result.path_points
-        assert len(pts) > 10
+        W = result.path_array()["W"]
+        assert len(W) > 10
 
         # Check that W values are monotonically increasing
-        for i in range(1, len(pts)):
-            assert pts[i].W >= pts[i - 1].W - 1e-7
+        assert (np.diff(W) >= -1e-7).all()
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -401,8 +364,9 @@ class TestAdiabaticHumidificationEdgeCases:
 class TestHeatedWaterHumidification:
     """Heated water spray: water temp above Twb (both Tdb and W increase)."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = HeatedWaterHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
@@ -415,29 +379,30 @@ class TestHeatedWaterHumidification:
         )
         return solver.solve(inp)
 
-    def test_tdb_increases(self, result):
+    def test_tdb_increases(self, start, end):
         """With hot water (140°F > 70°F), Tdb should increase."""
-        assert result.end_point["Tdb"] > result.start_point["Tdb"]
+        assert end["Tdb"] > start["Tdb"]
 
-    def test_w_increases(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+    def test_w_increases(self, start, end):
+        assert end["W"] > start["W"]
 
-    def test_rh_increases(self, result):
-        assert result.end_point["RH"] > result.start_point["RH"]
+    def test_rh_increases(self, start, end):
+        assert end["RH"] > start["RH"]
 
     def test_process_type(self, result):
         assert result.process_type == ProcessType.HEATED_WATER_HUMIDIFICATION
 
     def test_metadata(self, result):
-        assert result.metadata["effectiveness"] == pytest.approx(0.5, abs=0.01)
-        assert result.metadata["water_temperature"] == pytest.approx(140.0, abs=0.1)
+        assert abs(result.metadata["effectiveness"] - 0.5) <= 0.01
+        assert abs(result.metadata["water_temperature"] - 140.0) <= 0.1
 
 
 class TestHeatedWaterColdWater:
     """Heated water spray with cold water (below Twb but above Tdp)."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = HeatedWaterHumidificationSolver()
         # Start: 90°F / 30% RH → Twb ≈ 70°F, Tdp ≈ 55°F
         # Water at 65°F (above Tdp, below Twb) — still humidifies
@@ -452,13 +417,13 @@ class TestHeatedWaterColdWater:
         )
         return solver.solve(inp)
 
-    def test_tdb_decreases(self, result):
+    def test_tdb_decreases(self, start, end):
         """Cold water spray should cool the air."""
-        assert result.end_point["Tdb"] < result.start_point["Tdb"]
+        assert end["Tdb"] < start["Tdb"]
 
-    def test_w_increases(self, result):
+    def test_w_increases(self, start, end):
         """Water above dew point still adds moisture (W_sat at 65°F > W_entering)."""
-        assert result.end_point["W"] > result.start_point["W"]
+        assert end["W"] > start["W"]
 
 
 class TestHeatedWaterVeryColdWater:
@@ -486,20 +451,9 @@ class TestHeatedWaterVeryColdWater:
 class TestHeatedWaterAtTwb:
     """Heated water at Twb should approximate adiabatic humidification."""
 
-    def test_similar_to_adiabatic(self):
+    def test_similar_to_adiabatic(self, twb_80F_30RH_IP):
         # Start: 80°F, 30% RH → Twb ≈ 60°F
         # Water at Twb (~60°F)
-        from app.engine.state_resolver import resolve_state_point
-
-        start = resolve_state_point(
-            input_pair=("Tdb", "RH"),
-            values=(80.0, 30.0),
-            pressure=14.696,
-            unit_system="IP",
-            label="start",
-        )
-        Twb = start.Twb
-
         hw_solver = HeatedWaterHumidificationSolver()
         hw_inp = ProcessInput(
             process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
@@ -508,7 +462,7 @@ class TestHeatedWaterAtTwb:
             start_point_pair=("Tdb", "RH"),
             start_point_values=(80.0, 30.0),
             effectiveness=0.7,
-            water_temperature=Twb,
+            water_temperature=twb_80F_30RH_IP,
         )
         hw_result = hw_solver.solve(hw_inp)
 
@@ -525,19 +479,16 @@ class TestHeatedWaterAtTwb:
         ad_result = ad_solver.solve(ad_inp)
 
         # End points should be very close
-        assert hw_result.end_point["Tdb"] == pytest.approx(
-            ad_result.end_point["Tdb"], abs=0.5
-        )
-        assert hw_result.end_point["W"] == pytest.approx(
-            ad_result.end_point["W"], abs=0.0005
-        )
+        assert abs(hw_result.end_point["Tdb"] - ad_result.end_point["Tdb"]) <= 0.5
+        assert abs(hw_result.end_point["W"] - ad_result.end_point["W"]) <= 0.0005
 
 
 class TestHeatedWaterSI:
     """Heated water spray in SI units."""
 
-    @pytest.fixture()
-    def result(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls):
         solver = HeatedWaterHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
@@ -550,11 +501,11 @@ class TestHeatedWaterSI:
         )
         return solver.solve(inp)
 
-    def test_tdb_increases(self, result):
-        assert result.end_point["Tdb"] > 22.0
+    def test_tdb_increases(self, end):
+        assert end["Tdb"] > 22.0
 
-    def test_w_increases(self, result):
-        assert result.end_point["W"] > result.start_point["W"]
+    def test_w_increases(self, start, end):
+        assert end["W"] > start["W"]
 
     def test_unit_system(self, result):
         assert result.unit_system == "SI"
@@ -563,38 +514,20 @@ class TestHeatedWaterSI:
 class TestHeatedWaterEdgeCases:
     """Edge cases for heated water spray."""
 
-    def test_missing_effectiveness(self):
-        solver = HeatedWaterHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(70.0, 30.0),
-            water_temperature=140.0,
-        )
-        with pytest.raises(ValueError, match="effectiveness"):
-            solver.solve(inp)
-
-    def test_missing_water_temperature(self):
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"water_temperature": 140.0}, "effectiveness"),
+        ({"effectiveness": 0.5}, "water_temperature"),
+        ({"effectiveness": 1.5, "water_temperature": 140.0}, "between 0 and 1"),
+    ])
+    def test_invalid_input(self, kwargs, match):
         solver = HeatedWaterHumidificationSolver()
         inp = ProcessInput(
             process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
             start_point_pair=("Tdb", "RH"),
             start_point_values=(70.0, 30.0),
-            effectiveness=0.5,
+            **kwargs,
         )
-        with pytest.raises(ValueError, match="water_temperature"):
-            solver.solve(inp)
-
-    def test_effectiveness_out_of_range(self):
-        solver = HeatedWaterHumidificationSolver()
-        inp = ProcessInput(
-            process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(70.0, 30.0),
-            effectiveness=1.5,
-            water_temperature=140.0,
-        )
-        with pytest.raises(ValueError, match="between 0 and 1"):
+        with pytest.raises(ValueError, match=match):
             solver.solve(inp)
 
     def test_zero_effectiveness(self):
@@ -610,7 +543,99 @@ class TestHeatedWaterEdgeCases:
             water_temperature=140.0,
         )
         result = solver.solve(inp)
-        assert result.end_point["Tdb"] == pytest.approx(70.0, abs=0.1)
-        assert result.end_point["W"] == pytest.approx(
-            result.start_point["W"], abs=0.0001
-        )
+        assert abs(result.end_point["Tdb"] - 70.0) <= 0.1
+        assert abs(result.end_point["W"] - result.start_point["W"]) <= 0.0001
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Batch solves
+# ────────────────────────────────────────────────────────────────────────────
+
+# (unit_system, pressure, Tdb, RH, target_RH) steam cases
+STEAM_BATCH_CASES = [
+    ("IP", 14.696, [72.0, 72.0, 60.0, 85.0, 40.0], [20.0, 50.0, 10.0, 30.0, 40.0],
+     [50.0, 20.0, 60.0, 45.0, 90.0]),
+    ("SI", 101325.0, [22.0, 22.0, 15.0, 30.0, 5.0], [20.0, 50.0, 10.0, 30.0, 40.0],
+     [50.0, 20.0, 60.0, 45.0, 90.0]),
+]
+
+# (unit_system, pressure, Tdb, RH, effectiveness, water_temperature) heated-water cases
+HEATED_WATER_BATCH_CASES = [
+    ("IP", 14.696, [70.0, 90.0, 90.0, 80.0, 55.0], [30.0, 30.0, 30.0, 30.0, 60.0],
+     [0.5, 0.5, 0.5, 0.7, 0.0], [140.0, 65.0, 45.0, 60.0, 120.0]),
+    ("SI", 101325.0, [22.0, 32.0, 32.0, 27.0, 13.0], [30.0, 30.0, 30.0, 30.0, 60.0],
+     [0.5, 0.5, 0.5, 0.7, 0.0], [60.0, 18.0, 7.0, 15.0, 50.0]),
+]
+
+
+class TestSteamSolveBatch:
+    """solve_batch must reproduce the leaving state of per-case solve() calls."""
+
+    @pytest.mark.parametrize("unit_system, pressure, Tdb, RH, targets", STEAM_BATCH_CASES)
+    def test_batch_matches_scalar(self, unit_system, pressure, Tdb, RH, targets):
+        solver = SteamHumidificationSolver()
+        end_Tdb, end_W = solver.solve_batch(
+            Tdb, pressure, unit_system, HumidificationMode.TARGET_RH, targets,
+        )
+        for i, (t, rh, target) in enumerate(zip(Tdb, RH, targets)):
+            result = solver.solve(ProcessInput(
+                process_type=ProcessType.STEAM_HUMIDIFICATION,
+                unit_system=unit_system,
+                pressure=pressure,
+                start_point_pair=("Tdb", "RH"),
+                start_point_values=(t, rh),
+                humidification_mode=HumidificationMode.TARGET_RH,
+                target_RH=target,
+            ))
+            assert abs(end_Tdb[i] - result.end_point["Tdb"]) <= 1e-4
+            assert abs(end_W[i] - result.end_point["W"]) <= 1e-7
+
+    def test_target_w(self):
+        end_Tdb, end_W = SteamHumidificationSolver().solve_batch(
+            [72.0, 60.0], 14.696, "IP",
+            HumidificationMode.TARGET_W, [0.008, 0.006],
+        )
+        assert np.array_equal(end_Tdb, [72.0, 60.0])
+        assert np.array_equal(end_W, [0.008, 0.006])
+
+    def test_invalid_target_rh(self):
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            SteamHumidificationSolver().solve_batch(
+                [72.0], 14.696, "IP", HumidificationMode.TARGET_RH, [120.0],
+            )
+
+    def test_unsupported_mode(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            SteamHumidificationSolver().solve_batch(
+                [72.0], 14.696, "IP", HumidificationMode.EFFECTIVENESS, [0.5],
+            )
+
+
+class TestHeatedWaterSolveBatch:
+    """solve_batch must reproduce the leaving state of per-case solve() calls."""
+
+    @pytest.mark.parametrize(
+        "unit_system, pressure, Tdb, RH, eff, T_water", HEATED_WATER_BATCH_CASES
+    )
+    def test_batch_matches_scalar(self, unit_system, pressure, Tdb, RH, eff, T_water):
+        solver = HeatedWaterHumidificationSolver()
+        end_Tdb, end_W = solver.solve_batch(Tdb, RH, pressure, unit_system, eff, T_water)
+        for i, (t, rh, e, tw) in enumerate(zip(Tdb, RH, eff, T_water)):
+            result = solver.solve(ProcessInput(
+                process_type=ProcessType.HEATED_WATER_HUMIDIFICATION,
+                unit_system=unit_system,
+                pressure=pressure,
+                start_point_pair=("Tdb", "RH"),
+                start_point_values=(t, rh),
+                effectiveness=e,
+                water_temperature=tw,
+            ))
+            assert abs(end_Tdb[i] - result.end_point["Tdb"]) <= 1e-4
+            # Scalar solve blends the 7-decimal rounded start/saturation W
+            assert abs(end_W[i] - result.end_point["W"]) <= 2e-7
+
+    def test_effectiveness_out_of_range(self):
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            HeatedWaterHumidificationSolver().solve_batch(
+                [70.0], [30.0], 14.696, "IP", [1.5], [140.0],
+            )
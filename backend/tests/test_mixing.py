@@ -5,23 +5,30 @@ Covers basic mixing, equal mixing, extreme fractions, lever rule verification,
 metadata correctness, SI units, edge cases, and validation errors.
 """
 
+from functools import lru_cache, partial
+
+import psychrolib
 import pytest
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
-from app.engine.processes.mixing import MixingSolver
+from app.engine.processes.mixing import MixingSolver, _compute_mix
 from app.models.process import ProcessInput, ProcessType
 
 
-def approx(value: float, rel_tol: float = 0.01, abs_tol: float = 0.1):
-    return pytest.approx(value, rel=rel_tol, abs=abs_tol)
+approx = partial(pytest.approx, rel=0.01, abs=0.1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def solver():
     return MixingSolver()
 
 
+@lru_cache(maxsize=None)
 def _make_input(**overrides):
-    """Helper to build a ProcessInput for mixing with sensible defaults."""
+    """
+    Helper to build a ProcessInput for mixing with sensible defaults.
+
+    Memoized per overrides; callers must not mutate the shared input.
+    """
     defaults = dict(
         process_type=ProcessType.ADIABATIC_MIXING,
         unit_system=UnitSystem.IP,
@@ -36,42 +43,49 @@ def _make_input(**overrides):
     return ProcessInput(**defaults)
 
 
+@pytest.fixture(scope="module")
+def solved(solved_cache):
+    """Session-cached solve(_make_input(**overrides))."""
+    return lambda **overrides: solved_cache(_make_input(**overrides))
+
+
 # ---------------------------------------------------------------------------
 # Basic mixing: 30% OA at 95°F/75wb + 70% RA at 75°F/50%RH
 # ---------------------------------------------------------------------------
 
 class TestBasicMixing:
 
-    def setup_method(self):
-        solver = MixingSolver()
-        self.result = solver.solve(_make_input())
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solved):
+        return solved(mixing_fraction=0.30)
 
-    def test_process_type(self):
-        assert self.result.process_type == ProcessType.ADIABATIC_MIXING
+    def test_process_type(self, result):
+        assert result.process_type == ProcessType.ADIABATIC_MIXING
 
-    def test_mixed_tdb(self):
+    def test_mixed_tdb(self, result):
         """30% of 95 + 70% of 75 = 81°F (approximately, exact via enthalpy)."""
-        assert self.result.end_point["Tdb"] == approx(81.0, abs_tol=1.0)
+        assert result.end_point["Tdb"] == approx(81.0, abs=1.0)
 
-    def test_mixed_w_between_streams(self):
+    def test_mixed_w_between_streams(self, result):
         """Mixed W should be between stream 1 W and stream 2 W."""
-        W_1 = self.result.start_point["W"]
-        W_2 = self.result.metadata["stream2"]["W"]
-        W_mix = self.result.end_point["W"]
+        W_1 = result.start_point["W"]
+        W_2 = result.metadata["stream2"]["W"]
+        W_mix = result.end_point["W"]
         assert min(W_1, W_2) <= W_mix <= max(W_1, W_2)
 
-    def test_mixed_h_between_streams(self):
+    def test_mixed_h_between_streams(self, result):
         """Mixed h should be between stream 1 h and stream 2 h."""
-        h_1 = self.result.start_point["h"]
-        h_2 = self.result.metadata["stream2"]["h"]
-        h_mix = self.result.end_point["h"]
+        h_1 = result.start_point["h"]
+        h_2 = result.metadata["stream2"]["h"]
+        h_mix = result.end_point["h"]
         assert min(h_1, h_2) <= h_mix <= max(h_1, h_2)
 
-    def test_path_has_points(self):
-        assert len(self.result.path_points) >= 3
+    def test_path_has_points(self, result):
+        assert len(result.path_points) >= 3
 
-    def test_no_warnings(self):
-        assert len(self.result.warnings) == 0
+    def test_no_warnings(self, result):
+        assert len(result.warnings) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -80,30 +94,20 @@ class TestBasicMixing:
 
 class TestEqualMixing:
 
-    def setup_method(self):
-        solver = MixingSolver()
-        self.result = solver.solve(_make_input(mixing_fraction=0.50))
-
-    def test_mixed_tdb_is_midpoint(self):
-        """50/50 mix → Tdb_mix ≈ average of Tdb_1 and Tdb_2."""
-        Tdb_1 = self.result.start_point["Tdb"]
-        Tdb_2 = self.result.metadata["stream2"]["Tdb"]
-        expected_mid = (Tdb_1 + Tdb_2) / 2
-        assert self.result.end_point["Tdb"] == approx(expected_mid, abs_tol=0.5)
-
-    def test_mixed_w_is_midpoint(self):
-        W_1 = self.result.start_point["W"]
-        W_2 = self.result.metadata["stream2"]["W"]
-        W_mix = self.result.end_point["W"]
-        expected = (W_1 + W_2) / 2
-        assert W_mix == approx(expected, rel_tol=0.001, abs_tol=0.0001)
-
-    def test_mixed_h_is_midpoint(self):
-        h_1 = self.result.start_point["h"]
-        h_2 = self.result.metadata["stream2"]["h"]
-        h_mix = self.result.end_point["h"]
-        expected = (h_1 + h_2) / 2
-        assert h_mix == approx(expected, rel_tol=0.001, abs_tol=0.05)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solved):
+        return solved(mixing_fraction=0.50)
+
+    @pytest.mark.parametrize("key, rel, abs_", [
+        ("Tdb", 0.01, 0.5),
+        ("W", 0.001, 0.0001),
+        ("h", 0.001, 0.05),
+    ])
+    def test_mixed_is_midpoint(self, result, key, rel, abs_):
+        """50/50 mix → each property ≈ average of the two streams."""
+        expected = (result.start_point[key] + result.metadata["stream2"][key]) / 2
+        assert result.end_point[key] == approx(expected, rel=rel, abs=abs_)
 
 
 # ---------------------------------------------------------------------------
@@ -112,17 +116,17 @@ class TestEqualMixing:
 
 class TestExtremeFractions:
 
-    def test_high_fraction_near_stream1(self):
-        solver = MixingSolver()
-        result = solver.solve(_make_input(mixing_fraction=0.99))
-        Tdb_1 = result.start_point["Tdb"]
-        assert result.end_point["Tdb"] == approx(Tdb_1, abs_tol=0.5)
-
-    def test_low_fraction_near_stream2(self):
-        solver = MixingSolver()
-        result = solver.solve(_make_input(mixing_fraction=0.01))
-        Tdb_2 = result.metadata["stream2"]["Tdb"]
-        assert result.end_point["Tdb"] == approx(Tdb_2, abs_tol=0.5)
+    @pytest.mark.parametrize("fraction, near", [
+        (0.99, "stream1"),
+        (0.01, "stream2"),
+    ])
+    def test_near_dominant_stream(self, solver, fraction, near):
+        result = solver.solve(_make_input(mixing_fraction=fraction))
+        if near == "stream1":
+            Tdb_near = result.start_point["Tdb"]
+        else:
+            Tdb_near = result.metadata["stream2"]["Tdb"]
+        assert result.end_point["Tdb"] == approx(Tdb_near, abs=0.5)
 
 
 # ---------------------------------------------------------------------------
@@ -137,31 +141,20 @@ class TestLeverRule:
         (h_mix - h_2) / (h_1 - h_2) = f
     """
 
-    def setup_method(self):
-        solver = MixingSolver()
-        self.f = 0.30
-        self.result = solver.solve(_make_input(mixing_fraction=self.f))
-
-    def test_lever_tdb(self):
-        Tdb_1 = self.result.start_point["Tdb"]
-        Tdb_2 = self.result.metadata["stream2"]["Tdb"]
-        Tdb_mix = self.result.end_point["Tdb"]
-        ratio = (Tdb_mix - Tdb_2) / (Tdb_1 - Tdb_2)
-        assert ratio == approx(self.f, rel_tol=0.01, abs_tol=0.01)
+    f = 0.30
 
-    def test_lever_w(self):
-        W_1 = self.result.start_point["W"]
-        W_2 = self.result.metadata["stream2"]["W"]
-        W_mix = self.result.end_point["W"]
-        ratio = (W_mix - W_2) / (W_1 - W_2)
-        assert ratio == approx(self.f, rel_tol=0.01, abs_tol=0.01)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solved):
+        return solved(mixing_fraction=cls.f)
 
-    def test_lever_h(self):
-        h_1 = self.result.start_point["h"]
-        h_2 = self.result.metadata["stream2"]["h"]
-        h_mix = self.result.end_point["h"]
-        ratio = (h_mix - h_2) / (h_1 - h_2)
-        assert ratio == approx(self.f, rel_tol=0.01, abs_tol=0.01)
+    @pytest.mark.parametrize("key", ["Tdb", "W", "h"])
+    def test_lever(self, result, key):
+        v_1 = result.start_point[key]
+        v_2 = result.metadata["stream2"][key]
+        v_mix = result.end_point[key]
+        ratio = (v_mix - v_2) / (v_1 - v_2)
+        assert ratio == approx(self.f, rel=0.01, abs=0.01)
 
 
 # ---------------------------------------------------------------------------
@@ -170,39 +163,40 @@ class TestLeverRule:
 
 class TestMetadata:
 
-    def setup_method(self):
-        solver = MixingSolver()
-        self.result = solver.solve(_make_input(mixing_fraction=0.30))
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solved):
+        return solved(mixing_fraction=0.30)
 
-    def test_stream2_in_metadata(self):
-        assert "stream2" in self.result.metadata
-        assert "Tdb" in self.result.metadata["stream2"]
-        assert "W" in self.result.metadata["stream2"]
+    def test_stream2_in_metadata(self, result):
+        assert "stream2" in result.metadata
+        assert "Tdb" in result.metadata["stream2"]
+        assert "W" in result.metadata["stream2"]
 
-    def test_mixing_fraction_echoed(self):
-        assert self.result.metadata["mixing_fraction"] == approx(0.30)
+    def test_mixing_fraction_echoed(self, result):
+        assert result.metadata["mixing_fraction"] == approx(0.30)
 
-    def test_w_mix_in_metadata(self):
-        assert "W_mix" in self.result.metadata
+    def test_w_mix_in_metadata(self, result):
+        assert "W_mix" in result.metadata
 
-    def test_h_mix_in_metadata(self):
-        assert "h_mix" in self.result.metadata
+    def test_h_mix_in_metadata(self, result):
+        assert "h_mix" in result.metadata
 
-    def test_tdb_mix_in_metadata(self):
-        assert "Tdb_mix" in self.result.metadata
+    def test_tdb_mix_in_metadata(self, result):
+        assert "Tdb_mix" in result.metadata
 
-    def test_w_mix_display_in_metadata(self):
-        assert "W_mix_display" in self.result.metadata
+    def test_w_mix_display_in_metadata(self, result):
+        assert "W_mix_display" in result.metadata
 
-    def test_w_mix_matches_end_point(self):
+    def test_w_mix_matches_end_point(self, result):
         """Metadata W_mix should match the end_point W."""
-        assert self.result.metadata["W_mix"] == approx(
-            self.result.end_point["W"], rel_tol=0.001, abs_tol=0.0001
+        assert result.metadata["W_mix"] == approx(
+            result.end_point["W"], rel=0.001, abs=0.0001
         )
 
-    def test_h_mix_matches_end_point(self):
-        assert self.result.metadata["h_mix"] == approx(
-            self.result.end_point["h"], rel_tol=0.001, abs_tol=0.05
+    def test_h_mix_matches_end_point(self, result):
+        assert result.metadata["h_mix"] == approx(
+            result.end_point["h"], rel=0.001, abs=0.05
         )
 
 
@@ -212,9 +206,10 @@ class TestMetadata:
 
 class TestMixingSI:
 
-    def setup_method(self):
-        solver = MixingSolver()
-        self.result = solver.solve(ProcessInput(
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, solver):
+        return solver.solve(ProcessInput(
             process_type=ProcessType.ADIABATIC_MIXING,
             unit_system=UnitSystem.SI,
             pressure=DEFAULT_PRESSURE_SI,
@@ -225,27 +220,27 @@ class TestMixingSI:
             mixing_fraction=0.30,
         ))
 
-    def test_unit_system(self):
-        assert self.result.unit_system == UnitSystem.SI
+    def test_unit_system(self, result):
+        assert result.unit_system == UnitSystem.SI
 
-    def test_mixed_tdb_between(self):
-        Tdb_1 = self.result.start_point["Tdb"]
-        Tdb_2 = self.result.metadata["stream2"]["Tdb"]
-        Tdb_mix = self.result.end_point["Tdb"]
+    def test_mixed_tdb_between(self, result):
+        Tdb_1 = result.start_point["Tdb"]
+        Tdb_2 = result.metadata["stream2"]["Tdb"]
+        Tdb_mix = result.end_point["Tdb"]
         assert min(Tdb_1, Tdb_2) <= Tdb_mix <= max(Tdb_1, Tdb_2)
 
-    def test_mixed_w_between(self):
-        W_1 = self.result.start_point["W"]
-        W_2 = self.result.metadata["stream2"]["W"]
-        W_mix = self.result.end_point["W"]
+    def test_mixed_w_between(self, result):
+        W_1 = result.start_point["W"]
+        W_2 = result.metadata["stream2"]["W"]
+        W_mix = result.end_point["W"]
         assert min(W_1, W_2) <= W_mix <= max(W_1, W_2)
 
-    def test_lever_rule_tdb(self):
-        Tdb_1 = self.result.start_point["Tdb"]
-        Tdb_2 = self.result.metadata["stream2"]["Tdb"]
-        Tdb_mix = self.result.end_point["Tdb"]
+    def test_lever_rule_tdb(self, result):
+        Tdb_1 = result.start_point["Tdb"]
+        Tdb_2 = result.metadata["stream2"]["Tdb"]
+        Tdb_mix = result.end_point["Tdb"]
         ratio = (Tdb_mix - Tdb_2) / (Tdb_1 - Tdb_2)
-        assert ratio == approx(0.30, rel_tol=0.01, abs_tol=0.01)
+        assert ratio == approx(0.30, rel=0.01, abs=0.01)
 
 
 # ---------------------------------------------------------------------------
@@ -272,50 +267,47 @@ class TestIdenticalStreams:
 
 
 # ---------------------------------------------------------------------------
-# Edge cases and validation errors
+# Lever-rule kernel
 # ---------------------------------------------------------------------------
 
-class TestEdgeCases:
+class TestComputeMix:
 
-    def test_missing_stream2_pair(self):
-        solver = MixingSolver()
-        with pytest.raises(ValueError, match="stream2_point_pair"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.ADIABATIC_MIXING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(80.0, 50.0),
-                mixing_fraction=0.50,
-            ))
-
-    def test_missing_mixing_fraction(self):
-        solver = MixingSolver()
-        with pytest.raises(ValueError, match="mixing_fraction"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.ADIABATIC_MIXING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(80.0, 50.0),
-                stream2_point_pair=("Tdb", "RH"),
-                stream2_point_values=(75.0, 50.0),
-            ))
-
-    def test_fraction_negative(self):
-        solver = MixingSolver()
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            solver.solve(_make_input(mixing_fraction=-0.1))
+    @pytest.mark.parametrize("unit_system, W_1, h_1, W_2, h_2", [
+        (UnitSystem.IP, 0.0142, 38.6, 0.0093, 28.1),
+        (UnitSystem.SI, 0.0142, 71500.0, 0.0093, 47800.0),
+    ])
+    def test_matches_psychrolib(self, unit_system, W_1, h_1, W_2, h_2):
+        Tdb_mix, W_mix, h_mix = _compute_mix(W_1, h_1, W_2, h_2, 0.3, unit_system)
+        psychrolib.SetUnitSystem(
+            psychrolib.IP if unit_system == UnitSystem.IP else psychrolib.SI
+        )
+        assert Tdb_mix == pytest.approx(
+            psychrolib.GetTDryBulbFromEnthalpyAndHumRatio(h_mix, W_mix), rel=1e-12
+        )
+        assert W_mix == pytest.approx(0.3 * W_1 + 0.7 * W_2, rel=1e-12)
 
-    def test_fraction_above_one(self):
-        solver = MixingSolver()
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            solver.solve(_make_input(mixing_fraction=1.5))
 
-    def test_fraction_zero_warns(self):
-        solver = MixingSolver()
-        result = solver.solve(_make_input(mixing_fraction=0.0))
-        assert len(result.warnings) > 0
-        assert "stream 2" in result.warnings[0].lower()
+# ---------------------------------------------------------------------------
+# Edge cases and validation errors
+# ---------------------------------------------------------------------------
 
-    def test_fraction_one_warns(self):
-        solver = MixingSolver()
-        result = solver.solve(_make_input(mixing_fraction=1.0))
+class TestEdgeCases:
+
+    @pytest.mark.parametrize("overrides, match", [
+        ({"stream2_point_pair": None, "stream2_point_values": None}, "stream2_point_pair"),
+        ({"mixing_fraction": None}, "mixing_fraction"),
+        ({"mixing_fraction": -0.1}, "between 0 and 1"),
+        ({"mixing_fraction": 1.5}, "between 0 and 1"),
+    ])
+    def test_invalid_input(self, solver, overrides, match):
+        with pytest.raises(ValueError, match=match):
+            solver.solve(_make_input(**overrides))
+
+    @pytest.mark.parametrize("fraction, stream", [
+        (0.0, "stream 2"),
+        (1.0, "stream 1"),
+    ])
+    def test_pure_stream_warns(self, solver, fraction, stream):
+        result = solver.solve(_make_input(mixing_fraction=fraction))
         assert len(result.warnings) > 0
-        assert "stream 1" in result.warnings[0].lower()
+        assert stream in result.warnings[0].lower()
@@ -3,217 +3,252 @@ Tests for the PDF report generator engine and API route.
 """
 
 import base64
-import struct
-import zlib
+import re
 
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
+from app.config import UnitSystem
 from app.engine.report_generator import generate_report
 from app.models.report import ReportInput
 
 
-client = TestClient(app)
+# Minimal valid 1x1 white RGB PNG: signature + IHDR + IDAT (zlib of the
+# filter byte and one white pixel) + IEND, each chunk with its CRC.
+_MINIMAL_PNG_BYTES = (
+    b"\x89PNG\r\n\x1a\n"
+    b"\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde"
+    b"\x00\x00\x00\x0cIDATx\x9cc\xf8\xff\xff?\x00\x05\xfe\x02\xfe\r\xefF\xb8"
+    b"\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+_MINIMAL_PNG_B64 = base64.b64encode(_MINIMAL_PNG_BYTES).decode()
 
 
 def _minimal_png_b64() -> str:
-    """Create a minimal valid 1x1 PNG image encoded as base64."""
-    # Minimal 1x1 white PNG
-    def _chunk(chunk_type: bytes, data: bytes) -> bytes:
-        c = chunk_type + data
-        crc = struct.pack(">I", zlib.crc32(c) & 0xFFFFFFFF)
-        return struct.pack(">I", len(data)) + c + crc
-
-    signature = b"\x89PNG\r\n\x1a\n"
-    ihdr_data = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)  # 1x1 RGB
-    ihdr = _chunk(b"IHDR", ihdr_data)
-    raw_row = b"\x00\xff\xff\xff"  # filter byte + RGB white pixel
-    idat_data = zlib.compress(raw_row)
-    idat = _chunk(b"IDAT", idat_data)
-    iend = _chunk(b"IEND", b"")
-    png_bytes = signature + ihdr + idat + iend
-    return base64.b64encode(png_bytes).decode()
-
+    """The 1x1 PNG fixture as base64."""
+    return _MINIMAL_PNG_B64
+
+
+_SAMPLE_STATE_POINT = {
+    "label": "Point 1",
+    "unit_system": "IP",
+    "pressure": 14.696,
+    "input_pair": ["Tdb", "RH"],
+    "input_values": [75.0, 50.0],
+    "Tdb": 75.0,
+    "Twb": 62.5,
+    "Tdp": 55.1,
+    "RH": 50.0,
+    "W": 0.009297,
+    "W_display": 65.08,
+    "h": 28.11,
+    "v": 13.68,
+    "Pv": 0.2148,
+    "Ps": 0.4298,
+    "mu": 0.5,
+}
+
+_SAMPLE_PROCESS = {
+    "process_type": "sensible_heating",
+    "unit_system": "IP",
+    "pressure": 14.696,
+    "start_point": _SAMPLE_STATE_POINT,
+    "end_point": {**_SAMPLE_STATE_POINT, "Tdb": 95.0, "label": "End"},
+    "path_points": [],
+    "metadata": {
+        "Qs": 4.88,
+        "Ql": 0.0,
+        "Qt": 4.88,
+        "SHR": 1.0,
+        "delta_T": 20.0,
+    },
+    "warnings": [],
+}
+
+_SAMPLE_COIL = {
+    "unit_system": "IP",
+    "pressure": 14.696,
+    "mode": "forward",
+    "entering": _SAMPLE_STATE_POINT,
+    "leaving": {**_SAMPLE_STATE_POINT, "Tdb": 55.0, "label": "Leaving"},
+    "adp": {**_SAMPLE_STATE_POINT, "Tdb": 48.0, "label": "ADP"},
+    "bypass_factor": 0.15,
+    "contact_factor": 0.85,
+    "Qs": 4.88,
+    "Ql": 2.5,
+    "Qt": 7.38,
+    "SHR": 0.66,
+    "load_unit": "BTU/lb",
+    "gpm": 12.5,
+    "path_points": [],
+    "warnings": [],
+}
+
+
+# Shared, read-only sample payloads: tests vary them via {**sample, ...}
+# (ReportInput validation copies its input) and never mutate them in place.
 
 def _sample_state_point() -> dict:
-    return {
-        "label": "Point 1",
-        "unit_system": "IP",
-        "pressure": 14.696,
-        "input_pair": ["Tdb", "RH"],
-        "input_values": [75.0, 50.0],
-        "Tdb": 75.0,
-        "Twb": 62.5,
-        "Tdp": 55.1,
-        "RH": 50.0,
-        "W": 0.009297,
-        "W_display": 65.08,
-        "h": 28.11,
-        "v": 13.68,
-        "Pv": 0.2148,
-        "Ps": 0.4298,
-        "mu": 0.5,
-    }
+    return _SAMPLE_STATE_POINT
 
 
 def _sample_process() -> dict:
-    return {
-        "process_type": "sensible_heating",
-        "unit_system": "IP",
-        "pressure": 14.696,
-        "start_point": _sample_state_point(),
-        "end_point": {**_sample_state_point(), "Tdb": 95.0, "label": "End"},
-        "path_points": [],
-        "metadata": {
-            "Qs": 4.88,
-            "Ql": 0.0,
-            "Qt": 4.88,
-            "SHR": 1.0,
-            "delta_T": 20.0,
-        },
-        "warnings": [],
-    }
+    return _SAMPLE_PROCESS
 
 
 def _sample_coil() -> dict:
-    return {
-        "unit_system": "IP",
-        "pressure": 14.696,
-        "mode": "forward",
-        "entering": _sample_state_point(),
-        "leaving": {**_sample_state_point(), "Tdb": 55.0, "label": "Leaving"},
-        "adp": {**_sample_state_point(), "Tdb": 48.0, "label": "ADP"},
-        "bypass_factor": 0.15,
-        "contact_factor": 0.85,
-        "Qs": 4.88,
-        "Ql": 2.5,
-        "Qt": 7.38,
-        "SHR": 0.66,
-        "load_unit": "BTU/lb",
-        "gpm": 12.5,
-        "path_points": [],
-        "warnings": [],
-    }
+    return _SAMPLE_COIL
 
 
 # ── Engine tests ──
 
 
+# Validated once; report tests derive their inputs with model_copy(update=...),
+# which skips re-validation, so updates must already be in model types.
+# Engine tests pass _MINIMAL_PNG_BYTES to generate_report so the chart is not
+# decoded again for every report.
+_BASE_INPUT = ReportInput(
+    title="base",
+    chart_image_base64=_MINIMAL_PNG_B64,
+    state_points=[_SAMPLE_STATE_POINT],
+    include_sections=["chart", "state_points"],
+)
+
+# Updates to _BASE_INPUT, rendered once each by the pdf_bytes fixture.
+_REPORT_SCENARIOS = {
+    "si_units": dict(
+        title="SI Report",
+        unit_system=UnitSystem.SI,
+        pressure=101325.0,
+        state_points=[{**_SAMPLE_STATE_POINT, "unit_system": "SI"}],
+    ),
+    "chart_only": dict(
+        title="Chart Only",
+        state_points=[],
+        include_sections=["chart"],
+    ),
+    "notes_only": dict(
+        title="Notes Only",
+        notes="Important project notes.",
+        state_points=[],
+        include_sections=["notes"],
+    ),
+    "base64": dict(
+        title="Base64 Chart",
+        chart_image_base64=_MINIMAL_PNG_B64,
+        include_sections=["chart"],
+    ),
+    # Handle base64 data with data:image/png;base64, prefix
+    "data_uri_prefix": dict(
+        title="Data URI Test",
+        chart_image_base64=f"data:image/png;base64,{_MINIMAL_PNG_B64}",
+        include_sections=["chart"],
+    ),
+    # Empty state points should not cause an error
+    "empty_state_points": dict(
+        title="Empty Points",
+        state_points=[],
+    ),
+}
+
+# Scenarios that exercise decoding chart_image_base64 inside generate_report
+_DECODE_SCENARIOS = {"base64", "data_uri_prefix"}
+
+
+@pytest.fixture(scope="module", params=list(_REPORT_SCENARIOS))
+def pdf_bytes(request):
+    """One rendered report per _REPORT_SCENARIOS entry."""
+    inp = _BASE_INPUT.model_copy(update=_REPORT_SCENARIOS[request.param])
+    if request.param in _DECODE_SCENARIOS:
+        return generate_report(inp)
+    return generate_report(inp, chart_image_bytes=_MINIMAL_PNG_BYTES)
+
+
+@pytest.fixture(scope="module")
+def minimal_pdf_bytes():
+    """Chart plus one state point; shared by the engine and API tests."""
+    return generate_report(
+        _BASE_INPUT.model_copy(update={"title": "Test Report"}),
+        chart_image_bytes=_MINIMAL_PNG_BYTES,
+    )
+
+
+@pytest.fixture(scope="module")
+def full_pdf_bytes():
+    """A report with every section, generated once for the module."""
+    inp = _BASE_INPUT.model_copy(update=dict(
+        title="Full Test Report",
+        state_points=[_sample_state_point(), {**_sample_state_point(), "label": "Point 2"}],
+        processes=[_sample_process()],
+        coil_result=_sample_coil(),
+        shr_lines=[{
+            "room_point": _sample_state_point(),
+            "shr": 0.75,
+            "slope_dW_dTdb": -0.001,
+            "line_points": [],
+            "adp": _sample_state_point(),
+            "adp_Tdb": 50.0,
+            "warnings": [],
+        }],
+        gshr_result={
+            "room_shr": 0.75,
+            "gshr": 0.65,
+            "eshr": 0.60,
+        },
+        notes="These are test notes for the report.\nWith multiple lines.",
+        include_sections=["chart", "state_points", "processes", "coil", "shr", "notes"],
+    ))
+    return generate_report(inp, chart_image_bytes=_MINIMAL_PNG_BYTES)
+
+
+@pytest.mark.pdf
 class TestReportGenerator:
     """Test the report generator engine directly."""
 
-    def test_minimal_report(self):
-        """Generate a report with just a chart image and one state point."""
-        inp = ReportInput(
-            title="Test Report",
-            chart_image_base64=_minimal_png_b64(),
-            state_points=[_sample_state_point()],
-            include_sections=["chart", "state_points"],
-        )
-        pdf_bytes = generate_report(inp)
-
-        # Verify it's a valid PDF (starts with %PDF)
+    def test_is_valid_pdf(self, pdf_bytes):
         assert pdf_bytes[:5] == b"%PDF-"
+
+    def test_not_empty(self, pdf_bytes):
         assert len(pdf_bytes) > 100
 
-    def test_full_report(self):
-        """Generate a report with all sections."""
-        inp = ReportInput(
-            title="Full Test Report",
-            chart_image_base64=_minimal_png_b64(),
-            state_points=[_sample_state_point(), {**_sample_state_point(), "label": "Point 2"}],
-            processes=[_sample_process()],
-            coil_result=_sample_coil(),
-            shr_lines=[{
-                "room_point": _sample_state_point(),
-                "shr": 0.75,
-                "slope_dW_dTdb": -0.001,
-                "line_points": [],
-                "adp": _sample_state_point(),
-                "adp_Tdb": 50.0,
-                "warnings": [],
-            }],
-            gshr_result={
-                "room_shr": 0.75,
-                "gshr": 0.65,
-                "eshr": 0.60,
-            },
-            notes="These are test notes for the report.\nWith multiple lines.",
-            include_sections=["chart", "state_points", "processes", "coil", "shr", "notes"],
-        )
-        pdf_bytes = generate_report(inp)
+    def test_chart_image_required(self):
+        with pytest.raises(ValueError, match="chart_image_base64"):
+            ReportInput(title="No Chart", include_sections=["notes"])
 
-        assert pdf_bytes[:5] == b"%PDF-"
-        assert len(pdf_bytes) > 500
-
-    def test_si_units(self):
-        """Generate a report with SI units."""
-        sp = {**_sample_state_point(), "unit_system": "SI"}
-        inp = ReportInput(
-            title="SI Report",
-            unit_system="SI",
-            pressure=101325.0,
-            chart_image_base64=_minimal_png_b64(),
-            state_points=[sp],
-            include_sections=["chart", "state_points"],
-        )
-        pdf_bytes = generate_report(inp)
-        assert pdf_bytes[:5] == b"%PDF-"
 
-    def test_chart_only(self):
-        """Generate a report with only the chart section."""
-        inp = ReportInput(
-            title="Chart Only",
-            chart_image_base64=_minimal_png_b64(),
-            include_sections=["chart"],
-        )
-        pdf_bytes = generate_report(inp)
-        assert pdf_bytes[:5] == b"%PDF-"
+@pytest.mark.pdf
+class TestMinimalReport:
+    """Generate a report with just a chart image and one state point."""
 
-    def test_notes_only(self):
-        """Generate a report with only notes."""
-        inp = ReportInput(
-            title="Notes Only",
-            chart_image_base64=_minimal_png_b64(),
-            notes="Important project notes.",
-            include_sections=["notes"],
-        )
-        pdf_bytes = generate_report(inp)
-        assert pdf_bytes[:5] == b"%PDF-"
+    def test_is_valid_pdf(self, minimal_pdf_bytes):
+        assert minimal_pdf_bytes[:5] == b"%PDF-"
 
-    def test_base64_with_data_uri_prefix(self):
-        """Handle base64 data with data:image/png;base64, prefix."""
-        b64 = _minimal_png_b64()
-        inp = ReportInput(
-            title="Data URI Test",
-            chart_image_base64=f"data:image/png;base64,{b64}",
-            include_sections=["chart"],
-        )
-        pdf_bytes = generate_report(inp)
-        assert pdf_bytes[:5] == b"%PDF-"
+    def test_not_empty(self, minimal_pdf_bytes):
+        assert len(minimal_pdf_bytes) > 100
 
-    def test_empty_state_points_section_skipped(self):
-        """Empty state points should not cause an error."""
-        inp = ReportInput(
-            title="Empty Points",
-            chart_image_base64=_minimal_png_b64(),
-            state_points=[],
-            include_sections=["chart", "state_points"],
-        )
-        pdf_bytes = generate_report(inp)
-        assert pdf_bytes[:5] == b"%PDF-"
+
+@pytest.mark.pdf
+class TestFullReport:
+    """Generate a report with all sections."""
+
+    def test_is_valid_pdf(self, full_pdf_bytes):
+        assert full_pdf_bytes[:5] == b"%PDF-"
+
+    def test_not_empty(self, full_pdf_bytes):
+        assert len(full_pdf_bytes) > 500
 
 
 # ── API tests ──
 
 
+@pytest.mark.usefixtures("fast_pdf")
 class TestReportAPI:
     """Test the /api/v1/report/generate endpoint."""
 
-    def test_post_report(self):
+    @pytest.mark.pdf
+    def test_post_report(self, client, minimal_pdf_bytes):
+        """The route renders the same pages as a direct generate_report call."""
         payload = {
-            "title": "API Test Report",
+            "title": "Test Report",
             "chart_image_base64": _minimal_png_b64(),
             "state_points": [_sample_state_point()],
             "include_sections": ["chart", "state_points"],
@@ -222,8 +257,11 @@ class TestReportAPI:
         assert resp.status_code == 200
         assert resp.headers["content-type"] == "application/pdf"
         assert resp.content[:5] == b"%PDF-"
+        # Byte equality is out: the PDF embeds its generation timestamp
+        page = re.compile(rb"/Type\s*/Page\b")
+        assert len(page.findall(resp.content)) == len(page.findall(minimal_pdf_bytes)) == 2
 
-    def test_post_full_report(self):
+    def test_post_full_report(self, client):
         payload = {
             "title": "Full API Report",
             "chart_image_base64": _minimal_png_b64(),
@@ -237,7 +275,7 @@ class TestReportAPI:
         assert resp.status_code == 200
         assert resp.content[:5] == b"%PDF-"
 
-    def test_post_missing_chart_image(self):
+    def test_post_missing_chart_image(self, client):
         """chart_image_base64 is required."""
         payload = {
             "title": "No Chart",
@@ -246,3 +284,13 @@ class TestReportAPI:
         }
         resp = client.post("/api/v1/report/generate", json=payload)
         assert resp.status_code == 422
+
+    def test_post_chart_image_bytes_not_accepted(self, client):
+        """Raw chart bytes are an engine-side option, not part of the request body."""
+        payload = {
+            "title": "Bytes Only",
+            "chart_image_bytes": "not a png",
+            "include_sections": ["chart"],
+        }
+        resp = client.post("/api/v1/report/generate", json=payload)
+        assert resp.status_code == 422
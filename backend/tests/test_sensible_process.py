@@ -9,6 +9,7 @@ that the process produces correct end states and metadata.
 import pytest
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
 from app.engine.processes.sensible import SensibleSolver
+from app.engine.state_resolver import get_pressure_from_altitude
 from app.models.process import ProcessInput, ProcessType, SensibleMode
 
 
@@ -16,11 +17,76 @@ def approx(value: float, rel_tol: float = 0.01, abs_tol: float = 0.1):
     return pytest.approx(value, rel=rel_tol, abs=abs_tol)
 
 
-@pytest.fixture
+def close(a: float, b: float, rel_tol: float = 0.001, abs_tol: float = 1e-6) -> bool:
+    """Tight-tolerance check without building an approx object (constant-W asserts)."""
+    return abs(a - b) <= max(abs_tol, rel_tol * abs(b))
+
+
+# Start states reused across the module.
+_TDB_RH = ("Tdb", "RH")
+_55F_50RH = (55.0, 50.0)
+_75F_50RH = (75.0, 50.0)
+
+# 55°F ↔ 75°F at 50% RH, shared by the heating, cooling and symmetry classes
+# through the session solve cache.
+_HEAT_55_TO_75 = ProcessInput(
+    process_type=ProcessType.SENSIBLE_HEATING,
+    unit_system=UnitSystem.IP,
+    pressure=DEFAULT_PRESSURE_IP,
+    start_point_pair=_TDB_RH,
+    start_point_values=_55F_50RH,
+    sensible_mode=SensibleMode.TARGET_TDB,
+    target_Tdb=75.0,
+)
+_COOL_75_TO_55 = _HEAT_55_TO_75.model_copy(update={
+    "process_type": ProcessType.SENSIBLE_COOLING,
+    "start_point_values": _75F_50RH,
+    "target_Tdb": 55.0,
+})
+
+
+def _heat_input(**updates) -> ProcessInput:
+    """_HEAT_55_TO_75 with fields replaced; copies skip re-validating the template."""
+    return _HEAT_55_TO_75.model_copy(update=updates)
+
+
+def _cool_input(**updates) -> ProcessInput:
+    """_COOL_75_TO_55 with fields replaced."""
+    return _COOL_75_TO_55.model_copy(update=updates)
+
+
+@pytest.fixture(scope="module")
 def solver():
     return SensibleSolver()
 
 
+# ---------------------------------------------------------------------------
+# End states across TARGET_TDB and DELTA_T modes
+# ---------------------------------------------------------------------------
+
+_ENDPOINT_CASES = [
+    pytest.param(_HEAT_55_TO_75, 75.0, ProcessType.SENSIBLE_HEATING, id="target_tdb-heat"),
+    pytest.param(_COOL_75_TO_55, 55.0, ProcessType.SENSIBLE_COOLING, id="target_tdb-cool"),
+    pytest.param(
+        _heat_input(sensible_mode=SensibleMode.DELTA_T, target_Tdb=None, delta_T=20.0),
+        75.0, ProcessType.SENSIBLE_HEATING, id="delta_t-heat",
+    ),
+    pytest.param(
+        _cool_input(sensible_mode=SensibleMode.DELTA_T, target_Tdb=None, delta_T=-20.0),
+        55.0, ProcessType.SENSIBLE_COOLING, id="delta_t-cool",
+    ),
+]
+
+
+@pytest.mark.parametrize("process_input, expected_tdb, expected_pt", _ENDPOINT_CASES)
+def test_sensible_endpoint(solved_cache, process_input, expected_tdb, expected_pt):
+    """End Tdb lands on target, W is unchanged, and the process type is echoed."""
+    result = solved_cache(process_input)
+    assert result.end_point["Tdb"] == approx(expected_tdb)
+    assert close(result.end_point["W"], result.start_point["W"])
+    assert result.process_type == expected_pt
+
+
 # ---------------------------------------------------------------------------
 # Sensible Heating — TARGET_TDB mode
 # ---------------------------------------------------------------------------
@@ -28,33 +94,14 @@ def solver():
 class TestSensibleHeatingTargetTdb:
     """Heat from 55°F to 75°F at 50% RH initial."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_HEATING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(55.0, 50.0),
-            sensible_mode=SensibleMode.TARGET_TDB,
-            target_Tdb=75.0,
-        ))
-
-    def test_end_tdb(self):
-        assert self.result.end_point["Tdb"] == approx(75.0)
-
-    def test_constant_w(self):
-        """Humidity ratio must remain constant during sensible process."""
-        assert self.result.end_point["W"] == approx(
-            self.result.start_point["W"], rel_tol=0.001, abs_tol=1e-6
-        )
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solved_cache):
+        cls.result = solved_cache(_HEAT_55_TO_75)
 
     def test_start_tdb(self):
         assert self.result.start_point["Tdb"] == approx(55.0)
 
-    def test_process_type_is_heating(self):
-        assert self.result.process_type == ProcessType.SENSIBLE_HEATING
-
     def test_delta_t_metadata(self):
         assert self.result.metadata["delta_T"] == approx(20.0)
 
@@ -80,28 +127,10 @@ class TestSensibleHeatingTargetTdb:
 class TestSensibleCoolingTargetTdb:
     """Cool from 75°F to 55°F at 50% RH initial."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_COOLING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(75.0, 50.0),
-            sensible_mode=SensibleMode.TARGET_TDB,
-            target_Tdb=55.0,
-        ))
-
-    def test_end_tdb(self):
-        assert self.result.end_point["Tdb"] == approx(55.0)
-
-    def test_constant_w(self):
-        assert self.result.end_point["W"] == approx(
-            self.result.start_point["W"], rel_tol=0.001, abs_tol=1e-6
-        )
-
-    def test_process_type_is_cooling(self):
-        assert self.result.process_type == ProcessType.SENSIBLE_COOLING
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solved_cache):
+        cls.result = solved_cache(_COOL_75_TO_55)
 
     def test_delta_t_is_negative(self):
         assert self.result.metadata["delta_T"] == approx(-20.0)
@@ -118,82 +147,15 @@ class TestSensibleCoolingTargetTdb:
 class TestSensibleSymmetry:
     """Heating and cooling between the same two states should be symmetric."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.heat = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_HEATING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(55.0, 50.0),
-            sensible_mode=SensibleMode.TARGET_TDB,
-            target_Tdb=75.0,
-        ))
-        self.cool = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_COOLING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(75.0, 50.0),
-            sensible_mode=SensibleMode.TARGET_TDB,
-            target_Tdb=55.0,
-        ))
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solved_cache):
+        cls.q_heat = abs(solved_cache(_HEAT_55_TO_75).metadata["Qs_per_unit_mass"])
+        cls.q_cool = abs(solved_cache(_COOL_75_TO_55).metadata["Qs_per_unit_mass"])
 
     def test_qs_magnitude_matches(self):
         """Sensible energy should be equal in magnitude for heat and cool."""
-        q_heat = abs(self.heat.metadata["Qs_per_unit_mass"])
-        q_cool = abs(self.cool.metadata["Qs_per_unit_mass"])
-        assert q_heat == approx(q_cool, rel_tol=0.02, abs_tol=0.1)
-
-
-# ---------------------------------------------------------------------------
-# DELTA_T mode
-# ---------------------------------------------------------------------------
-
-class TestDeltaTMode:
-    """Test DELTA_T input mode."""
-
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_HEATING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(55.0, 50.0),
-            sensible_mode=SensibleMode.DELTA_T,
-            delta_T=20.0,
-        ))
-
-    def test_end_tdb(self):
-        assert self.result.end_point["Tdb"] == approx(75.0)
-
-    def test_constant_w(self):
-        assert self.result.end_point["W"] == approx(
-            self.result.start_point["W"], rel_tol=0.001, abs_tol=1e-6
-        )
-
-
-class TestDeltaTNegative:
-    """Negative delta_T should result in cooling."""
-
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_COOLING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(75.0, 50.0),
-            sensible_mode=SensibleMode.DELTA_T,
-            delta_T=-20.0,
-        ))
-
-    def test_end_tdb(self):
-        assert self.result.end_point["Tdb"] == approx(55.0)
-
-    def test_process_type_is_cooling(self):
-        assert self.result.process_type == ProcessType.SENSIBLE_COOLING
+        assert self.q_heat == approx(self.q_cool, rel_tol=0.02, abs_tol=0.1)
 
 
 # ---------------------------------------------------------------------------
@@ -208,15 +170,12 @@ class TestHeatAndAirflowMode:
     So given Q=21600 and CFM=1000, we expect ΔT ≈ 20°F.
     """
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_HEATING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(55.0, 50.0),
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solver):
+        cls.result = solver.solve(_heat_input(
             sensible_mode=SensibleMode.HEAT_AND_AIRFLOW,
+            target_Tdb=None,
             Q_sensible=21600.0,
             airflow_cfm=1000.0,
         ))
@@ -245,17 +204,10 @@ class TestHeatAndAirflowMode:
 class TestCoolingBelowDewPoint:
     """Cooling from 75°F/50% RH to 40°F — below the dew point (~55°F)."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_COOLING,
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(75.0, 50.0),
-            sensible_mode=SensibleMode.TARGET_TDB,
-            target_Tdb=40.0,
-        ))
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solver):
+        cls.result = solver.solve(_cool_input(target_Tdb=40.0))
 
     def test_warning_issued(self):
         assert len(self.result.warnings) > 0
@@ -267,9 +219,7 @@ class TestCoolingBelowDewPoint:
 
     def test_w_still_constant(self):
         """W stays constant in the sensible calculation (warning only)."""
-        assert self.result.end_point["W"] == approx(
-            self.result.start_point["W"], rel_tol=0.001, abs_tol=1e-6
-        )
+        assert close(self.result.end_point["W"], self.result.start_point["W"])
 
 
 # ---------------------------------------------------------------------------
@@ -279,13 +229,14 @@ class TestCoolingBelowDewPoint:
 class TestSensibleHeatingSI:
     """Sensible heating in SI: 15°C to 25°C at 50% RH."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
-        self.result = solver.solve(ProcessInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solver):
+        cls.result = solver.solve(ProcessInput(
             process_type=ProcessType.SENSIBLE_HEATING,
             unit_system=UnitSystem.SI,
             pressure=DEFAULT_PRESSURE_SI,
-            start_point_pair=("Tdb", "RH"),
+            start_point_pair=_TDB_RH,
             start_point_values=(15.0, 50.0),
             sensible_mode=SensibleMode.TARGET_TDB,
             target_Tdb=25.0,
@@ -295,9 +246,7 @@ class TestSensibleHeatingSI:
         assert self.result.end_point["Tdb"] == approx(25.0)
 
     def test_constant_w(self):
-        assert self.result.end_point["W"] == approx(
-            self.result.start_point["W"], rel_tol=0.001, abs_tol=1e-6
-        )
+        assert close(self.result.end_point["W"], self.result.start_point["W"])
 
     def test_delta_t_metadata(self):
         assert self.result.metadata["delta_T"] == approx(10.0)
@@ -313,18 +262,15 @@ class TestSensibleHeatingSI:
 class TestAltitudeCorrection:
     """At Denver altitude (5280 ft), C factor should be lower than 1.08."""
 
-    def setup_method(self):
-        solver = SensibleSolver()
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls, solver):
         # Denver pressure ≈ 12.23 psia
-        from app.engine.state_resolver import get_pressure_from_altitude
-        self.denver_pressure = get_pressure_from_altitude(5280.0, UnitSystem.IP)
-        self.result = solver.solve(ProcessInput(
-            process_type=ProcessType.SENSIBLE_HEATING,
-            unit_system=UnitSystem.IP,
-            pressure=self.denver_pressure,
-            start_point_pair=("Tdb", "RH"),
-            start_point_values=(55.0, 50.0),
+        cls.denver_pressure = get_pressure_from_altitude(5280.0, UnitSystem.IP)
+        cls.result = solver.solve(_heat_input(
+            pressure=cls.denver_pressure,
             sensible_mode=SensibleMode.HEAT_AND_AIRFLOW,
+            target_Tdb=None,
             Q_sensible=21600.0,
             airflow_cfm=1000.0,
         ))
@@ -344,53 +290,22 @@ class TestAltitudeCorrection:
 
 class TestValidationErrors:
 
-    def test_missing_sensible_mode(self):
-        solver = SensibleSolver()
-        with pytest.raises(ValueError, match="sensible_mode is required"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.SENSIBLE_HEATING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(55.0, 50.0),
-            ))
-
-    def test_missing_target_tdb(self):
-        solver = SensibleSolver()
-        with pytest.raises(ValueError, match="target_Tdb is required"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.SENSIBLE_HEATING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(55.0, 50.0),
-                sensible_mode=SensibleMode.TARGET_TDB,
-            ))
-
-    def test_missing_delta_t(self):
-        solver = SensibleSolver()
-        with pytest.raises(ValueError, match="delta_T is required"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.SENSIBLE_HEATING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(55.0, 50.0),
-                sensible_mode=SensibleMode.DELTA_T,
-            ))
-
-    def test_missing_q_and_cfm(self):
-        solver = SensibleSolver()
-        with pytest.raises(ValueError, match="Q_sensible and airflow_cfm"):
-            solver.solve(ProcessInput(
-                process_type=ProcessType.SENSIBLE_HEATING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(55.0, 50.0),
-                sensible_mode=SensibleMode.HEAT_AND_AIRFLOW,
-            ))
-
-    def test_zero_airflow(self):
-        solver = SensibleSolver()
-        with pytest.raises(ValueError, match="airflow_cfm must be positive"):
+    @pytest.mark.parametrize("overrides, match", [
+        ({}, "sensible_mode is required"),
+        ({"sensible_mode": SensibleMode.TARGET_TDB}, "target_Tdb is required"),
+        ({"sensible_mode": SensibleMode.DELTA_T}, "delta_T is required"),
+        ({"sensible_mode": SensibleMode.HEAT_AND_AIRFLOW}, "Q_sensible and airflow_cfm"),
+        (
+            {"sensible_mode": SensibleMode.HEAT_AND_AIRFLOW,
+             "Q_sensible": 21600.0, "airflow_cfm": 0.0},
+            "airflow_cfm must be positive",
+        ),
+    ])
+    def test_invalid_input(self, solver, overrides, match):
+        with pytest.raises(ValueError, match=match):
             solver.solve(ProcessInput(
                 process_type=ProcessType.SENSIBLE_HEATING,
-                start_point_pair=("Tdb", "RH"),
-                start_point_values=(55.0, 50.0),
-                sensible_mode=SensibleMode.HEAT_AND_AIRFLOW,
-                Q_sensible=21600.0,
-                airflow_cfm=0.0,
+                start_point_pair=_TDB_RH,
+                start_point_values=_55F_50RH,
+                **overrides,
             ))
@@ -5,12 +5,18 @@ Covers SHR slope computation, line generation, ADP from SHR,
 GSHR/ESHR calculations, edge cases, and SI units.
 """
 
+from functools import lru_cache
+
+import numpy as np
+import psychrolib
 import pytest
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
 from app.engine.shr import (
     compute_shr_slope,
+    compute_shr_slope_vec,
     generate_shr_line,
     find_adp_from_shr,
+    find_adp_from_shr_batch,
     calculate_shr_line,
     calculate_gshr,
 )
@@ -21,6 +27,21 @@ def approx(value: float, rel_tol: float = 0.01, abs_tol: float = 0.1):
     return pytest.approx(value, rel=rel_tol, abs=abs_tol)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _psychrolib_ip():
+    """The direct psychrolib cross-checks below are all in IP units."""
+    psychrolib.SetUnitSystem(psychrolib.IP)
+
+
+@lru_cache(maxsize=4096)
+def _sat_w(Tdb: float, pressure: float) -> float:
+    """IP psychrolib.GetSatHumRatio, memoized: the line tests probe the same Tdb grid."""
+    return psychrolib.GetSatHumRatio(Tdb, pressure)
+
+
+_sat_w_vec = np.vectorize(_sat_w)
+
+
 # ---------------------------------------------------------------------------
 # SHR slope computation
 # ---------------------------------------------------------------------------
@@ -45,9 +66,22 @@ class TestSHRSlope:
 
     def test_lower_shr_steeper_slope(self):
         """Lower SHR (more latent) → steeper slope."""
-        slope_05 = compute_shr_slope(0.5, UnitSystem.IP)
-        slope_08 = compute_shr_slope(0.8, UnitSystem.IP)
-        assert slope_05 > slope_08
+        slopes = compute_shr_slope_vec(np.array([0.5, 0.8]), UnitSystem.IP)
+        assert slopes[0] > slopes[1]
+
+    @pytest.mark.parametrize("unit_system", [UnitSystem.IP, UnitSystem.SI])
+    def test_vec_matches_scalar(self, unit_system):
+        shr = np.array([0.3, 0.5, 0.75, 1.0])
+        expected = [compute_shr_slope(s, unit_system) for s in shr]
+        assert compute_shr_slope_vec(shr, unit_system) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("shr, match", [
+        ([0.5, 0.0], "greater than 0"),
+        ([0.5, 1.5], "not exceed"),
+    ])
+    def test_vec_invalid_shr(self, shr, match):
+        with pytest.raises(ValueError, match=match):
+            compute_shr_slope_vec(np.array(shr), UnitSystem.IP)
 
     def test_slope_si(self):
         """SI units: slope = 1.006 × (1-0.75) / (2501 × 0.75)."""
@@ -82,19 +116,19 @@ class TestSHRLineGeneration:
         points = generate_shr_line(room_Tdb, room_W, slope, DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
         # Find point closest to room Tdb
-        closest = min(points, key=lambda p: abs(p.Tdb - room_Tdb))
+        Tdb = np.fromiter((p.Tdb for p in points), float, count=len(points))
+        closest = points[int(np.argmin(np.abs(Tdb - room_Tdb)))]
         assert closest.Tdb == approx(room_Tdb, abs_tol=2.0)
 
     def test_line_below_saturation(self):
         """All points should have W ≤ W_sat (within tolerance)."""
-        import psychrolib
-        psychrolib.SetUnitSystem(psychrolib.IP)
         slope = compute_shr_slope(0.75, UnitSystem.IP)
         points = generate_shr_line(75.0, 0.0093, slope, DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
-        for p in points:
-            W_sat = psychrolib.GetSatHumRatio(p.Tdb, DEFAULT_PRESSURE_IP)
-            assert p.W <= W_sat * 1.02  # 2% tolerance
+        Tdb = np.fromiter((p.Tdb for p in points), float, count=len(points))
+        W = np.fromiter((p.W for p in points), float, count=len(points))
+        W_sat = _sat_w_vec(Tdb, DEFAULT_PRESSURE_IP)
+        assert np.all(W <= W_sat * 1.02)  # 2% tolerance
 
     def test_shr_1_horizontal(self):
         """SHR=1.0 → horizontal line (constant W)."""
@@ -124,33 +158,51 @@ class TestADPFromSHR:
 
     def test_adp_on_saturation(self):
         """ADP should lie on the saturation curve."""
-        import psychrolib
-        psychrolib.SetUnitSystem(psychrolib.IP)
         slope = compute_shr_slope(0.75, UnitSystem.IP)
         adp_Tdb = find_adp_from_shr(75.0, 0.0093, slope, DEFAULT_PRESSURE_IP, UnitSystem.IP)
 
-        W_sat = psychrolib.GetSatHumRatio(adp_Tdb, DEFAULT_PRESSURE_IP)
+        W_sat = _sat_w(adp_Tdb, DEFAULT_PRESSURE_IP)
         W_line = 0.0093 + slope * (adp_Tdb - 75.0)
         assert W_sat == approx(W_line, abs_tol=0.0001)
 
     def test_adp_shr_1(self):
         """SHR=1.0 (horizontal line) → ADP is at the dew point."""
-        import psychrolib
-        psychrolib.SetUnitSystem(psychrolib.IP)
         slope = compute_shr_slope(1.0, UnitSystem.IP)
         adp_Tdb = find_adp_from_shr(75.0, 0.0093, slope, DEFAULT_PRESSURE_IP, UnitSystem.IP)
         # ADP should be near the dew point
         Tdp = psychrolib.GetTDewPointFromHumRatio(75.0, 0.0093, DEFAULT_PRESSURE_IP)
         assert adp_Tdb == approx(Tdp, abs_tol=1.0)
 
+    @pytest.mark.parametrize("unit_system, pressure, room_Tdb, room_W, shrs", [
+        (UnitSystem.IP, DEFAULT_PRESSURE_IP, 75.0, 0.0093, (0.75, 0.85, 0.95, 1.0)),
+        (UnitSystem.SI, DEFAULT_PRESSURE_SI, 24.0, 0.0093, (0.75, 0.85, 0.95, 1.0)),
+        # Low SHR at altitude: the ADP sits ~45°F below the room, a wide bracket
+        (UnitSystem.IP, 10.0, 70.0, 0.0115, (0.58, 0.65, 0.8)),
+    ])
+    def test_batch_matches_scalar(self, unit_system, pressure, room_Tdb, room_W, shrs):
+        """An SHR sweep solved in one batch agrees with the scalar root-finder."""
+        slopes = np.array([compute_shr_slope(s, unit_system) for s in shrs])
+        batch = find_adp_from_shr_batch(room_Tdb, room_W, slopes, pressure, unit_system)
+        scalar = [find_adp_from_shr(room_Tdb, room_W, m, pressure, unit_system) for m in slopes]
+        assert batch == pytest.approx(scalar, abs=1e-6)
+
+    def test_batch_no_intersection(self):
+        slope = compute_shr_slope(0.5, UnitSystem.IP)
+        with pytest.raises(ValueError, match="does not intersect"):
+            find_adp_from_shr_batch(
+                75.0, 0.0093, np.array([slope]), DEFAULT_PRESSURE_IP, UnitSystem.IP
+            )
+
 
 # ---------------------------------------------------------------------------
 # Full SHR line calculation via API model
 # ---------------------------------------------------------------------------
 
 class TestCalculateSHRLine:
-    def setup_method(self):
-        self.result = calculate_shr_line(SHRLineInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_shr_line(SHRLineInput(
             unit_system=UnitSystem.IP,
             pressure=DEFAULT_PRESSURE_IP,
             room_pair=("Tdb", "RH"),
@@ -167,6 +219,21 @@ class TestCalculateSHRLine:
     def test_line_has_points(self):
         assert len(self.result.line_points) > 10
 
+    def test_line_array_matches_points(self):
+        line = self.result.line_array()
+        assert len(line) == len(self.result.line_points)
+        assert line["Tdb"][0] == self.result.line_points[0].Tdb
+        assert line["W"][-1] == self.result.line_points[-1].W
+
+    def test_equality_after_line_array(self):
+        self.result.line_array()
+        assert self.result == self.result.model_copy()
+
+    def test_line_below_saturation(self):
+        line = self.result.line_array()
+        W_sat = _sat_w_vec(line["Tdb"], DEFAULT_PRESSURE_IP)
+        assert np.all(line["W"] <= W_sat * 1.02)
+
     def test_adp_reasonable(self):
         assert 30.0 < self.result.adp_Tdb < 75.0
 
@@ -178,6 +245,21 @@ class TestCalculateSHRLine:
         assert self.result.room_point["RH"] == approx(50.0)
 
 
+# Standard AHU scenario shared by the GSHR and ESHR classes.
+_GSHR_INPUT = GSHRInput(
+    unit_system=UnitSystem.IP,
+    pressure=DEFAULT_PRESSURE_IP,
+    room_pair=("Tdb", "RH"),
+    room_values=(75.0, 50.0),
+    oa_pair=("Tdb", "Twb"),
+    oa_values=(95.0, 75.0),
+    room_sensible_load=60000.0,
+    room_total_load=80000.0,
+    oa_fraction=0.20,
+    total_airflow=2000.0,
+)
+
+
 # ---------------------------------------------------------------------------
 # GSHR calculation
 # ---------------------------------------------------------------------------
@@ -191,19 +273,10 @@ class TestGSHR:
     OA fraction: 0.20, total airflow: 2000 CFM
     """
 
-    def setup_method(self):
-        self.result = calculate_gshr(GSHRInput(
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            room_pair=("Tdb", "RH"),
-            room_values=(75.0, 50.0),
-            oa_pair=("Tdb", "Twb"),
-            oa_values=(95.0, 75.0),
-            room_sensible_load=60000.0,
-            room_total_load=80000.0,
-            oa_fraction=0.20,
-            total_airflow=2000.0,
-        ))
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_gshr(_GSHR_INPUT)
 
     def test_room_shr(self):
         assert self.result.room_shr == approx(0.75, abs_tol=0.01)
@@ -242,20 +315,12 @@ class TestGSHR:
 # ---------------------------------------------------------------------------
 
 class TestESHR:
-    def setup_method(self):
-        self.result = calculate_gshr(GSHRInput(
-            unit_system=UnitSystem.IP,
-            pressure=DEFAULT_PRESSURE_IP,
-            room_pair=("Tdb", "RH"),
-            room_values=(75.0, 50.0),
-            oa_pair=("Tdb", "Twb"),
-            oa_values=(95.0, 75.0),
-            room_sensible_load=60000.0,
-            room_total_load=80000.0,
-            oa_fraction=0.20,
-            total_airflow=2000.0,
-            bypass_factor=0.15,
-        ))
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_gshr(
+            _GSHR_INPUT.model_copy(update={"bypass_factor": 0.15})
+        )
 
     def test_eshr_computed(self):
         assert self.result.eshr is not None
@@ -277,34 +342,28 @@ class TestESHR:
 # ---------------------------------------------------------------------------
 
 class TestSHREdgeCases:
-    def test_shr_too_low(self):
-        with pytest.raises(ValueError):
-            calculate_shr_line(SHRLineInput(
-                room_pair=("Tdb", "RH"),
-                room_values=(75.0, 50.0),
-                shr=0.0,
-            ))
-
-    def test_shr_too_high(self):
-        with pytest.raises(ValueError):
-            calculate_shr_line(SHRLineInput(
-                room_pair=("Tdb", "RH"),
-                room_values=(75.0, 50.0),
-                shr=1.5,
-            ))
-
-    def test_sensible_exceeds_total(self):
-        with pytest.raises(ValueError, match="cannot exceed"):
-            calculate_gshr(GSHRInput(
-                room_pair=("Tdb", "RH"),
-                room_values=(75.0, 50.0),
+
+    _ROOM = dict(room_pair=("Tdb", "RH"), room_values=(75.0, 50.0))
+
+    @pytest.mark.parametrize("calculate, model, kwargs, match", [
+        (calculate_shr_line, SHRLineInput, {"shr": 0.0}, "SHR must be between"),
+        (calculate_shr_line, SHRLineInput, {"shr": 1.5}, "SHR must be between"),
+        (
+            calculate_gshr, GSHRInput,
+            dict(
                 oa_pair=("Tdb", "RH"),
                 oa_values=(95.0, 50.0),
                 room_sensible_load=100000.0,
                 room_total_load=80000.0,
                 oa_fraction=0.20,
                 total_airflow=2000.0,
-            ))
+            ),
+            "cannot exceed",
+        ),
+    ], ids=["shr_too_low", "shr_too_high", "sensible_exceeds_total"])
+    def test_invalid_input(self, calculate, model, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            calculate(model(**self._ROOM, **kwargs))
 
 
 # ---------------------------------------------------------------------------
@@ -312,8 +371,10 @@ class TestSHREdgeCases:
 # ---------------------------------------------------------------------------
 
 class TestSHRSI:
-    def setup_method(self):
-        self.result = calculate_shr_line(SHRLineInput(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = calculate_shr_line(SHRLineInput(
             unit_system=UnitSystem.SI,
             pressure=DEFAULT_PRESSURE_SI,
             room_pair=("Tdb", "RH"),
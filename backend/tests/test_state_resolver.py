@@ -7,9 +7,18 @@ psychrometric tables and cross-checked with psychrolib's own test suite.
 All IP tests use standard atmospheric pressure: 14.696 psia.
 """
 
+import re
+
+import numpy as np
 import pytest
 from app.config import UnitSystem, DEFAULT_PRESSURE_IP, DEFAULT_PRESSURE_SI
-from app.engine.state_resolver import resolve_state_point, get_pressure_from_altitude
+from app.engine import state_resolver
+from app.engine.processes.utils import ln_sat_vap_pres
+from app.engine.state_resolver import (
+    _newton_bracketed,
+    resolve_state_point,
+    get_pressure_from_altitude,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -25,15 +34,28 @@ def approx(value: float, rel_tol: float = 0.01, abs_tol: float = 0.1):
     return pytest.approx(value, rel=rel_tol, abs=abs_tol)
 
 
+# Tolerances reused across classes
+SAT_TOL = dict(abs_tol=0.3)      # Twb/Tdp convergence at saturation
+RH_TOL = dict(abs_tol=0.5)       # RH between input pairs, %
+W_TOL = dict(abs_tol=0.0002)     # W between input pairs, lb/lb
+
+# Error-message patterns, compiled once
+_RE_UNSUPPORTED = re.compile("Unsupported input pair")
+_RE_OUT_OF_RANGE = re.compile("outside the achievable range")
+
+
 # ---------------------------------------------------------------------------
 # Test: Tdb + RH input pair (IP)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestTdbRhIP:
     """Standard conditions: 75°F, 50% RH at sea level."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "RH"),
             values=(75.0, 50.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -47,25 +69,15 @@ class TestTdbRhIP:
     def test_relative_humidity(self):
         assert self.result.RH == approx(50.0)
 
-    def test_wet_bulb(self):
-        # Expected ~62.5-63°F at 75°F/50% RH
-        assert 61.0 <= self.result.Twb <= 64.0
-
-    def test_dew_point(self):
-        # Expected ~55.0-55.5°F
-        assert 54.0 <= self.result.Tdp <= 57.0
-
-    def test_humidity_ratio_grains(self):
-        # Expected ~65-66 grains/lb
-        assert 63.0 <= self.result.W_display <= 68.0
-
-    def test_enthalpy(self):
-        # Expected ~28.1-28.3 BTU/lb
-        assert 27.0 <= self.result.h <= 30.0
-
-    def test_specific_volume(self):
-        # Expected ~13.67-13.7 ft³/lb
-        assert 13.5 <= self.result.v <= 13.9
+    @pytest.mark.parametrize("field, lo, hi", [
+        ("Twb", 61.0, 64.0),        # expected ~62.5-63°F
+        ("Tdp", 54.0, 57.0),        # expected ~55.0-55.5°F
+        ("W_display", 63.0, 68.0),  # expected ~65-66 grains/lb
+        ("h", 27.0, 30.0),          # expected ~28.1-28.3 BTU/lb
+        ("v", 13.5, 13.9),          # expected ~13.67-13.7 ft³/lb
+    ])
+    def test_field_in_range(self, field, lo, hi):
+        assert lo <= getattr(self.result, field) <= hi
 
     def test_label(self):
         assert self.result.label == "Room"
@@ -74,11 +86,14 @@ class TestTdbRhIP:
         assert self.result.unit_system == UnitSystem.IP
 
 
+@pytest.mark.fast
 class TestTdbRhIP_Hot:
     """Hot outdoor conditions: 95°F, 40% RH (typical California summer)."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "RH"),
             values=(95.0, 40.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -91,24 +106,23 @@ class TestTdbRhIP_Hot:
     def test_relative_humidity(self):
         assert self.result.RH == approx(40.0)
 
-    def test_wet_bulb(self):
-        # Expected ~76-78°F
-        assert 75.0 <= self.result.Twb <= 80.0
-
-    def test_humidity_ratio_grains(self):
-        # Expected ~98-100 grains/lb
-        assert 95.0 <= self.result.W_display <= 105.0
-
-    def test_enthalpy(self):
-        # Expected ~38-40 BTU/lb
-        assert 37.0 <= self.result.h <= 42.0
+    @pytest.mark.parametrize("field, lo, hi", [
+        ("Twb", 75.0, 80.0),          # expected ~76-78°F
+        ("W_display", 95.0, 105.0),   # expected ~98-100 grains/lb
+        ("h", 37.0, 42.0),            # expected ~38-40 BTU/lb
+    ])
+    def test_field_in_range(self, field, lo, hi):
+        assert lo <= getattr(self.result, field) <= hi
 
 
+@pytest.mark.fast
 class TestTdbRhIP_Saturated:
     """Saturated air: 55°F, 100% RH (typical coil leaving condition)."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "RH"),
             values=(55.0, 100.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -117,8 +131,8 @@ class TestTdbRhIP_Saturated:
 
     def test_tdb_equals_twb_equals_tdp(self):
         # At saturation, all three temperatures converge
-        assert self.result.Twb == approx(55.0, abs_tol=0.3)
-        assert self.result.Tdp == approx(55.0, abs_tol=0.3)
+        assert self.result.Twb == approx(55.0, **SAT_TOL)
+        assert self.result.Tdp == approx(55.0, **SAT_TOL)
 
     def test_degree_of_saturation(self):
         assert self.result.mu == approx(1.0, abs_tol=0.01)
@@ -128,11 +142,14 @@ class TestTdbRhIP_Saturated:
 # Test: Tdb + Twb input pair (IP)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestTdbTwbIP:
     """75°F db / 62.5°F wb — should match ~50% RH conditions."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "Twb"),
             values=(75.0, 62.5),
             pressure=DEFAULT_PRESSURE_IP,
@@ -153,11 +170,14 @@ class TestTdbTwbIP:
 # Test: Tdb + Tdp input pair (IP)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestTdbTdpIP:
     """75°F db / 55°F dew point."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "Tdp"),
             values=(75.0, 55.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -179,11 +199,14 @@ class TestTdbTdpIP:
 # Test: Tdb + W input pair (IP)
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestTdbWIP:
     """75°F db, W = 0.0093 lb/lb (~65 grains)."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "W"),
             values=(75.0, 0.0093),
             pressure=DEFAULT_PRESSURE_IP,
@@ -204,14 +227,17 @@ class TestTdbWIP:
 
 
 # ---------------------------------------------------------------------------
-# Test: Tdb + h input pair (IP) — iterative solver
+# Test: Tdb + h input pair (IP) — closed form
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestTdbEnthalpyIP:
     """75°F db, h = 28.2 BTU/lb."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "h"),
             values=(75.0, 28.2),
             pressure=DEFAULT_PRESSURE_IP,
@@ -235,8 +261,10 @@ class TestTdbEnthalpyIP:
 class TestTwbRhIP:
     """Twb = 62.5°F, RH = 50% — should resolve to ~75°F db."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Twb", "RH"),
             values=(62.5, 50.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -260,8 +288,10 @@ class TestTwbRhIP:
 class TestTdpRhIP:
     """Tdp = 55°F, RH = 50%."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdp", "RH"),
             values=(55.0, 50.0),
             pressure=DEFAULT_PRESSURE_IP,
@@ -279,10 +309,81 @@ class TestTdpRhIP:
         assert 72.0 <= self.result.Tdb <= 78.0
 
 
+class TestSaturatedIterativePairs:
+    """At RH = 100% the iterative pairs must land on Tdb == Tdp / Twb."""
+
+    @pytest.mark.parametrize("Tdp, pressure", [
+        (92.0, DEFAULT_PRESSURE_IP),
+        (113.0, DEFAULT_PRESSURE_IP),
+        (90.0, 10.0),
+        (112.0, 10.0),
+    ])
+    def test_tdp_rh_100(self, Tdp, pressure):
+        result = resolve_state_point(("Tdp", "RH"), (Tdp, 100.0), pressure, UnitSystem.IP)
+        assert result.Tdb == Tdp
+        assert result.RH == 100.0
+
+    @pytest.mark.parametrize("Twb, pressure, unit_system", [
+        (62.0, DEFAULT_PRESSURE_IP, UnitSystem.IP),
+        (90.0, 12.0, UnitSystem.IP),
+        (51.5, 70000.0, UnitSystem.SI),
+    ])
+    def test_twb_rh_100(self, Twb, pressure, unit_system):
+        result = resolve_state_point(("Twb", "RH"), (Twb, 100.0), pressure, unit_system)
+        assert result.Tdb == Twb
+        assert result.RH == approx(100.0, abs_tol=1e-4)
+
+
+# ---------------------------------------------------------------------------
+# Test: Newton solver behind the iterative pairs
+# ---------------------------------------------------------------------------
+
+class TestNewtonSolver:
+
+    @pytest.mark.parametrize("pair, values", [
+        (("Twb", "RH"), (62.5, 50.0)),
+        (("Tdp", "RH"), (55.0, 50.0)),
+    ])
+    def test_converges_in_few_steps(self, monkeypatch, pair, values):
+        steps = []
+
+        def counting(func, lo, hi, xtol):
+            root, n = _newton_bracketed(func, lo, hi, xtol)
+            steps.append(n)
+            return root, n
+
+        monkeypatch.setattr(state_resolver, "_newton_bracketed", counting)
+        resolve_state_point(pair, values, DEFAULT_PRESSURE_IP, UnitSystem.IP)
+        assert steps and steps[0] <= 5
+
+    def test_matches_closed_form_root(self):
+        root, _ = _newton_bracketed(lambda x: (x * x - 2.0, 2.0 * x), 0.0, 2.0, 1e-12)
+        assert root == pytest.approx(2.0 ** 0.5, abs=1e-12)
+
+    def test_root_at_upper_bound(self):
+        root, _ = _newton_bracketed(lambda x: (x - 2.0, 1.0), 0.0, 2.0, 1e-12)
+        assert root == 2.0
+
+    def test_unbracketed_raises(self):
+        with pytest.raises(ValueError, match="different signs"):
+            _newton_bracketed(lambda x: (x * x + 1.0, 2.0 * x), 0.0, 2.0, 1e-12)
+
+    @pytest.mark.parametrize("Tdb, unit_system", [
+        (20.0, UnitSystem.IP), (75.0, UnitSystem.IP),
+        (-5.0, UnitSystem.SI), (24.0, UnitSystem.SI),
+    ])
+    def test_scalar_ln_sat_vap_pres_matches_array(self, Tdb, unit_system):
+        scalar = ln_sat_vap_pres(Tdb, unit_system)
+        array = ln_sat_vap_pres(np.array([Tdb]), unit_system)
+        assert all(type(v) is float for v in scalar)
+        assert scalar == (array[0][0], array[1][0])
+
+
 # ---------------------------------------------------------------------------
 # Test: Reverse input pair ordering
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestReversePairOrdering:
     """Input pair can be given in either order, e.g. ('RH', 'Tdb') instead of ('Tdb', 'RH')."""
 
@@ -301,11 +402,14 @@ class TestReversePairOrdering:
 # Test: SI unit system
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestSIUnits:
     """24°C, 50% RH at standard atmospheric pressure."""
 
-    def setup_method(self):
-        self.result = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        cls.result = resolve_state_point(
             input_pair=("Tdb", "RH"),
             values=(24.0, 50.0),
             pressure=DEFAULT_PRESSURE_SI,
@@ -330,6 +434,7 @@ class TestSIUnits:
 # Test: Altitude / pressure conversion
 # ---------------------------------------------------------------------------
 
+@pytest.mark.fast
 class TestAltitudePressure:
     def test_sea_level_ip(self):
         p = get_pressure_from_altitude(0.0, UnitSystem.IP)
@@ -349,6 +454,18 @@ class TestAltitudePressure:
         p_high = get_pressure_from_altitude(5000.0, UnitSystem.IP)
         assert p_high < p_sea
 
+    def test_pressure_cache_hit(self):
+        p = get_pressure_from_altitude(1000.0, UnitSystem.SI)
+        assert get_pressure_from_altitude(1000.0, UnitSystem.SI) is p
+
+    def test_unit_system_set_on_cache_hit(self):
+        import psychrolib
+
+        get_pressure_from_altitude(1000.0, UnitSystem.SI)
+        resolve_state_point(("Tdb", "RH"), (75.0, 50.0), DEFAULT_PRESSURE_IP, UnitSystem.IP)
+        get_pressure_from_altitude(1000.0, UnitSystem.SI)
+        assert not psychrolib.isIP()
+
 
 # ---------------------------------------------------------------------------
 # Test: Error handling
@@ -356,7 +473,7 @@ class TestAltitudePressure:
 
 class TestErrors:
     def test_unsupported_pair(self):
-        with pytest.raises(ValueError, match="Unsupported input pair"):
+        with pytest.raises(ValueError, match=_RE_UNSUPPORTED):
             resolve_state_point(
                 input_pair=("h", "v"),
                 values=(28.0, 13.5),
@@ -365,7 +482,7 @@ class TestErrors:
             )
 
     def test_enthalpy_out_of_range(self):
-        with pytest.raises(ValueError, match="outside the achievable range"):
+        with pytest.raises(ValueError, match=_RE_OUT_OF_RANGE):
             resolve_state_point(
                 input_pair=("Tdb", "h"),
                 values=(75.0, 200.0),  # impossibly high enthalpy at 75°F
@@ -373,6 +490,15 @@ class TestErrors:
                 unit_system=UnitSystem.IP,
             )
 
+    def test_twb_rh_zero_rh(self):
+        with pytest.raises(ValueError, match="Cannot find a valid Tdb"):
+            resolve_state_point(
+                input_pair=("Twb", "RH"),
+                values=(60.0, 0.0),
+                pressure=DEFAULT_PRESSURE_IP,
+                unit_system=UnitSystem.IP,
+            )
+
 
 # ---------------------------------------------------------------------------
 # Test: Cross-consistency (resolve from different pairs, same conditions)
@@ -384,52 +510,79 @@ class TestCrossConsistency:
     All results should produce the same properties (within tolerance).
     """
 
-    def setup_method(self):
-        # First, get a reference from Tdb+RH
-        self.ref = resolve_state_point(
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _setup(cls):
+        # First, get a reference from Tdb+RH, then re-resolve it from each
+        # other pair
+        ref = resolve_state_point(
             input_pair=("Tdb", "RH"),
             values=(75.0, 50.0),
             pressure=DEFAULT_PRESSURE_IP,
             unit_system=UnitSystem.IP,
         )
+        cls.ref = ref
+        cls.by_pair = {
+            second: resolve_state_point(
+                input_pair=("Tdb", second),
+                values=(ref.Tdb, getattr(ref, second)),
+                pressure=DEFAULT_PRESSURE_IP,
+                unit_system=UnitSystem.IP,
+            )
+            for second in ("Twb", "Tdp", "W", "h")
+        }
 
     def test_tdb_twb_matches(self):
-        result = resolve_state_point(
-            input_pair=("Tdb", "Twb"),
-            values=(self.ref.Tdb, self.ref.Twb),
-            pressure=DEFAULT_PRESSURE_IP,
-            unit_system=UnitSystem.IP,
-        )
-        assert result.RH == approx(self.ref.RH, abs_tol=0.5)
-        assert result.W == approx(self.ref.W, abs_tol=0.0002)
+        result = self.by_pair["Twb"]
+        assert result.RH == approx(self.ref.RH, **RH_TOL)
+        assert result.W == approx(self.ref.W, **W_TOL)
         assert result.h == approx(self.ref.h, abs_tol=0.2)
 
     def test_tdb_tdp_matches(self):
-        result = resolve_state_point(
-            input_pair=("Tdb", "Tdp"),
-            values=(self.ref.Tdb, self.ref.Tdp),
-            pressure=DEFAULT_PRESSURE_IP,
-            unit_system=UnitSystem.IP,
-        )
-        assert result.RH == approx(self.ref.RH, abs_tol=0.5)
-        assert result.W == approx(self.ref.W, abs_tol=0.0002)
+        result = self.by_pair["Tdp"]
+        assert result.RH == approx(self.ref.RH, **RH_TOL)
+        assert result.W == approx(self.ref.W, **W_TOL)
 
     def test_tdb_w_matches(self):
-        result = resolve_state_point(
-            input_pair=("Tdb", "W"),
-            values=(self.ref.Tdb, self.ref.W),
-            pressure=DEFAULT_PRESSURE_IP,
-            unit_system=UnitSystem.IP,
-        )
-        assert result.RH == approx(self.ref.RH, abs_tol=0.5)
-        assert result.Twb == approx(self.ref.Twb, abs_tol=0.3)
+        result = self.by_pair["W"]
+        assert result.RH == approx(self.ref.RH, **RH_TOL)
+        assert result.Twb == approx(self.ref.Twb, **SAT_TOL)
 
     def test_tdb_h_matches(self):
-        result = resolve_state_point(
-            input_pair=("Tdb", "h"),
-            values=(self.ref.Tdb, self.ref.h),
-            pressure=DEFAULT_PRESSURE_IP,
-            unit_system=UnitSystem.IP,
-        )
+        result = self.by_pair["h"]
         assert result.RH == approx(self.ref.RH, abs_tol=1.0)
         assert result.W == approx(self.ref.W, abs_tol=0.0003)
+
+
+# ---------------------------------------------------------------------------
+# Test: Shared (pressure, Tdb, W) state cache
+# ---------------------------------------------------------------------------
+
+class TestStateCache:
+    """Repeated resolves share cached properties without leaking unit systems."""
+
+    def test_repeat_resolve_is_identical(self):
+        args = dict(input_pair=("Tdb", "RH"), values=(75.0, 50.0),
+                    pressure=DEFAULT_PRESSURE_IP, unit_system=UnitSystem.IP)
+        assert resolve_state_point(**args) == resolve_state_point(**args)
+
+    def test_unit_system_switch_after_cache_hit(self):
+        """An IP cache hit must still leave psychrolib configured for IP."""
+        import psychrolib
+
+        ip = dict(input_pair=("Tdb", "RH"), values=(75.0, 50.0),
+                  pressure=DEFAULT_PRESSURE_IP, unit_system=UnitSystem.IP)
+        resolve_state_point(**ip)
+        resolve_state_point(("Tdb", "RH"), (24.0, 50.0), DEFAULT_PRESSURE_SI, UnitSystem.SI)
+        resolve_state_point(**ip)
+        assert psychrolib.isIP()
+
+    @pytest.mark.parametrize("pair,values,prop,expected", [
+        (("Tdp", "RH"), (-20.0, 50.0), "Tdp", -20.0),
+        (("Tdp", "RH"), (-20.0, 50.0), "RH", 50.0),
+        (("Twb", "RH"), (-10.0, 1.0), "RH", 1.0),
+    ])
+    def test_cache_preserves_input_values(self, pair, values, prop, expected):
+        """The cache key must not perturb the properties the user entered."""
+        result = resolve_state_point(pair, values, DEFAULT_PRESSURE_IP, UnitSystem.IP)
+        assert getattr(result, prop) == expected
@@ -2,13 +2,16 @@
 Tests for TMY data processing engine and API (TMY3 CSV + EPW).
 """
 
+import re
+
+import numpy as np
 import pytest
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.engine.tmy_processor import parse_tmy3, parse_epw
 
-client = TestClient(app)
+# Error-message patterns, compiled once
+_RE_TOO_SHORT = re.compile("too short")
+_RE_NO_TDB = re.compile("dry-bulb")
 
 # Minimal TMY3 fixture (10 hours of fake data in TMY3 format)
 SAMPLE_TMY3 = """724940,"SAMPLE CITY","ST",35.0,-90.0,-6.0,100,12345
@@ -24,91 +27,94 @@ Date (MM/DD/YYYY),Time (HH:MM),Dry-bulb (C),Dew-point (C),RHum(%),Pressure (mbar
 07/01/2020,13:00,33.5,21.5,48,1010
 07/01/2020,14:00,34.0,20.0,42,1010
 """
+SAMPLE_TMY3_BYTES = SAMPLE_TMY3.encode()
+
+# TMY3-shaped file with no recognizable temperature columns
+_BAD_CSV = """724940,"CITY","ST"
+Col1,Col2,Col3
+""" + "\n".join(f"{i},{i},{i}" for i in range(20))
+
+
+@pytest.fixture(scope="module")
+def tmy3_result_ip():
+    return parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
+
+
+@pytest.fixture(scope="module")
+def tmy3_result_si():
+    return parse_tmy3(SAMPLE_TMY3, unit_system="SI", pressure=101325)
 
 
 class TestParseTMY3:
-    def test_parse_ip_units(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
-        assert result["unit_system"] == "IP"
-        assert result["total_hours"] == 10
-        assert len(result["scatter_points"]) == 10
-
-    def test_parse_si_units(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="SI", pressure=101325)
-        assert result["unit_system"] == "SI"
-        assert result["total_hours"] == 10
-
-    def test_scatter_points_have_required_fields(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
-        for pt in result["scatter_points"]:
+    def test_parse_ip_units(self, tmy3_result_ip):
+        assert tmy3_result_ip["unit_system"] == "IP"
+        assert tmy3_result_ip["total_hours"] == 10
+        assert len(tmy3_result_ip["scatter_points"]) == 10
+
+    def test_parse_si_units(self, tmy3_result_si):
+        assert tmy3_result_si["unit_system"] == "SI"
+        assert tmy3_result_si["total_hours"] == 10
+
+    def test_scatter_points_have_required_fields(self, tmy3_result_ip):
+        for pt in tmy3_result_ip["scatter_points"]:
             assert "Tdb" in pt
             assert "W_display" in pt
             assert "hour" in pt
             assert "month" in pt
 
-    def test_month_extraction(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
+    def test_arrays_match_scatter_points(self, tmy3_result_ip):
+        arrays = tmy3_result_ip["arrays"]
+        pts = tmy3_result_ip["scatter_points"]
+        for key in ("Tdb", "W_display", "hour", "month"):
+            assert arrays[key].tolist() == [p[key] for p in pts]
+
+    def test_month_extraction(self, tmy3_result_ip):
         # First 7 points are January, last 3 are July
-        jan_pts = [p for p in result["scatter_points"] if p["month"] == 1]
-        jul_pts = [p for p in result["scatter_points"] if p["month"] == 7]
-        assert len(jan_pts) == 7
-        assert len(jul_pts) == 3
-
-    def test_temperature_conversion_ip(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
-        # 32°C = 89.6°F
-        hot_pts = [p for p in result["scatter_points"] if p["Tdb"] > 80]
-        assert len(hot_pts) == 3
-
-    def test_temperature_stays_si(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="SI", pressure=101325)
-        hot_pts = [p for p in result["scatter_points"] if p["Tdb"] > 30]
-        assert len(hot_pts) == 3
-
-    def test_bin_matrix_generated(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
-        assert len(result["bin_Tdb_edges"]) > 0
-        assert len(result["bin_W_edges"]) > 0
-        assert len(result["bin_matrix"]) > 0
+        months = tmy3_result_ip["arrays"]["month"]
+        assert np.count_nonzero(months == 1) == 7
+        assert np.count_nonzero(months == 7) == 3
+
+    def test_bin_matrix_generated(self, tmy3_result_ip):
+        assert len(tmy3_result_ip["bin_Tdb_edges"]) > 0
+        assert len(tmy3_result_ip["bin_W_edges"]) > 0
+        assert len(tmy3_result_ip["bin_matrix"]) > 0
         # Total counts in matrix should equal total_hours
-        total = sum(sum(row) for row in result["bin_matrix"])
-        assert total == result["total_hours"]
+        total = int(np.asarray(tmy3_result_ip["bin_matrix"]).sum())
+        assert total == tmy3_result_ip["total_hours"]
 
-    def test_location_name_extracted(self):
-        result = parse_tmy3(SAMPLE_TMY3, unit_system="IP", pressure=14.696)
-        assert result["location_name"] == "SAMPLE CITY, ST"
+    def test_location_name_extracted(self, tmy3_result_ip):
+        assert tmy3_result_ip["location_name"] == "SAMPLE CITY, ST"
 
     def test_empty_file_raises(self):
-        with pytest.raises(ValueError, match="too short"):
+        with pytest.raises(ValueError, match=_RE_TOO_SHORT):
             parse_tmy3("short", unit_system="IP", pressure=14.696)
 
     def test_no_tdb_column_raises(self):
-        bad_csv = """724940,"CITY","ST"
-Col1,Col2,Col3
-""" + "\n".join([f"{i},{i},{i}" for i in range(20)])
-        with pytest.raises(ValueError, match="dry-bulb"):
-            parse_tmy3(bad_csv, unit_system="IP", pressure=14.696)
+        with pytest.raises(ValueError, match=_RE_NO_TDB):
+            parse_tmy3(_BAD_CSV, unit_system="IP", pressure=14.696)
 
 
 class TestTMYAPI:
-    def test_upload_endpoint_success(self):
+    def test_upload_endpoint_columnar(self, client):
         resp = client.post(
-            "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
-            files={"file": ("test.csv", SAMPLE_TMY3.encode(), "text/csv")},
+            "/api/v1/tmy/upload?unit_system=IP&pressure=14.696&format=soa",
+            files={"file": ("test.csv", SAMPLE_TMY3_BYTES, "text/csv")},
         )
         assert resp.status_code == 200
         data = resp.json()
-        assert data["total_hours"] == 10
-        assert len(data["scatter_points"]) == 10
+        assert data["scatter_points"] == []
+        columns = data["scatter_arrays"]
+        assert all(len(columns[key]) == 10 for key in ("Tdb", "W_display", "hour", "month"))
+        assert columns["month"].count(7) == 3
 
-    def test_upload_endpoint_wrong_filetype(self):
+    def test_upload_endpoint_wrong_filetype(self, client):
         resp = client.post(
             "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
             files={"file": ("test.txt", b"some data", "text/plain")},
         )
         assert resp.status_code == 400
 
-    def test_upload_endpoint_bad_data(self):
+    def test_upload_endpoint_bad_data(self, client):
         resp = client.post(
             "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
             files={"file": ("test.csv", b"bad data\n", "text/csv")},
@@ -138,91 +144,116 @@ DATA PERIODS,1,1,Data,Sunday,1/1,12/31
 2020,7,1,13,60,A7A7A7A7*0?9?9?9?9?9?9*0A7A7A7A7*0,33.5,21.5,48,101000,0,0,0,0,0,0,0,0,0,0,190,3.5,2,2,10.0,77777,9,999999999,30,0.100,0,88,999
 2020,7,1,14,60,A7A7A7A7*0?9?9?9?9?9?9*0A7A7A7A7*0,34.0,20.0,42,101000,0,0,0,0,0,0,0,0,0,0,200,3.0,1,1,10.0,77777,9,999999999,30,0.100,0,88,999
 """
+SAMPLE_EPW_BYTES = SAMPLE_EPW.encode()
+
+
+@pytest.fixture(scope="module")
+def epw_result_ip():
+    return parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
+
+
+@pytest.fixture(scope="module")
+def epw_result_si():
+    return parse_epw(SAMPLE_EPW, unit_system="SI", pressure=101325)
 
 
 class TestParseEPW:
-    def test_parse_ip_units(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        assert result["unit_system"] == "IP"
-        assert result["total_hours"] == 10
-        assert len(result["scatter_points"]) == 10
-
-    def test_parse_si_units(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="SI", pressure=101325)
-        assert result["unit_system"] == "SI"
-        assert result["total_hours"] == 10
-
-    def test_scatter_points_have_required_fields(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        for pt in result["scatter_points"]:
+    def test_parse_ip_units(self, epw_result_ip):
+        assert epw_result_ip["unit_system"] == "IP"
+        assert epw_result_ip["total_hours"] == 10
+        assert len(epw_result_ip["scatter_points"]) == 10
+
+    def test_parse_si_units(self, epw_result_si):
+        assert epw_result_si["unit_system"] == "SI"
+        assert epw_result_si["total_hours"] == 10
+
+    def test_scatter_points_have_required_fields(self, epw_result_ip):
+        for pt in epw_result_ip["scatter_points"]:
             assert "Tdb" in pt
             assert "W_display" in pt
             assert "hour" in pt
             assert "month" in pt
 
-    def test_month_extraction(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        jan_pts = [p for p in result["scatter_points"] if p["month"] == 1]
-        jul_pts = [p for p in result["scatter_points"] if p["month"] == 7]
-        assert len(jan_pts) == 7
-        assert len(jul_pts) == 3
-
-    def test_temperature_conversion_ip(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        # 32°C = 89.6°F
-        hot_pts = [p for p in result["scatter_points"] if p["Tdb"] > 80]
-        assert len(hot_pts) == 3
-
-    def test_temperature_stays_si(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="SI", pressure=101325)
-        hot_pts = [p for p in result["scatter_points"] if p["Tdb"] > 30]
-        assert len(hot_pts) == 3
-
-    def test_bin_matrix_generated(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        assert len(result["bin_Tdb_edges"]) > 0
-        assert len(result["bin_W_edges"]) > 0
-        assert len(result["bin_matrix"]) > 0
-        total = sum(sum(row) for row in result["bin_matrix"])
-        assert total == result["total_hours"]
-
-    def test_location_name_extracted(self):
-        result = parse_epw(SAMPLE_EPW, unit_system="IP", pressure=14.696)
-        assert result["location_name"] == "Sample City, ST, USA"
+    @pytest.mark.parametrize("result_fixture", ["epw_result_ip", "epw_result_si"])
+    def test_arrays_match_scatter_points(self, request, result_fixture):
+        result = request.getfixturevalue(result_fixture)
+        arrays = result["arrays"]
+        pts = result["scatter_points"]
+        for key in ("Tdb", "W_display", "hour", "month"):
+            assert arrays[key].tolist() == [p[key] for p in pts]
+
+    def test_month_extraction(self, epw_result_ip):
+        months = epw_result_ip["arrays"]["month"]
+        assert np.count_nonzero(months == 1) == 7
+        assert np.count_nonzero(months == 7) == 3
+
+    def test_bin_matrix_generated(self, epw_result_ip):
+        assert len(epw_result_ip["bin_Tdb_edges"]) > 0
+        assert len(epw_result_ip["bin_W_edges"]) > 0
+        assert len(epw_result_ip["bin_matrix"]) > 0
+        total = int(np.asarray(epw_result_ip["bin_matrix"]).sum())
+        assert total == epw_result_ip["total_hours"]
+
+    def test_location_name_extracted(self, epw_result_ip):
+        assert epw_result_ip["location_name"] == "Sample City, ST, USA"
 
     def test_empty_file_raises(self):
-        with pytest.raises(ValueError, match="too short"):
+        with pytest.raises(ValueError, match=_RE_TOO_SHORT):
             parse_epw("short", unit_system="IP", pressure=14.696)
 
-    def test_uses_row_pressure(self):
+    def test_uses_row_pressure(self, epw_result_si):
         """EPW rows include atmospheric pressure; parser should use it."""
-        result = parse_epw(SAMPLE_EPW, unit_system="SI", pressure=101325)
         # Should successfully parse without error even if fallback pressure differs
-        assert result["total_hours"] == 10
+        assert epw_result_si["total_hours"] == 10
 
 
 class TestEPWAPI:
-    def test_upload_epw_success(self):
-        resp = client.post(
-            "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
-            files={"file": ("test.epw", SAMPLE_EPW.encode(), "application/octet-stream")},
-        )
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["total_hours"] == 10
-        assert len(data["scatter_points"]) == 10
-        assert data["location_name"] == "Sample City, ST, USA"
-
-    def test_upload_epw_wrong_filetype(self):
+    def test_upload_epw_wrong_filetype(self, client):
         resp = client.post(
             "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
             files={"file": ("test.txt", b"some data", "text/plain")},
         )
         assert resp.status_code == 400
 
-    def test_upload_epw_bad_data(self):
+    def test_upload_epw_bad_data(self, client):
         resp = client.post(
             "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
             files={"file": ("test.epw", b"bad data\n", "application/octet-stream")},
         )
         assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Unit conversion: both parsers, both unit systems
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("result_fixture, threshold", [
+    ("tmy3_result_ip", 80),  # 32°C = 89.6°F
+    ("tmy3_result_si", 30),
+    ("epw_result_ip", 80),
+    ("epw_result_si", 30),
+])
+def test_hot_hours(request, result_fixture, threshold):
+    """The three July afternoon hours (32-34°C) clear the threshold in either unit system."""
+    result = request.getfixturevalue(result_fixture)
+    assert np.count_nonzero(result["arrays"]["Tdb"] > threshold) == 3
+
+
+# ---------------------------------------------------------------------------
+# Upload endpoint: one POST per file format
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("body, filename, content_type, location", [
+    (SAMPLE_TMY3_BYTES, "test.csv", "text/csv", "SAMPLE CITY, ST"),
+    (SAMPLE_EPW_BYTES, "test.epw", "application/octet-stream", "Sample City, ST, USA"),
+])
+def test_upload_success(client, body, filename, content_type, location):
+    resp = client.post(
+        "/api/v1/tmy/upload?unit_system=IP&pressure=14.696",
+        files={"file": (filename, body, content_type)},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_hours"] == 10
+    assert len(data["scatter_points"]) == 10
+    assert data["location_name"] == location
@@ -3,16 +3,32 @@ Tests for weather data analysis pipeline: psychrometric calc, clustering,
 design point extraction, and the full orchestration pipeline.
 """
 
+import subprocess
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
 import pytest
 import psychrolib
+from pydantic import ValidationError
 
-from app.engine.tmy_processor import parse_epw_raw
+from app.engine.tmy_processor import parse_epw_raw, records_as_dicts
 from app.engine.weather_analysis.psychrometric_calc import compute_hourly_states
 from app.engine.weather_analysis.clustering import (
     cluster_weather_data,
     label_cluster,
+    scale_features,
+)
+from app.engine.weather_analysis import design_extractor
+from app.engine.weather_analysis.design_extractor import (
+    _extract_peaks,
+    extract_design_conditions,
+    extract_from_states,
 )
-from app.engine.weather_analysis.design_extractor import extract_design_conditions
+from app.models.weather_analysis import HourlyPsychroState
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
 
 
 # --- Fixtures ---
@@ -39,6 +55,22 @@ DATA PERIODS,1,1,Data,Sunday,1/1,12/31
 """
 
 
+@pytest.fixture(scope="module")
+def analysis_ip():
+    return extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="IP")
+
+
+@pytest.fixture(scope="module")
+def analysis_si():
+    return extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="SI")
+
+
+@pytest.fixture
+def empty_prepared_cache(monkeypatch):
+    """An empty prepared-weather cache for one test; the shared one is restored after."""
+    monkeypatch.setattr(design_extractor, "_prepared_cache", OrderedDict())
+
+
 def _approx(val, rel=0.01, abs_tol=0.1):
     """Approximate comparison with 1% relative or 0.1 absolute tolerance."""
     return pytest.approx(val, rel=rel, abs=abs_tol)
@@ -49,7 +81,7 @@ def _approx(val, rel=0.01, abs_tol=0.1):
 class TestParseEPWRaw:
     def test_returns_records(self):
         raw = parse_epw_raw(SAMPLE_EPW)
-        assert len(raw["records"]) == 10
+        assert all(len(col) == 10 for col in raw["hourly"].values())
 
     def test_location_metadata(self):
         raw = parse_epw_raw(SAMPLE_EPW)
@@ -68,7 +100,7 @@ class TestParseEPWRaw:
 
     def test_record_fields(self):
         raw = parse_epw_raw(SAMPLE_EPW)
-        rec = raw["records"][0]
+        rec = records_as_dicts(raw["hourly"])[0]
         assert rec["tdb_c"] == _approx(-5.0)
         assert rec["tdp_c"] == _approx(-10.0)
         assert rec["pressure_pa"] == _approx(101300.0)
@@ -79,7 +111,7 @@ class TestParseEPWRaw:
     def test_hot_record_values(self):
         raw = parse_epw_raw(SAMPLE_EPW)
         # Last record: 34.0°C, 20.0°C dp
-        rec = raw["records"][-1]
+        rec = records_as_dicts(raw["hourly"])[-1]
         assert rec["tdb_c"] == _approx(34.0)
         assert rec["tdp_c"] == _approx(20.0)
         assert rec["month"] == 7
@@ -88,13 +120,24 @@ class TestParseEPWRaw:
         with pytest.raises(ValueError, match="too short"):
             parse_epw_raw("short")
 
+    def test_skips_sentinels_and_defaults_bad_pressure(self):
+        lines = SAMPLE_EPW.strip().splitlines()
+        lines[8] = lines[8].replace(",-5.0,-10.0,", ",99.9,-10.0,")   # missing Tdb
+        lines[9] = lines[9].replace(",101300,", ",999999,")           # missing pressure
+        lines.insert(10, "2020,1,1,x,garbled")
+        raw = parse_epw_raw("\n".join(lines))
+        hourly = raw["hourly"]
+        assert len(hourly["tdb_c"]) == 9
+        assert hourly["tdb_c"][0] == _approx(-4.0)
+        assert hourly["pressure_pa"][0] == _approx(101325.0)
+
 
 # --- psychrometric_calc tests ---
 
 class TestComputeHourlyStates:
     def test_computes_all_records(self):
         raw = parse_epw_raw(SAMPLE_EPW)
-        states = compute_hourly_states(raw["records"])
+        states = compute_hourly_states(raw["hourly"])
         assert len(states) == 10
 
     def test_known_condition(self):
@@ -145,6 +188,30 @@ class TestComputeHourlyStates:
         assert s.humidity_ratio > 0
         assert 0.0 < s.relative_humidity < 1.0
 
+    @pytest.mark.parametrize("tdb, tdp, pressure", [
+        (35.0, 20.0, 101325.0),
+        (-12.0, -20.0, 101325.0),   # ice-side saturation and wet-bulb branch
+        (28.0, 27.5, 84000.0),      # near saturation at altitude
+    ])
+    def test_matches_psychrolib(self, tdb, tdp, pressure):
+        """The vectorized batch reproduces the scalar psychrolib calls."""
+        records = [{"tdb_c": tdb, "tdp_c": tdp, "pressure_pa": pressure,
+                    "month": 1, "day": 1, "hour": 1}]
+        s = compute_hourly_states(records)[0]
+
+        psychrolib.SetUnitSystem(psychrolib.SI)
+        w = psychrolib.GetHumRatioFromTDewPoint(tdp, pressure)
+        assert s.humidity_ratio == pytest.approx(w, rel=1e-9)
+        assert s.relative_humidity == pytest.approx(
+            psychrolib.GetRelHumFromTDewPoint(tdb, tdp), rel=1e-9)
+        assert s.enthalpy_j_per_kg == pytest.approx(
+            psychrolib.GetMoistAirEnthalpy(tdb, w), rel=1e-9)
+        assert s.specific_volume == pytest.approx(
+            psychrolib.GetMoistAirVolume(tdb, w, pressure), rel=1e-9)
+        # psychrolib's own bisection stops within 0.001°C
+        assert s.wet_bulb_c == pytest.approx(
+            psychrolib.GetTWetBulbFromTDewPoint(tdb, tdp, pressure), abs=1e-3)
+
     def test_skips_corrupt_records(self):
         """Records with invalid data should be skipped, not crash."""
         records = [
@@ -181,7 +248,6 @@ class TestClusterWeatherData:
     def _make_states(self, data):
         """Helper: create HourlyPsychroState objects from (tdb_c, w) pairs."""
         psychrolib.SetUnitSystem(psychrolib.SI)
-        from app.models.weather_analysis import HourlyPsychroState
         states = []
         for tdb_c, w in data:
             h = psychrolib.GetMoistAirEnthalpy(tdb_c, w)
@@ -200,7 +266,6 @@ class TestClusterWeatherData:
 
     def test_two_blobs_separated(self):
         """Two well-separated groups should land in different clusters."""
-        import numpy as np
         rng = np.random.RandomState(42)
         # Group A: cold/dry (around 0°C, W=0.002)
         group_a = [(rng.normal(0, 1), rng.normal(0.002, 0.0005))
@@ -223,7 +288,7 @@ class TestClusterWeatherData:
     def test_hour_counts_sum(self):
         """Hour counts across all clusters should sum to total states."""
         raw = parse_epw_raw(SAMPLE_EPW)
-        states = compute_hourly_states(raw["records"])
+        states = compute_hourly_states(raw["hourly"])
 
         result = cluster_weather_data(states, n_clusters=2)
         total = sum(ci["hour_count"] for ci in result["cluster_infos"])
@@ -232,7 +297,7 @@ class TestClusterWeatherData:
     def test_worst_case_is_max_enthalpy_per_cluster(self):
         """Worst-case point should have the highest enthalpy in its cluster."""
         raw = parse_epw_raw(SAMPLE_EPW)
-        states = compute_hourly_states(raw["records"])
+        states = compute_hourly_states(raw["hourly"])
 
         result = cluster_weather_data(states, n_clusters=2)
 
@@ -245,10 +310,33 @@ class TestClusterWeatherData:
             max_h = max(s.enthalpy_j_per_kg for s in cluster_states)
             assert ci["worst_case_state"].enthalpy_j_per_kg == _approx(max_h, rel=0.001)
 
+    def test_worst_case_tie_keeps_earliest_hour(self):
+        """Equal-enthalpy hours resolve to the first one, as max() would."""
+        states = self._make_states(
+            [(0.0, 0.002), (1.0, 0.002), (35.0, 0.020), (35.0, 0.020), (34.0, 0.019)]
+        )
+
+        result = cluster_weather_data(states, n_clusters=2)
+
+        worst = [ci["worst_case_state"] for ci in result["cluster_infos"]]
+        assert any(w is states[2] for w in worst)
+        assert not any(w is states[3] for w in worst)
+
+    def test_identical_hours_leave_empty_cluster(self):
+        """More clusters than distinct points: extras are empty, not an error."""
+        states = self._make_states([(20.0, 0.010)] * 4)
+
+        result = cluster_weather_data(states, n_clusters=2)
+
+        counts = sorted(ci["hour_count"] for ci in result["cluster_infos"])
+        assert counts == [0, 4]
+        for ci in result["cluster_infos"]:
+            assert ci["worst_case_state"].dry_bulb_c == _approx(20.0)
+
     def test_cluster_infos_have_labels(self):
         """Each cluster should have a descriptive label."""
         raw = parse_epw_raw(SAMPLE_EPW)
-        states = compute_hourly_states(raw["records"])
+        states = compute_hourly_states(raw["hourly"])
 
         result = cluster_weather_data(states, n_clusters=2)
 
@@ -256,10 +344,20 @@ class TestClusterWeatherData:
             assert isinstance(ci["label"], str)
             assert len(ci["label"]) > 0
 
+    @pytest.mark.slow
+    def test_scipy_cluster_not_imported_at_startup(self):
+        """Importing the app must not pull in scipy.cluster; it loads lazily."""
+        code = "import sys, app.main; print('scipy.cluster' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True, cwd=BACKEND_DIR,
+        )
+        assert out.stdout.strip() == "False"
+
     def test_n_clusters_respected(self):
         """Should produce the requested number of clusters."""
         raw = parse_epw_raw(SAMPLE_EPW)
-        states = compute_hourly_states(raw["records"])
+        states = compute_hourly_states(raw["hourly"])
 
         for k in [2, 3]:
             result = cluster_weather_data(states, n_clusters=k)
@@ -283,35 +381,57 @@ class TestLabelCluster:
     def test_cool_moderate(self):
         assert label_cluster(10.0, 0.45) == "Cool Moderate"
 
+    def test_bin_edges_are_inclusive(self):
+        # 90 °F = 32.2 °C, 75 °F = 23.8 °C
+        assert label_cluster(32.0 + 2.0 / 9.0, 0.65) == "Hot Humid"
+        assert label_cluster(23.0 + 8.0 / 9.0, 0.35) == "Warm Moderate"
+
+    def test_returns_plain_str(self):
+        assert type(label_cluster(35.0, 0.80)) is str
+
 
 # --- design_extractor tests ---
 
-class TestExtractDesignConditions:
-    def test_full_pipeline_ip(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="IP")
+class TestExtractPeaks:
+    def test_picks_each_extreme(self):
+        tdb = np.array([30.0, -10.0, 20.0, 35.0])
+        w = np.array([0.012, 0.001, 0.016, 0.014])
+        h = np.array([61e3, -8e3, 61e3, 71e3])
+        # Dehum only considers Tdb < 0.85 * 35 = 29.75, so hour 0 is excluded
+        assert _extract_peaks(tdb, w, h) == (3, 1, 2)
 
-        # Should have 3 extremes + 2 cluster worst-case = 5 design points
-        assert len(result.design_points) == 5
-        assert result.total_hours == 10
+    def test_ties_resolve_to_earliest_hour(self):
+        tdb = np.array([0.0, 30.0, 0.0, 30.0])
+        w = np.array([0.005, 0.010, 0.005, 0.010])
+        h = np.array([10e3, 55e3, 10e3, 55e3])
+        assert _extract_peaks(tdb, w, h) == (1, 0, 0)
 
-    def test_full_pipeline_si(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="SI")
+    def test_dehum_falls_back_to_max_w(self):
+        # Constant Tdb: no hour is below 85% of the peak cooling Tdb
+        tdb = np.array([10.0, 10.0])
+        w = np.array([0.004, 0.006])
+        h = np.array([20e3, 25e3])
+        assert _extract_peaks(tdb, w, h) == (1, 0, 1)
 
-        assert len(result.design_points) == 5
-        assert result.unit_system == "SI"
 
-    def test_location_populated(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2)
+class TestExtractDesignConditions:
+    def test_full_pipeline_ip(self, analysis_ip):
+        # Should have 3 extremes + 2 cluster worst-case = 5 design points
+        assert len(analysis_ip.design_points) == 5
+        assert analysis_ip.total_hours == 10
 
-        assert result.location.city == "Sample City"
-        assert result.location.state == "ST"
-        assert result.location.country == "USA"
-        assert result.location.latitude == _approx(35.0)
+    def test_full_pipeline_si(self, analysis_si):
+        assert len(analysis_si.design_points) == 5
+        assert analysis_si.unit_system == "SI"
 
-    def test_extreme_points_types(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2)
+    def test_location_populated(self, analysis_ip):
+        assert analysis_ip.location.city == "Sample City"
+        assert analysis_ip.location.state == "ST"
+        assert analysis_ip.location.country == "USA"
+        assert analysis_ip.location.latitude == _approx(35.0)
 
-        extremes = [dp for dp in result.design_points if dp.point_type == "extreme"]
+    def test_extreme_points_types(self, analysis_ip):
+        extremes = [dp for dp in analysis_ip.design_points if dp.point_type == "extreme"]
         assert len(extremes) == 3
 
         labels = {dp.label for dp in extremes}
@@ -319,36 +439,30 @@ class TestExtractDesignConditions:
         assert "Peak Heating" in labels
         assert "Peak Dehumidification" in labels
 
-    def test_peak_cooling_has_max_enthalpy(self):
+    def test_peak_cooling_has_max_enthalpy(self, analysis_ip):
         """Peak cooling should be the hour with highest enthalpy."""
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="IP")
-
         peak_cooling = next(
-            dp for dp in result.design_points if dp.label == "Peak Cooling"
+            dp for dp in analysis_ip.design_points if dp.label == "Peak Cooling"
         )
         other_enthalpies = [
-            dp.enthalpy for dp in result.design_points if dp.label != "Peak Cooling"
+            dp.enthalpy for dp in analysis_ip.design_points if dp.label != "Peak Cooling"
         ]
         assert all(peak_cooling.enthalpy >= h for h in other_enthalpies)
 
-    def test_peak_heating_has_min_drybulb(self):
+    def test_peak_heating_has_min_drybulb(self, analysis_ip):
         """Peak heating should be the hour with lowest dry-bulb."""
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="IP")
-
         peak_heating = next(
-            dp for dp in result.design_points if dp.label == "Peak Heating"
+            dp for dp in analysis_ip.design_points if dp.label == "Peak Heating"
         )
         other_dbs = [
-            dp.dry_bulb for dp in result.design_points if dp.label != "Peak Heating"
+            dp.dry_bulb for dp in analysis_ip.design_points if dp.label != "Peak Heating"
         ]
         assert all(peak_heating.dry_bulb <= db for db in other_dbs)
 
-    def test_cluster_worst_case_points(self):
+    def test_cluster_worst_case_points(self, analysis_ip):
         """Cluster worst-case points should have cluster metadata."""
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2)
-
         cluster_points = [
-            dp for dp in result.design_points
+            dp for dp in analysis_ip.design_points
             if dp.point_type == "cluster_worst_case"
         ]
         assert len(cluster_points) == 2
@@ -358,43 +472,35 @@ class TestExtractDesignConditions:
             assert dp.hours_in_cluster is not None
             assert dp.hours_in_cluster > 0
 
-    def test_cluster_summary(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2)
-
-        assert len(result.cluster_summary) == 2
-        total_hours = sum(cs.hour_count for cs in result.cluster_summary)
+    def test_cluster_summary(self, analysis_ip):
+        assert len(analysis_ip.cluster_summary) == 2
+        total_hours = sum(cs.hour_count for cs in analysis_ip.cluster_summary)
         assert total_hours == 10
 
-        for cs in result.cluster_summary:
+        for cs in analysis_ip.cluster_summary:
             assert isinstance(cs.label, str)
             assert cs.fraction_of_year > 0
             assert cs.fraction_of_year <= 1.0
 
-    def test_chart_data(self):
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2)
-
-        assert len(result.chart_data) == 10
-        for pt in result.chart_data:
+    def test_chart_data(self, analysis_ip):
+        assert len(analysis_ip.chart_data) == 10
+        for pt in analysis_ip.chart_data:
             assert pt.cluster_id in [0, 1]
             assert isinstance(pt.dry_bulb, float)
             assert isinstance(pt.humidity_ratio, float)
 
-    def test_ip_units_conversion(self):
+    def test_ip_units_conversion(self, analysis_ip):
         """In IP mode, temperatures should be in °F range."""
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="IP")
-
         peak_cooling = next(
-            dp for dp in result.design_points if dp.label == "Peak Cooling"
+            dp for dp in analysis_ip.design_points if dp.label == "Peak Cooling"
         )
         # 34°C = 93.2°F
         assert peak_cooling.dry_bulb > 80  # should be in °F
 
-    def test_si_units(self):
+    def test_si_units(self, analysis_si):
         """In SI mode, temperatures should stay in °C range."""
-        result = extract_design_conditions(SAMPLE_EPW, n_clusters=2, unit_system="SI")
-
         peak_cooling = next(
-            dp for dp in result.design_points if dp.label == "Peak Cooling"
+            dp for dp in analysis_si.design_points if dp.label == "Peak Cooling"
         )
         # 34°C should stay as °C
         assert peak_cooling.dry_bulb < 50  # should be in °C
@@ -412,3 +518,42 @@ class TestExtractDesignConditions:
             ]
             assert len(cluster_points) == k
             assert len(result.cluster_summary) == k
+
+    def test_cluster_sweep_prepares_once(self, monkeypatch, empty_prepared_cache):
+        parses = []
+        monkeypatch.setattr(
+            design_extractor, "parse_epw_raw",
+            lambda text: parses.append(text) or parse_epw_raw(text),
+        )
+        for k in [2, 3]:
+            for units in ["IP", "SI"]:
+                extract_design_conditions(SAMPLE_EPW, n_clusters=k, unit_system=units)
+        assert len(parses) == 1
+
+    def test_extract_from_states_matches_file_entry(self, analysis_ip):
+        raw = parse_epw_raw(SAMPLE_EPW)
+        states = compute_hourly_states(raw["hourly"])
+
+        result = extract_from_states(
+            states, analysis_ip.location, n_clusters=2, unit_system="IP"
+        )
+        assert result == analysis_ip
+
+    def test_extract_from_states_rejects_empty(self, analysis_ip):
+        with pytest.raises(ValueError, match="No valid psychrometric states"):
+            extract_from_states([], analysis_ip.location, n_clusters=2)
+
+    def test_cached_states_are_immutable(self, analysis_ip):
+        states = compute_hourly_states(parse_epw_raw(SAMPLE_EPW)["hourly"])
+        with pytest.raises(ValidationError):
+            states[0].dry_bulb_c = 0.0
+        with pytest.raises(ValidationError):
+            analysis_ip.location.city = "Elsewhere"
+
+    def test_precomputed_features_match(self):
+        states = compute_hourly_states(parse_epw_raw(SAMPLE_EPW)["hourly"])
+        direct = cluster_weather_data(states, n_clusters=2)
+        reused = cluster_weather_data(
+            states, n_clusters=2, features=scale_features(states)
+        )
+        assert reused["labels"] == direct["labels"]
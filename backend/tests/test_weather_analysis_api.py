@@ -2,9 +2,14 @@
 API-level tests for weather analysis endpoint (POST /api/v1/weather/analyze).
 """
 
+import asyncio
+from collections import OrderedDict
+
+import psychrolib
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import weather_analysis as weather_api
 from app.main import app
 
 client = TestClient(app)
@@ -31,6 +36,14 @@ DATA PERIODS,1,1,Data,Sunday,1/1,12/31
 """
 
 
+@pytest.fixture
+def psychrolib_ip(monkeypatch):
+    """Set psychrolib to IP for one test; the previous unit system is restored on teardown."""
+    monkeypatch.setattr(psychrolib, "PSYCHROLIB_UNITS", psychrolib.GetUnitSystem())
+    monkeypatch.setattr(psychrolib, "PSYCHROLIB_TOLERANCE", psychrolib.PSYCHROLIB_TOLERANCE)
+    psychrolib.SetUnitSystem(psychrolib.IP)
+
+
 class TestWeatherAnalyzeEndpoint:
     def test_upload_success(self):
         resp = client.post(
@@ -116,6 +129,23 @@ class TestWeatherAnalyzeEndpoint:
             assert "humidity_ratio" in pt
             assert "cluster_id" in pt
 
+    def test_chart_data_columnar(self):
+        aos = client.post(
+            "/api/v1/weather/analyze?n_clusters=2",
+            files={"file": ("test.epw", SAMPLE_EPW.encode(), "application/octet-stream")},
+        ).json()
+        resp = client.post(
+            "/api/v1/weather/analyze?n_clusters=2&format=soa",
+            files={"file": ("test.epw", SAMPLE_EPW.encode(), "application/octet-stream")},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+
+        assert data["chart_data"] == []
+        columns = data["chart_arrays"]
+        assert [dict(zip(columns, row)) for row in zip(*columns.values())] == aos["chart_data"]
+        assert data["design_points"] == aos["design_points"]
+
     def test_location_populated(self):
         resp = client.post(
             "/api/v1/weather/analyze?n_clusters=2",
@@ -143,6 +173,50 @@ class TestWeatherAnalyzeEndpoint:
         assert len(cluster_points) == 3
         assert len(data["cluster_summary"]) == 3
 
+    def test_repeat_upload_is_cached(self, monkeypatch):
+        """Identical content and options are analyzed once, then served from cache."""
+        calls = []
+        real = weather_api.extract_design_conditions
+
+        def counting(**kwargs):
+            calls.append(kwargs["n_clusters"])
+            return real(**kwargs)
+
+        monkeypatch.setattr(weather_api, "extract_design_conditions", counting)
+        monkeypatch.setattr(weather_api, "_analysis_cache", OrderedDict())
+        args = dict(
+            url="/api/v1/weather/analyze?unit_system=SI&n_clusters=4",
+            files={"file": ("test.epw", SAMPLE_EPW.encode(), "application/octet-stream")},
+        )
+        first = client.post(**args)
+        second = client.post(**args)
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert calls == [4]
+
+    def test_analysis_runs_off_event_loop(self, monkeypatch, psychrolib_ip):
+        """The analysis runs in the threadpool and leaves psychrolib's unit system alone."""
+        in_event_loop = []
+        real = weather_api.extract_design_conditions
+
+        def probe(**kwargs):
+            try:
+                asyncio.get_running_loop()
+                in_event_loop.append(True)
+            except RuntimeError:
+                in_event_loop.append(False)
+            return real(**kwargs)
+
+        monkeypatch.setattr(weather_api, "extract_design_conditions", probe)
+        monkeypatch.setattr(weather_api, "_analysis_cache", OrderedDict())
+        resp = client.post(
+            "/api/v1/weather/analyze?unit_system=SI&n_clusters=2",
+            files={"file": ("test.epw", SAMPLE_EPW.encode(), "application/octet-stream")},
+        )
+        assert resp.status_code == 200
+        assert in_event_loop == [False]
+        assert psychrolib.isIP()
+
     def test_si_unit_system(self):
         resp = client.post(
             "/api/v1/weather/analyze?unit_system=SI&n_clusters=2",